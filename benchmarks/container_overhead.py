@@ -0,0 +1,70 @@
+"""
+Per-request overhead of resolving a use case from the DI container.
+
+Compares the old pattern, where every view instance built a fresh
+``Container()`` (and with it new OpenAI clients and connection pools), with
+the application-wide container resolved once per process.
+
+No network calls are made: building an OpenAI client does not connect, so the
+numbers measure provider resolution and client construction only. Reusing the
+client also keeps its HTTP connections warm, which this benchmark cannot show.
+
+    python benchmarks/container_overhead.py --iterations 200
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+import django  # noqa: E402
+
+django.setup()
+
+from chatapp.container import Container, container  # noqa: E402
+
+USE_CASES = [
+    "process_message_use_case",
+    "process_message_audio_use_case",
+    "create_conversation_use_case",
+    "create_conversation_summary_use_case",
+]
+
+
+def per_request_container(name: str):
+    return getattr(Container(), name)()
+
+
+def shared_container(name: str):
+    return getattr(container, name)()
+
+
+def measure(resolve, iterations: int) -> float:
+    started = time.perf_counter()
+    for i in range(iterations):
+        resolve(USE_CASES[i % len(USE_CASES)])
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    for name in USE_CASES:
+        shared_container(name)
+
+    before = measure(per_request_container, args.iterations)
+    after = measure(shared_container, args.iterations)
+
+    print("mode | per_request_us")
+    print(f"Container() per request | {before * 1_000_000:.1f}")
+    print(f"shared container | {after * 1_000_000:.1f}")
+    print(f"speedup | {before / after:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
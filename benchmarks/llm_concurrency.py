@@ -0,0 +1,221 @@
+"""
+Concurrency benchmark for the conversation API under WSGI and ASGI.
+
+It ships two subcommands:
+
+* ``mock-llm`` starts a local OpenAI-compatible server whose chat completions,
+  embeddings and transcriptions answer after a fixed latency, so the API spends
+  its time waiting on the "LLM" exactly like it does in production.
+* ``load`` opens N conversations against each target and fires concurrent
+  messages at them, reporting throughput and latency percentiles per target.
+
+Example (see README, "Async request path"):
+
+    python benchmarks/llm_concurrency.py mock-llm --port 9000 --latency 2
+    OPENAI_BASE_URL=http://localhost:9000/v1 gunicorn config.wsgi -w 1 --threads 8 -b :8000
+    ASYNC_VIEWS=true OPENAI_BASE_URL=http://localhost:9000/v1 uvicorn config.asgi:application --port 8001
+    python benchmarks/llm_concurrency.py load --target wsgi=http://localhost:8000 --target asgi=http://localhost:8001
+"""
+import argparse
+import json
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+EMBEDDING_DIMENSIONS = 1536
+MOCK_REPLY = "Thanks for reaching out! Your order is on its way."
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        time.sleep(self.server.latency)
+
+        if self.path.endswith("/embeddings"):
+            payload = {
+                "object": "list",
+                "model": "text-embedding-3-small",
+                "data": [{"object": "embedding", "index": 0, "embedding": [0.0] * EMBEDDING_DIMENSIONS}],
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            }
+            return self._send_json(payload)
+
+        if self.path.endswith("/audio/transcriptions"):
+            return self._send(b"Where is my order?", "text/plain")
+
+        request = json.loads(body or b"{}")
+        if request.get("stream"):
+            return self._send_stream()
+
+        payload = {
+            "id": "chatcmpl-mock",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "gpt-4o"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": MOCK_REPLY},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }
+        self._send_json(payload)
+
+    def _send_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for token in MOCK_REPLY.split(" "):
+            chunk = {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "delta": {"content": token + " "}, "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+    def _send_json(self, payload: dict):
+        self._send(json.dumps(payload).encode(), "application/json")
+
+    def _send(self, body: bytes, content_type: str):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_mock_llm(args):
+    server = ThreadingHTTPServer(("0.0.0.0", args.port), MockLLMHandler)
+    server.daemon_threads = True
+    server.latency = args.latency
+    print(f"Mock LLM listening on http://localhost:{args.port}/v1 (latency {args.latency}s)")
+    server.serve_forever()
+
+
+@dataclass
+class LoadResult:
+    name: str
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    elapsed: float = 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    def summary(self) -> dict:
+        return {
+            "target": self.name,
+            "requests": len(self.latencies) + self.errors,
+            "errors": self.errors,
+            "elapsed_s": round(self.elapsed, 2),
+            "throughput_rps": round(len(self.latencies) / self.elapsed, 2) if self.elapsed else 0.0,
+            "p50_s": round(statistics.median(self.latencies), 3) if self.latencies else 0.0,
+            "p95_s": round(self.percentile(0.95), 3),
+            "p99_s": round(self.percentile(0.99), 3),
+        }
+
+
+def _post_json(url: str, payload: dict, timeout: float) -> dict:
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read() or b"{}")
+
+
+def _timed_message(base_url: str, conversation_id: str, timeout: float) -> Tuple[bool, float]:
+    started = time.perf_counter()
+    try:
+        _post_json(
+            f"{base_url}/api/v1/conversations/{conversation_id}/message",
+            {"content": "Where is my order?", "language": "en"},
+            timeout,
+        )
+        return True, time.perf_counter() - started
+    except Exception:
+        return False, time.perf_counter() - started
+
+
+def run_target(name: str, base_url: str, args) -> LoadResult:
+    base_url = base_url.rstrip("/")
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        conversations = list(pool.map(
+            lambda _: _post_json(f"{base_url}/api/v1/conversations/start", {"language": "en"}, args.timeout)["id"],
+            range(args.concurrency),
+        ))
+
+        result = LoadResult(name=name)
+        started = time.perf_counter()
+        futures = [
+            pool.submit(_timed_message, base_url, conversations[i % len(conversations)], args.timeout)
+            for i in range(args.requests)
+        ]
+        for future in futures:
+            ok, latency = future.result()
+            if ok:
+                result.latencies.append(latency)
+            else:
+                result.errors += 1
+        result.elapsed = time.perf_counter() - started
+
+    return result
+
+
+def run_load(args):
+    results = []
+    for target in args.target:
+        name, _, url = target.partition("=")
+        if not url:
+            name = url = target
+        print(f"Running {args.requests} requests at concurrency {args.concurrency} against {name} ({url})...")
+        results.append(run_target(name, url, args).summary())
+
+    columns = ["target", "requests", "errors", "elapsed_s", "throughput_rps", "p50_s", "p95_s", "p99_s"]
+    print("\n" + " | ".join(columns))
+    for summary in results:
+        print(" | ".join(str(summary[column]) for column in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    mock = subparsers.add_parser("mock-llm", help="Start a mock OpenAI-compatible server")
+    mock.add_argument("--port", type=int, default=9000)
+    mock.add_argument("--latency", type=float, default=2.0, help="Seconds each LLM call takes")
+    mock.set_defaults(func=run_mock_llm)
+
+    load = subparsers.add_parser("load", help="Fire concurrent messages at one or more API deployments")
+    load.add_argument("--target", action="append", required=True, help="name=base_url, e.g. asgi=http://localhost:8001")
+    load.add_argument("--concurrency", type=int, default=100)
+    load.add_argument("--requests", type=int, default=500)
+    load.add_argument("--timeout", type=float, default=120.0)
+    load.set_defaults(func=run_load)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
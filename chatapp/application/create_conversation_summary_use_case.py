@@ -1,14 +1,19 @@
+import contextvars
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from chatapp.domain.exceptions.internal_error import InternalError
 from chatapp.domain.models.create_conversation_input import CreateConversationInput
 from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.conversation_extraction import CONVERSATION_EXTRACTION_SCHEMA, ConversationExtraction, parse_conversation_extraction
 from chatapp.infrastructure.services.llm_data_service import LLMDataService
 from chatapp.domain.repositories.conversation_repository import ConversationRepository
 from chatapp.domain.repositories.user_repository import UserRepository
 from chatapp.domain.entities.conversation import ConversationEntity, ConversationStatus
 from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.services.model_router import LLMTask, ModelRouter, route_conversation
 
 logger = logging.getLogger(__name__)
 
@@ -61,17 +66,17 @@ You are DataExtractBot, an internal AI system whose job is to parse the final us
 Your goals:
 1. Read the conversation carefully.
 2. Identify the key pieces of data relevant to internal records and future analysis.
-3. Return a **single valid JSON object** with these fields (if data is not available, return `null` or an empty string):
+3. Return a **single valid JSON object** with these fields (if data is not available, return `null`):
 
 {
-  "user_id": "",
-  "user_name": "",
-  "order_id": "",
-  "product_name": "",
-  "issue": "",
-  "resolution": "",
-  "sentiment": "",
-  "language_detected": "",
+  "user_id": null,
+  "user_name": null,
+  "order_id": null,
+  "product_name": null,
+  "issue": null,
+  "resolution": null,
+  "sentiment": null,
+  "language_detected": null,
   "agent_actions": []
 }
 
@@ -89,21 +94,29 @@ Definitions / Requirements:
 Guidelines:
 - Provide only valid JSON as the final output. No additional text or commentary.
 - Do not include personal or sensitive data such as full shipping addresses, payment info, emails, or phone numbers.
-- If any field is not mentioned in the conversation, set it to `null` or an empty string.
+- If any field is not mentioned in the conversation, set it to `null`.
 - Keep the JSON structure minimal and consistent.
 
 You will receive the conversation transcript after this prompt. Parse it carefully and generate the JSON accordingly.
 """
 
+SYSTEM_PROMPT_EXTRACTION_REPAIR = """
+You are DataExtractBot. Your previous reply should have been a single JSON object following the required schema, but it could not be parsed.
+
+The user message contains the parsing error and your previous reply. Return the same data as one corrected JSON object: fix the syntax, drop any text around the object, use `null` for missing values and a list of strings for `agent_actions`. Do not add, remove or invent information.
+"""
+
 class CreateConversationSummaryUseCase:
 
     def __init__(
         self,
         conversation_repository: ConversationRepository,
-        llm_service: LLMDataService
+        llm_service: LLMDataService,
+        model_router: Optional[ModelRouter] = None
     ):
         self._conversation_repository = conversation_repository
         self._llm_service = llm_service
+        self._model_router = model_router
 
     def execute(self, conversation_id: str, conversation_status: ConversationStatus) -> ConversationEntity:
         try:
@@ -115,19 +128,24 @@ class CreateConversationSummaryUseCase:
                     details={"conversation_id": conversation_id}
                 )
 
-            system_prompt_summary = MessageEntity(role=MessageRole.SYSTEM, content=SYSTEM_PROMPT_SUMMARY)
-            conversation.update_system_prompt(system_prompt_summary)
-            assistant_message_summary = self._llm_service.generate_response(conversation)
-            conversation.update_summary(assistant_message_summary.content)
+            # Both completions only read the transcript, so they run side by side,
+            # each on its own copy of the conversation. The caller's context (e.g. its
+            # rate-limit priority) is carried into the worker threads.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                summary_future = executor.submit(contextvars.copy_context().run, self._generate, conversation, SYSTEM_PROMPT_SUMMARY, LLMTask.SUMMARY)
+                extraction_future = executor.submit(contextvars.copy_context().run, self._extract, conversation)
+
+                assistant_message_summary = summary_future.result()
+                conversation.update_summary(assistant_message_summary.content)
+
+                try:
+                    conversation.update_extracted_data(extraction_future.result())
+                except Exception:
+                    logger.exception("Failed to extract the conversation data, keeping the summary")
 
-            system_prompt_extraction = MessageEntity(role=MessageRole.SYSTEM, content=SYSTEM_PROMPT_DATE_EXTRACTION)
-            conversation.update_system_prompt(system_prompt_extraction)
-            assistant_message_extraction = self._llm_service.generate_response(conversation)
-            conversation.update_extracted_data(assistant_message_extraction.content)
-            
             conversation.update_status(conversation_status)
         
-            updated_conversation = self._conversation_repository.update(conversation)
+            updated_conversation = self._conversation_repository.update_summary(conversation)
             return updated_conversation
         except NotFoundError:
             raise
@@ -137,3 +155,31 @@ class CreateConversationSummaryUseCase:
                 message="Failed to end the conversation",
                 details={"original_error": str(e)}
             )
+
+    def _generate(self, conversation: ConversationEntity, system_prompt: str, task: LLMTask) -> MessageEntity:
+        task_conversation = conversation.with_system_prompt(MessageEntity(role=MessageRole.SYSTEM, content=system_prompt))
+        return self._llm_service.generate_response(route_conversation(self._model_router, task_conversation, task))
+
+    def _extract(self, conversation: ConversationEntity) -> ConversationExtraction:
+        extraction_conversation = conversation.with_system_prompt(
+            MessageEntity(role=MessageRole.SYSTEM, content=SYSTEM_PROMPT_DATE_EXTRACTION)
+        )
+        response = self._generate_structured(extraction_conversation)
+        try:
+            return parse_conversation_extraction(response.content)
+        except ValidationError as e:
+            # One repair attempt over the bad reply alone, without resending the transcript.
+            logger.warning(f"Extracted data is invalid, asking for a repair: {e.message}")
+            repair_conversation = conversation.with_system_prompt(
+                MessageEntity(role=MessageRole.SYSTEM, content=SYSTEM_PROMPT_EXTRACTION_REPAIR)
+            )
+            repair_conversation.messages = [
+                MessageEntity(role=MessageRole.USER, content=f"Error: {e.message}\n\nPrevious reply:\n{response.content}")
+            ]
+            return parse_conversation_extraction(self._generate_structured(repair_conversation).content)
+
+    def _generate_structured(self, conversation: ConversationEntity) -> MessageEntity:
+        return self._llm_service.generate_structured_response(
+            route_conversation(self._model_router, conversation, LLMTask.EXTRACTION),
+            CONVERSATION_EXTRACTION_SCHEMA
+        )
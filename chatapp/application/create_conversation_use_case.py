@@ -1,6 +1,8 @@
 import logging
 from typing import Optional
 
+from chatapp.domain.services.greeting_service import GreetingService
+from chatapp.domain.services.model_router import LLMTask, ModelRouter, route_conversation
 from chatapp.domain.services.rag_retrieve_service import RAGRetrieveService
 from chatapp.domain.entities.user import UserEntity
 from chatapp.domain.exceptions.internal_error import InternalError
@@ -129,24 +131,24 @@ class CreateConversationUseCase:
         conversation_repository: ConversationRepository,
         user_repository: UserRepository,
         llm_service: LLMDataService,
+        greeting_service: Optional[GreetingService] = None,
+        model_router: Optional[ModelRouter] = None,
     ):
         self._conversation_repository = conversation_repository
         self._user_repository = user_repository
         self._llm_service = llm_service
+        self._greeting_service = greeting_service
+        self._model_router = model_router
+        if greeting_service is not None:
+            greeting_service.prefetch(SYSTEM_PROMPT)
 
     def execute(self, new_conversation: CreateConversationInput) -> ConversationEntity:
         try:
             user = self._get_user_or_create(new_conversation.user_id)
 
-            conversation = ConversationEntity(user=user)
-            conversation.update_language(new_conversation.language)
+            conversation = self._new_conversation(user, new_conversation.language)
 
-            system_prompt = MessageEntity(role=MessageRole.SYSTEM, content=SYSTEM_PROMPT)
-
-            conversation.update_system_prompt(system_prompt)
-            conversation.add_message(system_prompt)
-
-            assistant_message = self._llm_service.generate_response(conversation)
+            assistant_message = self._pooled_greeting(conversation) or self._llm_service.generate_response(route_conversation(self._model_router, conversation, LLMTask.GREETING))
             
             conversation.add_message(assistant_message)
             
@@ -159,15 +161,65 @@ class CreateConversationUseCase:
                 details={"original_error": str(e)}
             )
 
+    async def aexecute(self, new_conversation: CreateConversationInput) -> ConversationEntity:
+        try:
+            user = await self._aget_user_or_create(new_conversation.user_id)
+
+            conversation = self._new_conversation(user, new_conversation.language)
+
+            assistant_message = self._pooled_greeting(conversation) or await self._llm_service.agenerate_response(route_conversation(self._model_router, conversation, LLMTask.GREETING))
+
+            conversation.add_message(assistant_message)
+
+            return await self._conversation_repository.acreate(conversation)
+        except NotFoundError:
+            raise
+        except Exception as e:
+            raise InternalError(
+                message="Error creating the conversation",
+                details={"original_error": str(e)}
+            )
+
+    def _new_conversation(self, user: UserEntity, language: str) -> ConversationEntity:
+        conversation = ConversationEntity(user=user)
+        conversation.update_language(language)
+
+        system_prompt = MessageEntity(role=MessageRole.SYSTEM, content=SYSTEM_PROMPT)
+
+        conversation.update_system_prompt(system_prompt)
+        conversation.add_message(system_prompt)
+
+        return conversation
+
+    def _pooled_greeting(self, conversation: ConversationEntity) -> Optional[MessageEntity]:
+        if self._greeting_service is None:
+            return None
+
+        greeting = self._greeting_service.get_greeting(SYSTEM_PROMPT, conversation.language)
+        return MessageEntity(role=MessageRole.ASSISTANT, content=greeting) if greeting else None
+
     def _get_user_or_create(self, user_id: Optional[str]) -> UserEntity:
         if not user_id:
             return self._user_repository.create_anonymous()
             
         user = self._user_repository.get_by_id(user_id)
         if not user:
-            raise NotFoundError(
-                message="User not found",
-                code="USER_NOT_FOUND",
-                details={"user_id": str(user_id), "action": "create_conversation"}
-            )
+            raise self._user_not_found(user_id)
         return user
+
+    async def _aget_user_or_create(self, user_id: Optional[str]) -> UserEntity:
+        if not user_id:
+            return await self._user_repository.acreate_anonymous()
+
+        user = await self._user_repository.aget_by_id(user_id)
+        if not user:
+            raise self._user_not_found(user_id)
+        return user
+
+    @staticmethod
+    def _user_not_found(user_id: str) -> NotFoundError:
+        return NotFoundError(
+            message="User not found",
+            code="USER_NOT_FOUND",
+            details={"user_id": str(user_id), "action": "create_conversation"}
+        )
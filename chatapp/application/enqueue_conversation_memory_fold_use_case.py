@@ -0,0 +1,47 @@
+import logging
+from typing import Optional
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.job import JobEntity, JobKind
+from chatapp.domain.repositories.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+class EnqueueConversationMemoryFoldUseCase:
+    """Queues a memory fold once a conversation's unsummarized history outgrows its budget.
+
+    Folding starts when the history sent verbatim exceeds ``recent_tokens`` by
+    ``fold_tokens``, so each fold summarizes a batch of turns rather than one
+    message at a time. At most one fold per conversation is pending.
+    """
+
+    def __init__(self, job_repository: JobRepository, recent_tokens: int, fold_tokens: int, max_attempts: int = 3):
+        self._job_repository = job_repository
+        self._recent_tokens = recent_tokens
+        self._fold_tokens = fold_tokens
+        self._max_attempts = max_attempts
+
+    def execute(self, conversation: ConversationEntity) -> Optional[JobEntity]:
+        if not self._needs_fold(conversation):
+            return None
+
+        payload = {"conversation_id": conversation.id}
+        if self._job_repository.has_pending(JobKind.CONVERSATION_MEMORY_FOLD, payload):
+            return None
+        return self._job_repository.enqueue(self._new_job(payload))
+
+    async def aexecute(self, conversation: ConversationEntity) -> Optional[JobEntity]:
+        if not self._needs_fold(conversation):
+            return None
+
+        payload = {"conversation_id": conversation.id}
+        if await self._job_repository.ahas_pending(JobKind.CONVERSATION_MEMORY_FOLD, payload):
+            return None
+        return await self._job_repository.aenqueue(self._new_job(payload))
+
+    def _needs_fold(self, conversation: ConversationEntity) -> bool:
+        return conversation.get_history_token_count() > self._recent_tokens + self._fold_tokens
+
+    def _new_job(self, payload: dict) -> JobEntity:
+        logger.info(f"Queueing memory fold for conversation {payload['conversation_id']}")
+        return JobEntity(kind=JobKind.CONVERSATION_MEMORY_FOLD, payload=payload, max_attempts=self._max_attempts)
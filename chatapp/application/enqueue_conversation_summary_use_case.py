@@ -0,0 +1,40 @@
+import logging
+
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.entities.job import JobEntity, JobKind
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.repositories.conversation_repository import ConversationRepository
+from chatapp.domain.repositories.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+class EnqueueConversationSummaryUseCase:
+
+    def __init__(self, conversation_repository: ConversationRepository, job_repository: JobRepository, max_attempts: int = 3):
+        self._conversation_repository = conversation_repository
+        self._job_repository = job_repository
+        self._max_attempts = max_attempts
+
+    def execute(self, conversation_id: str, conversation_status: ConversationStatus) -> JobEntity:
+        try:
+            if not self._conversation_repository.exists(conversation_id):
+                raise NotFoundError(
+                    message="Conversation not found",
+                    code="CONVERSATION_NOT_FOUND",
+                    details={"conversation_id": conversation_id}
+                )
+
+            return self._job_repository.enqueue(JobEntity(
+                kind=JobKind.CONVERSATION_SUMMARY,
+                payload={"conversation_id": conversation_id, "conversation_status": conversation_status.value},
+                max_attempts=self._max_attempts
+            ))
+        except NotFoundError:
+            raise
+        except Exception as e:
+            logger.exception("Failed to queue the conversation summary")
+            raise InternalError(
+                message="Failed to queue the conversation summary",
+                details={"original_error": str(e)}
+            )
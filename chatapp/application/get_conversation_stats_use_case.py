@@ -0,0 +1,35 @@
+import logging
+from typing import List
+
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.service_unavailable_error import ServiceUnavailableError
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.conversation_report import ConversationDailyStats
+from chatapp.domain.models.conversation_report_query import ConversationStatsQuery
+from chatapp.domain.repositories.conversation_report_repository import ConversationReportRepository
+
+logger = logging.getLogger(__name__)
+
+class GetConversationStatsUseCase:
+
+    def __init__(self, conversation_report_repository: ConversationReportRepository):
+        self._conversation_report_repository = conversation_report_repository
+
+    def execute(self, query: ConversationStatsQuery) -> List[ConversationDailyStats]:
+        try:
+            if query.date_from and query.date_to and query.date_from > query.date_to:
+                raise ValidationError(
+                    message="date_from must be before date_to",
+                    code="INVALID_DATE_RANGE",
+                    details={"date_from": query.date_from.isoformat(), "date_to": query.date_to.isoformat()}
+                )
+
+            return self._conversation_report_repository.get_daily_stats(query)
+        except (ValidationError, ServiceUnavailableError):
+            raise
+        except Exception as e:
+            logger.exception("Error reading the conversation statistics")
+            raise InternalError(
+                message="Error reading the conversation statistics",
+                details={"original_error": str(e)}
+            )
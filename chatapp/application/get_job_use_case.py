@@ -0,0 +1,18 @@
+from chatapp.domain.entities.job import JobEntity
+from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.repositories.job_repository import JobRepository
+
+class GetJobUseCase:
+
+    def __init__(self, job_repository: JobRepository):
+        self._job_repository = job_repository
+
+    def execute(self, job_id: str) -> JobEntity:
+        job = self._job_repository.get_by_id(job_id)
+        if not job:
+            raise NotFoundError(
+                message="Job not found",
+                code="JOB_NOT_FOUND",
+                details={"job_id": job_id}
+            )
+        return job
@@ -0,0 +1,40 @@
+import logging
+
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.list_messages_input import ListMessagesInput
+from chatapp.domain.models.message_page import MessagePage
+from chatapp.domain.repositories.conversation_repository import ConversationRepository
+from chatapp.domain.repositories.message_repository import MessageRepository
+
+logger = logging.getLogger(__name__)
+
+class ListConversationMessagesUseCase:
+
+    def __init__(self, conversation_repository: ConversationRepository, message_repository: MessageRepository):
+        self._conversation_repository = conversation_repository
+        self._message_repository = message_repository
+
+    def execute(self, list_input: ListMessagesInput) -> MessagePage:
+        try:
+            if not self._conversation_repository.exists(list_input.conversation_id):
+                raise NotFoundError(
+                    message="Conversation not found",
+                    code="CONVERSATION_NOT_FOUND",
+                    details={"conversation_id": list_input.conversation_id}
+                )
+
+            return self._message_repository.get_page_by_conversation_id(
+                list_input.conversation_id,
+                before=list_input.before,
+                limit=list_input.limit
+            )
+        except (NotFoundError, ValidationError):
+            raise
+        except Exception as e:
+            logger.exception("Error listing the conversation messages")
+            raise InternalError(
+                message="Error listing the conversation messages",
+                details={"original_error": str(e)}
+            )
@@ -0,0 +1,63 @@
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from chatapp.application.create_conversation_summary_use_case import CreateConversationSummaryUseCase
+from chatapp.application.fold_conversation_memory_use_case import FoldConversationMemoryUseCase
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.entities.job import JobEntity, JobKind
+from chatapp.domain.exceptions.domain_error import DomainError
+from chatapp.domain.repositories.job_repository import JobRepository
+
+logger = logging.getLogger(__name__)
+
+JobResult = Optional[Dict[str, Any]]
+
+class ProcessJobUseCase:
+    """Runs one claimed job and records its outcome; failures are requeued, never raised."""
+
+    def __init__(
+        self,
+        job_repository: JobRepository,
+        create_conversation_summary_use_case: CreateConversationSummaryUseCase,
+        fold_conversation_memory_use_case: Optional[FoldConversationMemoryUseCase] = None,
+        retry_backoff: int = 30
+    ):
+        self._job_repository = job_repository
+        self._create_conversation_summary_use_case = create_conversation_summary_use_case
+        self._fold_conversation_memory_use_case = fold_conversation_memory_use_case
+        self._retry_backoff = retry_backoff
+        self._handlers: Dict[JobKind, Callable[[Dict[str, Any]], JobResult]] = {
+            JobKind.CONVERSATION_SUMMARY: self._summarize_conversation,
+            JobKind.CONVERSATION_MEMORY_FOLD: self._fold_conversation_memory,
+        }
+
+    def execute(self, job: JobEntity) -> JobEntity:
+        try:
+            job.mark_succeeded(self._handlers[job.kind](job.payload))
+            logger.info(f"Job {job.id} ({job.kind.value}) succeeded after {job.attempts} attempt(s)")
+        except Exception as e:
+            # Client errors (missing conversation, invalid payload) will not fix themselves on retry.
+            retryable = not (isinstance(e, DomainError) and e.status and e.status < 500)
+            job.mark_failed(str(e), self._retry_backoff, retryable=retryable)
+            logger.warning(f"Job {job.id} ({job.kind.value}) failed on attempt {job.attempts}, now {job.status.value}: {e}")
+
+        return self._job_repository.update(job)
+
+    def _summarize_conversation(self, payload: Dict[str, Any]) -> JobResult:
+        conversation = self._create_conversation_summary_use_case.execute(
+            payload["conversation_id"],
+            ConversationStatus(payload["conversation_status"])
+        )
+        return {
+            "conversation_id": conversation.id,
+            "status": conversation.status.value,
+            "summary": conversation.summary,
+            "extracted_data": conversation.extracted_data
+        }
+
+    def _fold_conversation_memory(self, payload: Dict[str, Any]) -> JobResult:
+        if self._fold_conversation_memory_use_case is None:
+            raise RuntimeError("Memory folding is not configured")
+
+        folded = self._fold_conversation_memory_use_case.execute(payload["conversation_id"])
+        return {"conversation_id": payload["conversation_id"], "folded_messages": folded}
@@ -2,10 +2,14 @@ from dataclasses import dataclass
 import logging
 from typing import Optional
 
+from chatapp.application.enqueue_conversation_memory_fold_use_case import EnqueueConversationMemoryFoldUseCase
+from chatapp.domain.entities.conversation import ConversationEntity
 from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.exceptions.internal_error import InternalError
 from chatapp.domain.exceptions.not_found_error import NotFoundError
 from chatapp.infrastructure.services.llm_data_service import LLMDataService
 from chatapp.domain.repositories.conversation_repository import ConversationRepository
+from chatapp.domain.services.model_router import LLMTask, ModelRouter, route_conversation
 from chatapp.infrastructure.services.rag_retrieve_data_service import RAGRetrieverService
 
 @dataclass  
@@ -20,21 +24,21 @@ class ProcessMessageAudioUseCase:
         self, 
         llm_service: LLMDataService, 
         conversation_repository: ConversationRepository,
-        rag_service: RAGRetrieverService
+        rag_service: RAGRetrieverService,
+        memory_fold_use_case: Optional[EnqueueConversationMemoryFoldUseCase] = None,
+        model_router: Optional[ModelRouter] = None
     ):
         self._llm_service = llm_service
         self._conversation_repository = conversation_repository
         self._rag_service = rag_service
+        self._memory_fold_use_case = memory_fold_use_case
+        self._model_router = model_router
 
-    def execute(self, conversation_id: str, command: ProcessMessageAudioCommand) -> str:
+    def execute(self, conversation_id: str, command: ProcessMessageAudioCommand, full_history: bool = True) -> ConversationEntity:
         try:
-            conversation = self._conversation_repository.get_by_id(conversation_id)
+            conversation = self._conversation_repository.get_window_by_id(conversation_id)
             if not conversation:
-                raise NotFoundError(
-                    message="Conversation not found",
-                    code="CONVERSATION_NOT_FOUND",
-                    details={"conversation_id": conversation_id}
-                )
+                raise self._conversation_not_found(conversation_id)
 
             llm_transcription = self._llm_service.generate_transcription(command.audio_content)
             
@@ -44,11 +48,12 @@ class ProcessMessageAudioUseCase:
             if rag_context:
                 conversation.update_rag_context(rag_context)
             
-            llm_response = self._llm_service.generate_response(conversation)
+            llm_response = self._llm_service.generate_response(route_conversation(self._model_router, conversation, LLMTask.CHAT))
             
             conversation.add_message(llm_response)
             
-            return self._conversation_repository.update(conversation)
+            conversation = self._schedule_memory_fold(self._conversation_repository.update(conversation))
+            return self._with_full_history(conversation) if full_history else conversation
         except NotFoundError:
             raise
         except Exception as e:
@@ -57,4 +62,64 @@ class ProcessMessageAudioUseCase:
                 message="Error processing the prompt",
                 details={"original_error": str(e)}
             )
-            
\ No newline at end of file
+
+    async def aexecute(self, conversation_id: str, command: ProcessMessageAudioCommand, full_history: bool = True) -> ConversationEntity:
+        try:
+            conversation = await self._conversation_repository.aget_window_by_id(conversation_id)
+            if not conversation:
+                raise self._conversation_not_found(conversation_id)
+
+            llm_transcription = await self._llm_service.agenerate_transcription(command.audio_content)
+
+            conversation.add_message(MessageEntity(role=MessageRole.USER, content=llm_transcription))
+
+            rag_context = await self._rag_service.aretrieve_context(llm_transcription)
+            if rag_context:
+                conversation.update_rag_context(rag_context)
+
+            llm_response = await self._llm_service.agenerate_response(route_conversation(self._model_router, conversation, LLMTask.CHAT))
+
+            conversation.add_message(llm_response)
+
+            conversation = await self._aschedule_memory_fold(await self._conversation_repository.aupdate(conversation))
+            return await self._awith_full_history(conversation) if full_history else conversation
+        except NotFoundError:
+            raise
+        except Exception as e:
+            logger.exception("Error processing the prompt")
+            raise InternalError(
+                message="Error processing the prompt",
+                details={"original_error": str(e)}
+            )
+
+    def _schedule_memory_fold(self, conversation: ConversationEntity) -> ConversationEntity:
+        # Folding runs in the job worker; failing to queue it must not fail the turn.
+        if self._memory_fold_use_case is not None:
+            try:
+                self._memory_fold_use_case.execute(conversation)
+            except Exception:
+                logger.exception("Failed to queue the memory fold")
+        return conversation
+
+    async def _aschedule_memory_fold(self, conversation: ConversationEntity) -> ConversationEntity:
+        if self._memory_fold_use_case is not None:
+            try:
+                await self._memory_fold_use_case.aexecute(conversation)
+            except Exception:
+                logger.exception("Failed to queue the memory fold")
+        return conversation
+
+    def _with_full_history(self, conversation: ConversationEntity) -> ConversationEntity:
+        # The turn only loads the token window; the full response carries the whole transcript.
+        return self._conversation_repository.get_by_id(conversation.id) or conversation
+
+    async def _awith_full_history(self, conversation: ConversationEntity) -> ConversationEntity:
+        return await self._conversation_repository.aget_by_id(conversation.id) or conversation
+
+    @staticmethod
+    def _conversation_not_found(conversation_id: str) -> NotFoundError:
+        return NotFoundError(
+            message="Conversation not found",
+            code="CONVERSATION_NOT_FOUND",
+            details={"conversation_id": conversation_id}
+        )
@@ -1,31 +1,45 @@
 import logging
+from typing import AsyncIterator, Iterator, Optional, Union
 
+from chatapp.application.enqueue_conversation_memory_fold_use_case import EnqueueConversationMemoryFoldUseCase
 from chatapp.domain.exceptions.internal_error import InternalError
 from chatapp.domain.exceptions.not_found_error import NotFoundError
 from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.exceptions.domain_error import DomainError
 from chatapp.domain.models.create_message_input import CreateMessageInput
 from chatapp.domain.repositories.conversation_repository import ConversationRepository
 from chatapp.infrastructure.services.llm_data_service import LLMDataService
+from chatapp.domain.services.model_router import LLMTask, ModelRouter, route_conversation
 from chatapp.domain.services.rag_retrieve_service import RAGRetrieveService
 
 logger = logging.getLogger(__name__)
 
+# Streams yield the response deltas as they arrive and, once the reply has
+# been persisted, the updated conversation as their final item.
+MessageStreamItem = Union[str, ConversationEntity]
+
 class ProcessMessageUseCase:
 
-    def __init__(self, llm_service: LLMDataService, conversation_repository: ConversationRepository, rag_service: RAGRetrieveService):
+    def __init__(
+        self,
+        llm_service: LLMDataService,
+        conversation_repository: ConversationRepository,
+        rag_service: RAGRetrieveService,
+        memory_fold_use_case: Optional[EnqueueConversationMemoryFoldUseCase] = None,
+        model_router: Optional[ModelRouter] = None
+    ):
         self._llm_service = llm_service
         self._conversation_repository = conversation_repository
         self._rag_service = rag_service
-    
-    def execute(self, message_input: CreateMessageInput) -> ConversationEntity:
+        self._memory_fold_use_case = memory_fold_use_case
+        self._model_router = model_router
+
+    def execute(self, message_input: CreateMessageInput, full_history: bool = True) -> ConversationEntity:
         try:
-            conversation = self._conversation_repository.get_by_id(message_input.conversation_id)
+            conversation = self._conversation_repository.get_window_by_id(message_input.conversation_id)
             if not conversation:
-                raise NotFoundError(
-                    message="Conversation not found",
-                    code="CONVERSATION_NOT_FOUND",
-                    details={"conversation_id": message_input.conversation_id}
-                )
+                raise self._conversation_not_found(message_input)
 
             conversation.add_message(message_input.new_message)
 
@@ -33,11 +47,12 @@ class ProcessMessageUseCase:
             if rag_context:
                 conversation.update_rag_context(rag_context)
 
-            llm_response = self._llm_service.generate_response(conversation)
-            
+            llm_response = self._llm_service.generate_response(route_conversation(self._model_router, conversation, LLMTask.CHAT))
+
             conversation.add_message(llm_response)
 
-            return self._conversation_repository.update(conversation)
+            conversation = self._schedule_memory_fold(self._conversation_repository.update(conversation))
+            return self._with_full_history(conversation) if full_history else conversation
         except NotFoundError:
             raise
         except Exception as e:
@@ -46,4 +61,126 @@ class ProcessMessageUseCase:
                 message="Error processing the prompt",
                 details={"original_error": str(e)}
             )
-            
\ No newline at end of file
+
+    async def aexecute(self, message_input: CreateMessageInput, full_history: bool = True) -> ConversationEntity:
+        try:
+            conversation = await self._conversation_repository.aget_window_by_id(message_input.conversation_id)
+            if not conversation:
+                raise self._conversation_not_found(message_input)
+
+            conversation.add_message(message_input.new_message)
+
+            rag_context = await self._rag_service.aretrieve_context(message_input.new_message.content)
+            if rag_context:
+                conversation.update_rag_context(rag_context)
+
+            llm_response = await self._llm_service.agenerate_response(route_conversation(self._model_router, conversation, LLMTask.CHAT))
+
+            conversation.add_message(llm_response)
+
+            conversation = await self._aschedule_memory_fold(await self._conversation_repository.aupdate(conversation))
+            return await self._awith_full_history(conversation) if full_history else conversation
+        except NotFoundError:
+            raise
+        except Exception as e:
+            logger.exception("Error processing the prompt")
+            raise InternalError(
+                message="Error processing the prompt",
+                details={"original_error": str(e)}
+            )
+
+    def execute_stream(self, message_input: CreateMessageInput) -> Iterator[MessageStreamItem]:
+        conversation = self._conversation_repository.get_window_by_id(message_input.conversation_id)
+        if not conversation:
+            raise self._conversation_not_found(message_input)
+
+        return self._stream_response(conversation, message_input)
+
+    async def aexecute_stream(self, message_input: CreateMessageInput) -> AsyncIterator[MessageStreamItem]:
+        conversation = await self._conversation_repository.aget_window_by_id(message_input.conversation_id)
+        if not conversation:
+            raise self._conversation_not_found(message_input)
+
+        return self._astream_response(conversation, message_input)
+
+    def _stream_response(self, conversation: ConversationEntity, message_input: CreateMessageInput) -> Iterator[MessageStreamItem]:
+        try:
+            conversation.add_message(message_input.new_message)
+
+            rag_context = self._rag_service.retrieve_context(message_input.new_message.content)
+            if rag_context:
+                conversation.update_rag_context(rag_context)
+
+            chunks = []
+            for delta in self._llm_service.generate_response_stream(route_conversation(self._model_router, conversation, LLMTask.CHAT)):
+                chunks.append(delta)
+                yield delta
+
+            conversation.add_message(MessageEntity(role=MessageRole.ASSISTANT, content="".join(chunks)))
+
+            yield self._schedule_memory_fold(self._conversation_repository.update(conversation))
+        except DomainError:
+            raise
+        except Exception as e:
+            logger.exception("Error streaming the prompt")
+            raise InternalError(
+                message="Error streaming the prompt",
+                details={"original_error": str(e)}
+            )
+
+    async def _astream_response(self, conversation: ConversationEntity, message_input: CreateMessageInput) -> AsyncIterator[MessageStreamItem]:
+        try:
+            conversation.add_message(message_input.new_message)
+
+            rag_context = await self._rag_service.aretrieve_context(message_input.new_message.content)
+            if rag_context:
+                conversation.update_rag_context(rag_context)
+
+            chunks = []
+            async for delta in self._llm_service.agenerate_response_stream(route_conversation(self._model_router, conversation, LLMTask.CHAT)):
+                chunks.append(delta)
+                yield delta
+
+            conversation.add_message(MessageEntity(role=MessageRole.ASSISTANT, content="".join(chunks)))
+
+            yield await self._aschedule_memory_fold(await self._conversation_repository.aupdate(conversation))
+        except DomainError:
+            raise
+        except Exception as e:
+            logger.exception("Error streaming the prompt")
+            raise InternalError(
+                message="Error streaming the prompt",
+                details={"original_error": str(e)}
+            )
+
+    def _schedule_memory_fold(self, conversation: ConversationEntity) -> ConversationEntity:
+        # Folding runs in the job worker; failing to queue it must not fail the turn.
+        if self._memory_fold_use_case is not None:
+            try:
+                self._memory_fold_use_case.execute(conversation)
+            except Exception:
+                logger.exception("Failed to queue the memory fold")
+        return conversation
+
+    async def _aschedule_memory_fold(self, conversation: ConversationEntity) -> ConversationEntity:
+        if self._memory_fold_use_case is not None:
+            try:
+                await self._memory_fold_use_case.aexecute(conversation)
+            except Exception:
+                logger.exception("Failed to queue the memory fold")
+        return conversation
+
+    def _with_full_history(self, conversation: ConversationEntity) -> ConversationEntity:
+        # The turn only loads the token window; the full response carries the whole transcript.
+        return self._conversation_repository.get_by_id(conversation.id) or conversation
+
+    async def _awith_full_history(self, conversation: ConversationEntity) -> ConversationEntity:
+        return await self._conversation_repository.aget_by_id(conversation.id) or conversation
+
+    @staticmethod
+    def _conversation_not_found(message_input: CreateMessageInput) -> NotFoundError:
+        return NotFoundError(
+            message="Conversation not found",
+            code="CONVERSATION_NOT_FOUND",
+            details={"conversation_id": message_input.conversation_id}
+        )
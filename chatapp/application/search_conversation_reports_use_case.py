@@ -0,0 +1,33 @@
+import logging
+
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.conversation_report import ConversationReportPage
+from chatapp.domain.models.conversation_report_query import ConversationReportQuery
+from chatapp.domain.repositories.conversation_report_repository import ConversationReportRepository
+
+logger = logging.getLogger(__name__)
+
+class SearchConversationReportsUseCase:
+
+    def __init__(self, conversation_report_repository: ConversationReportRepository):
+        self._conversation_report_repository = conversation_report_repository
+
+    def execute(self, query: ConversationReportQuery) -> ConversationReportPage:
+        try:
+            if query.updated_from and query.updated_to and query.updated_from > query.updated_to:
+                raise ValidationError(
+                    message="updated_from must be before updated_to",
+                    code="INVALID_DATE_RANGE",
+                    details={"updated_from": query.updated_from.isoformat(), "updated_to": query.updated_to.isoformat()}
+                )
+
+            return self._conversation_report_repository.search(query)
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.exception("Error searching the conversation reports")
+            raise InternalError(
+                message="Error searching the conversation reports",
+                details={"original_error": str(e)}
+            )
@@ -5,3 +5,7 @@ class ChatConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'chatapp'
 
+    def ready(self):
+        # Build the application-wide container at startup so every request
+        # resolves the same services, OpenAI clients and connection pools.
+        from chatapp.container import container  # noqa: F401
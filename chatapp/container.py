@@ -1,4 +1,5 @@
 from dependency_injector import containers, providers
+from django.conf import settings
 from dotenv import load_dotenv
 
 from chatapp.application.create_conversation_summary_use_case import CreateConversationSummaryUseCase
@@ -9,56 +10,181 @@ from chatapp.infrastructure.repository.user_db_repository import UserDBRepositor
 from chatapp.infrastructure.repository.message_db_repository import MessageDBRepository
 from chatapp.application.create_conversation_use_case import CreateConversationUseCase
 from chatapp.application.process_message_audio_use_case import ProcessMessageAudioUseCase
+from chatapp.application.list_conversation_messages_use_case import ListConversationMessagesUseCase
+from chatapp.application.enqueue_conversation_summary_use_case import EnqueueConversationSummaryUseCase
+from chatapp.application.get_job_use_case import GetJobUseCase
+from chatapp.application.process_job_use_case import ProcessJobUseCase
+from chatapp.application.enqueue_conversation_memory_fold_use_case import EnqueueConversationMemoryFoldUseCase
+from chatapp.application.fold_conversation_memory_use_case import FoldConversationMemoryUseCase
+from chatapp.infrastructure.repository.job_db_repository import JobDBRepository
+from chatapp.infrastructure.repository.conversation_report_db_repository import ConversationReportDBRepository
+from chatapp.application.search_conversation_reports_use_case import SearchConversationReportsUseCase
+from chatapp.application.get_conversation_stats_use_case import GetConversationStatsUseCase
 from chatapp.infrastructure.services.rag_retrieve_data_service import RAGRetrieverService
+from chatapp.infrastructure.services.embedding_cache import EmbeddingCache
+from chatapp.infrastructure.services.llm_scheduler import LLMScheduler
+from chatapp.infrastructure.services.cached_llm_service import CachedLLMService
+from chatapp.infrastructure.services.greeting_pool import GreetingPool
+from chatapp.infrastructure.services.heuristic_model_router import HeuristicModelRouter
 
 
 load_dotenv()
 
 class Container(containers.DeclarativeContainer):    
     # Repositories
-    conversation_repository = providers.Singleton(
+    conversation_repository = providers.ThreadSafeSingleton(
         ConversationDBRepository
     )
     
-    user_repository = providers.Singleton(
+    user_repository = providers.ThreadSafeSingleton(
         UserDBRepository
     )
 
-    message_repository = providers.Singleton(
+    message_repository = providers.ThreadSafeSingleton(
         MessageDBRepository
     )
+
+    job_repository = providers.ThreadSafeSingleton(
+        JobDBRepository
+    )
+
+    # Reporting reads go to the analytics database alias, away from chat traffic.
+    conversation_report_repository = providers.ThreadSafeSingleton(
+        ConversationReportDBRepository
+    )
     
     # Services
-    llm_service = providers.Singleton(LLMDataService)
+    # One scheduler per process keeps every OpenAI caller inside the same rate budgets.
+    llm_scheduler = providers.ThreadSafeSingleton(LLMScheduler)
+
+    llm_service = providers.ThreadSafeSingleton(
+        LLMDataService,
+        scheduler=llm_scheduler
+    )
     
-    rag_service = providers.Singleton(
-        RAGRetrieverService
+    embedding_cache = providers.ThreadSafeSingleton(EmbeddingCache)
+
+    rag_service = providers.ThreadSafeSingleton(
+        RAGRetrieverService,
+        embedding_cache=embedding_cache,
+        scheduler=llm_scheduler
     )
 
-    # Use Cases
-    process_message_audio_use_case = providers.Factory(
-        ProcessMessageAudioUseCase,
+    # Conversation turns may be answered from the semantic response cache (RESPONSE_CACHE_ENABLED).
+    response_llm_service = providers.Selector(
+        providers.Callable(lambda: "cached" if settings.RESPONSE_CACHE_ENABLED else "direct"),
+        cached=providers.ThreadSafeSingleton(
+            CachedLLMService,
+            llm_service=llm_service,
+            rag_service=rag_service
+        ),
+        direct=llm_service,
+    )
+
+    # Picks the model per call (MODEL_ROUTER); 'none' keeps the conversation's model.
+    model_router = providers.Selector(
+        providers.Callable(lambda: settings.MODEL_ROUTER),
+        heuristic=providers.ThreadSafeSingleton(HeuristicModelRouter),
+        none=providers.Object(None),
+    )
+
+    greeting_service = providers.Selector(
+        providers.Callable(lambda: "pool" if settings.GREETING_POOL_ENABLED else "none"),
+        pool=providers.ThreadSafeSingleton(GreetingPool, llm_service=llm_service, model_router=model_router),
+        none=providers.Object(None),
+    )
+
+    # Use Cases (stateless, so one instance per process is shared by every request)
+    # Memory folds are only queued in MEMORY_MODE=summary; queued folds still run if the mode is switched back.
+    enqueue_conversation_memory_fold_use_case = providers.Selector(
+        providers.Callable(lambda: settings.MEMORY_MODE),
+        summary=providers.ThreadSafeSingleton(
+            EnqueueConversationMemoryFoldUseCase,
+            job_repository=job_repository,
+            recent_tokens=providers.Callable(lambda: settings.MEMORY_RECENT_TOKENS),
+            fold_tokens=providers.Callable(lambda: settings.MEMORY_FOLD_TOKENS),
+            max_attempts=providers.Callable(lambda: settings.JOB_MAX_ATTEMPTS),
+        ),
+        window=providers.Object(None),
+    )
+
+    fold_conversation_memory_use_case = providers.ThreadSafeSingleton(
+        FoldConversationMemoryUseCase,
+        conversation_repository=conversation_repository,
         llm_service=llm_service,
+        recent_tokens=providers.Callable(lambda: settings.MEMORY_RECENT_TOKENS),
+        model_router=model_router,
+    )
+
+    process_message_audio_use_case = providers.ThreadSafeSingleton(
+        ProcessMessageAudioUseCase,
+        llm_service=response_llm_service,
         conversation_repository=conversation_repository,
-        rag_service=rag_service
+        rag_service=rag_service,
+        memory_fold_use_case=enqueue_conversation_memory_fold_use_case,
+        model_router=model_router
     )
 
-    process_message_use_case = providers.Factory(
+    process_message_use_case = providers.ThreadSafeSingleton(
         ProcessMessageUseCase,
-        llm_service=llm_service,
+        llm_service=response_llm_service,
         conversation_repository=conversation_repository,
-        rag_service=rag_service
+        rag_service=rag_service,
+        memory_fold_use_case=enqueue_conversation_memory_fold_use_case,
+        model_router=model_router
     )
 
-    create_conversation_use_case = providers.Factory(
+    create_conversation_use_case = providers.ThreadSafeSingleton(
         CreateConversationUseCase,
         conversation_repository=conversation_repository,
         user_repository=user_repository,
         llm_service=llm_service,
+        greeting_service=greeting_service,
+        model_router=model_router,
     )
 
-    create_conversation_summary_use_case = providers.Factory(
+    create_conversation_summary_use_case = providers.ThreadSafeSingleton(
         CreateConversationSummaryUseCase,
         conversation_repository=conversation_repository,
         llm_service=llm_service,
+        model_router=model_router,
+    )
+
+    list_conversation_messages_use_case = providers.ThreadSafeSingleton(
+        ListConversationMessagesUseCase,
+        conversation_repository=conversation_repository,
+        message_repository=message_repository,
+    )
+
+    enqueue_conversation_summary_use_case = providers.ThreadSafeSingleton(
+        EnqueueConversationSummaryUseCase,
+        conversation_repository=conversation_repository,
+        job_repository=job_repository,
+        max_attempts=providers.Callable(lambda: settings.JOB_MAX_ATTEMPTS),
     )
+
+    get_job_use_case = providers.ThreadSafeSingleton(
+        GetJobUseCase,
+        job_repository=job_repository,
+    )
+
+    process_job_use_case = providers.ThreadSafeSingleton(
+        ProcessJobUseCase,
+        job_repository=job_repository,
+        create_conversation_summary_use_case=create_conversation_summary_use_case,
+        fold_conversation_memory_use_case=fold_conversation_memory_use_case,
+        retry_backoff=providers.Callable(lambda: settings.JOB_RETRY_BACKOFF),
+    )
+
+    search_conversation_reports_use_case = providers.ThreadSafeSingleton(
+        SearchConversationReportsUseCase,
+        conversation_report_repository=conversation_report_repository,
+    )
+
+    get_conversation_stats_use_case = providers.ThreadSafeSingleton(
+        GetConversationStatsUseCase,
+        conversation_report_repository=conversation_report_repository,
+    )
+
+# Application-wide container, built once per process (see ChatConfig.ready).
+container = Container()
@@ -1,49 +1,18 @@
 from cmd import PROMPT
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Tuple
 from uuid import UUID, uuid4
 import json
-import tiktoken
 
 from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.services.model_registry import DEFAULT_MODEL, ModelSpec, get_model_spec
+from chatapp.domain.services.prompt_assembler import assemble_system_prompt
 from chatapp.domain.entities.user import UserEntity
 from chatapp.domain.entities.message import MessageEntity, MessageRole
 from chatapp.domain.models.llm_message_model import LLMMessage
 
-PROMPT_LANGUAGE = """
-    Conversation Language:
-
-The assistant's response language must follow these rules:
-
-1. If the user explicitly requests to be answered in a specific language, or if the user's preferred language can be clearly inferred from the conversation context, the assistant must respond in that language.
-
-2. If the user has already sent a message and no specific language was requested, the assistant must reply in the same language as the user's message.
-
-3. If the user has not sent any message yet and no preferred language can be inferred, the assistant must use the conversation's preconfigured language: **{language}**.
-
-   - If the configured language is 'es', respond in **Spanish**.
-   - If the configured language is 'en', respond in **English**.
-   - If the configured language is 'fr', respond in **French**.
-
-The goal is to keep the conversation smooth, coherent, and personalized for the user, without switching languages arbitrarily. Do not translate previous messages — always respond directly in the appropriate language..
-"""
-
-RAG_CONTEXT = """
-If additional context has been provided at the end of this prompt, it is relevant to the current situation. This context has been retrieved from external documents (knowledge base, policies, FAQs, etc.) to help answer the question more effectively.
-
-Use it only if it's relevant to the user's query.
-
----
-
-<< BEGIN RAG CONTEXT >>
-{{rag_context}}
-<< END RAG CONTEXT >>
-"""
-
-ENCODING_MODEL = "cl100k_base"
-
 class ConversationStatus(Enum):
     ACTIVE = "active"            
     COMPLETED = "completed"     
@@ -58,15 +27,18 @@ class ConversationEntity:
     _id: str = field(default_factory=lambda: str(uuid4()))
     messages: List[MessageEntity] = field(default_factory=list)
     _new_messages: List[MessageEntity] = field(default_factory=list, init=False)
+    _last_saved_messages: List[MessageEntity] = field(default_factory=list, init=False)
     extracted_data: Optional[dict] = None
     summary: Optional[str] = None
     status: ConversationStatus = ConversationStatus.ACTIVE
     language: str = "es"
-    model: Optional[str] = "gpt-4o"
-    context_windows: int = 128000
-    max_out_tokens: int = 16384
+    model: Optional[str] = DEFAULT_MODEL
+    # Overrides of the model's budgets from the registry.
+    context_windows: Optional[int] = None
+    max_out_tokens: Optional[int] = None
     system_prompt: Optional[MessageEntity] = None
     rag_context: Optional[str] = None
+    memory_summary: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     
@@ -76,6 +48,10 @@ class ConversationEntity:
     @property
     def id(self) -> str:
         return self._id
+
+    def generate_new_id(self) -> str:
+        self._id = str(uuid4())
+        return self._id
             
     def add_message(self, message: MessageEntity) -> MessageEntity:
         self.messages.append(message)
@@ -88,46 +64,89 @@ class ConversationEntity:
         return self._new_messages.copy()
     
     def mark_messages_as_saved(self) -> None:
+        self._last_saved_messages = self._new_messages.copy()
         self._new_messages.clear()
+
+    def get_last_saved_messages(self) -> List[MessageEntity]:
+        return self._last_saved_messages.copy()
     
-    def _count_tokens(self, text: str) -> int:
-        if not text:
-            return 0
-        
-        encoding = tiktoken.get_encoding(ENCODING_MODEL)
-        return len(encoding.encode(text))
+    def get_model_spec(self) -> ModelSpec:
+        return get_model_spec(self.model)
 
-    def _get_messages_within_token_limit(self) -> List[LLMMessage]:
+    def get_available_tokens(self) -> int:
+        spec = self.get_model_spec()
+        context_windows = self.context_windows if self.context_windows is not None else spec.context_window
+        max_out_tokens = self.max_out_tokens if self.max_out_tokens is not None else spec.max_output_tokens
+        return context_windows - max_out_tokens
+
+    def _get_window(self) -> Tuple[List[MessageEntity], int]:
+        """Returns the assembled system prompt and the newest messages that fit the model's budget, with their token count."""
         messages = []
+        encoding_name = self.get_model_spec().encoding
         
-        if self.system_prompt:
-            if self.language:
-                self.system_prompt.content += f"\n\n{PROMPT_LANGUAGE.format(language=self.language)}"
-            if self.rag_context:
-                self.system_prompt.content += f"\n\n{RAG_CONTEXT.format(rag_context=self.rag_context)}"
-
-            messages.append(self.system_prompt.to_llm_format())
-            token_count = self._count_tokens(self.system_prompt.content)
+        system_prompt = self.get_assembled_system_prompt()
+        if system_prompt:
+            messages.append(system_prompt)
+            token_count = system_prompt.get_token_count(encoding_name)
         else:
             token_count = 0
         
-        available_tokens = self.context_windows - self.max_out_tokens
+        available_tokens = self.get_available_tokens()
         
         recent_messages = []
         for msg in reversed(self.messages):
             if msg.role == MessageRole.SYSTEM:
                 continue
             
-            msg_tokens = self._count_tokens(msg.content)
+            msg_tokens = msg.get_token_count(encoding_name)
             
             if token_count + msg_tokens > available_tokens:
                 break
                 
             token_count += msg_tokens
-            recent_messages.insert(0, msg.to_llm_format())
+            recent_messages.append(msg)
         
-        messages.extend(recent_messages)
-        return messages
+        messages.extend(reversed(recent_messages))
+        return messages, token_count
+
+    def _get_messages_within_token_limit(self) -> List[LLMMessage]:
+        messages, _ = self._get_window()
+        return [msg.to_llm_format() for msg in messages]
+
+    def get_memory_token_count(self) -> int:
+        """Tokens of the prompt ``get_memory`` would send."""
+        _, token_count = self._get_window()
+        return token_count
+
+    def get_last_user_message(self) -> Optional[MessageEntity]:
+        for msg in reversed(self.messages):
+            if msg.role == MessageRole.USER:
+                return msg
+        return None
+
+    def get_history_token_count(self) -> int:
+        encoding_name = self.get_model_spec().encoding
+        return sum(msg.get_token_count(encoding_name) for msg in self.messages if msg.role != MessageRole.SYSTEM)
+
+    def get_oldest_messages(self) -> List[MessageEntity]:
+        """Returns the oldest turns that fit the model's budget next to the assembled system prompt.
+
+        The first turn is always returned, even over the budget, so folding the result moves forward.
+        """
+        encoding_name = self.get_model_spec().encoding
+        system_prompt = self.get_assembled_system_prompt()
+        budget = self.get_available_tokens() - (system_prompt.get_token_count(encoding_name) if system_prompt else 0)
+
+        oldest, token_count = [], 0
+        for msg in self.messages:
+            if msg.role == MessageRole.SYSTEM:
+                continue
+            msg_tokens = msg.get_token_count(encoding_name)
+            if oldest and token_count + msg_tokens > budget:
+                break
+            token_count += msg_tokens
+            oldest.append(msg)
+        return oldest
 
     def get_memory(self) -> List[LLMMessage]:
         return self._get_messages_within_token_limit()
@@ -170,9 +189,33 @@ class ConversationEntity:
                 self.system_prompt = message
                 break
             
+    def with_system_prompt(self, system_prompt: MessageEntity) -> 'ConversationEntity':
+        """Returns a copy over the same history that uses ``system_prompt``; this entity is left untouched."""
+        conversation = replace(self, messages=list(self.messages))
+        conversation.update_system_prompt(system_prompt)
+        return conversation
+
+    def with_model(self, model: str) -> 'ConversationEntity':
+        """Returns a copy over the same history answered by ``model``; this entity is left untouched."""
+        if model == self.model:
+            return self
+        return replace(self, messages=list(self.messages), model=model)
+
     def get_system_prompt(self) -> Optional[MessageEntity]:
         return self.system_prompt
 
+    def get_assembled_system_prompt(self) -> Optional[MessageEntity]:
+        """Returns the system prompt with the language and RAG blocks as a new message; the stored prompt is left untouched."""
+        if not self.system_prompt:
+            return None
+        return assemble_system_prompt(
+            self.system_prompt.content,
+            self.language,
+            self.rag_context,
+            self.memory_summary,
+            self.get_model_spec().encoding
+        )
+
     def update_system_prompt(self, new_system_prompt: MessageEntity) -> None:
         if not new_system_prompt or not new_system_prompt.content.strip():
             raise ValidationError(
@@ -211,6 +254,16 @@ class ConversationEntity:
 
     @staticmethod
     def _validate_extracted_data(data: dict[str, Any]) -> None:
+        if not isinstance(data, dict):
+            raise ValidationError(
+                message="Extracted data must be a JSON object",
+                code="INVALID_EXTRACTED_DATA",
+                details={
+                    "field": "extracted_data",
+                    "received_type": type(data).__name__
+                }
+            )
+
         try:
             json.dumps(data)
         except (TypeError, ValueError) as e:
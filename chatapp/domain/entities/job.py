@@ -0,0 +1,54 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, Optional
+import uuid
+
+class JobKind(Enum):
+    CONVERSATION_SUMMARY = "conversation_summary"
+    CONVERSATION_MEMORY_FOLD = "conversation_memory_fold"
+
+class JobStatus(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+@dataclass
+class JobEntity:
+    kind: JobKind
+    payload: Dict[str, Any] = field(default_factory=dict)
+    _id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    max_attempts: int = 3
+    last_error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    run_after: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    def mark_succeeded(self, result: Optional[Dict[str, Any]] = None) -> None:
+        self.status = JobStatus.SUCCEEDED
+        self.result = result
+        self.last_error = None
+        self.updated_at = datetime.now()
+
+    def mark_failed(self, error: str, retry_backoff: int, retryable: bool = True) -> None:
+        """Requeues the job with exponential backoff, or fails it for good once attempts run out."""
+        self.last_error = error
+        self.updated_at = datetime.now()
+
+        if retryable and self.attempts < self.max_attempts:
+            self.status = JobStatus.QUEUED
+            self.run_after = self.updated_at + timedelta(seconds=retry_backoff * 2 ** (self.attempts - 1))
+        else:
+            self.status = JobStatus.FAILED
@@ -1,10 +1,12 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from typing import Optional
 import uuid
 
 from chatapp.domain.models.llm_message_model import LLMMessage
 from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.services.token_counter import ENCODING_MODEL, count_tokens
 
 
 class MessageRole(Enum):
@@ -18,6 +20,8 @@ class MessageEntity:
     role: MessageRole
     _id: str = field(default_factory=lambda: str(uuid.uuid4()))
     created_at: datetime = field(default_factory=datetime.now)
+    token_count: Optional[int] = None
+    token_encoding: Optional[str] = None
     
     def __post_init__(self):
         self._validate_content()
@@ -38,6 +42,13 @@ class MessageEntity:
                 }
             )
     
+    def get_token_count(self, encoding_name: str = ENCODING_MODEL) -> int:
+        """Counts the tokens once per encoding; a count from another (or an unknown) encoding is redone."""
+        if self.token_count is None or self.token_encoding != encoding_name:
+            self.token_count = count_tokens(self.content, encoding_name)
+            self.token_encoding = encoding_name
+        return self.token_count
+    
     @property
     def is_user_message(self) -> bool:
         return self.role == MessageRole.USER
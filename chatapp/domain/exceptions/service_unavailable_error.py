@@ -0,0 +1,13 @@
+from .domain_error import DomainError
+
+class ServiceUnavailableError(DomainError):
+    def error_type(self) -> str:
+        return "SERVICE_UNAVAILABLE"
+
+    def __init__(self, message: str = "Service temporarily unavailable", code: str = None, details: dict = None):
+        super().__init__(
+            message=message,
+            code=code or "SERVICE_UNAVAILABLE",
+            status=503,
+            details=details
+        )
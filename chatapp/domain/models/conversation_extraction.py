@@ -0,0 +1,74 @@
+import json
+from typing import List, Optional, TypedDict
+
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.response_schema import ResponseSchema
+
+class ConversationExtraction(TypedDict):
+    user_id: Optional[str]
+    user_name: Optional[str]
+    order_id: Optional[str]
+    product_name: Optional[str]
+    issue: Optional[str]
+    resolution: Optional[str]
+    sentiment: Optional[str]
+    language_detected: Optional[str]
+    agent_actions: List[str]
+
+TEXT_FIELDS = (
+    "user_id",
+    "user_name",
+    "order_id",
+    "product_name",
+    "issue",
+    "resolution",
+    "sentiment",
+    "language_detected",
+)
+
+# Strict structured outputs need every property listed as required; missing values are null.
+CONVERSATION_EXTRACTION_SCHEMA = ResponseSchema(
+    name="conversation_extraction",
+    schema={
+        "type": "object",
+        "properties": {
+            **{field: {"type": ["string", "null"]} for field in TEXT_FIELDS},
+            "agent_actions": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": [*TEXT_FIELDS, "agent_actions"],
+        "additionalProperties": False,
+    }
+)
+
+def parse_conversation_extraction(raw: str) -> ConversationExtraction:
+    """Parses an extraction response into a dict, with empty strings as null and the sentiment lowercased."""
+    try:
+        data = json.loads(raw)
+    except (TypeError, ValueError) as e:
+        raise _invalid(f"Not valid JSON: {e}", raw)
+
+    if not isinstance(data, dict):
+        raise _invalid("Expected a JSON object", raw)
+
+    extraction = {}
+    for field in TEXT_FIELDS:
+        value = data.get(field)
+        if value is not None and not isinstance(value, str):
+            raise _invalid(f"'{field}' must be a string or null", raw)
+        extraction[field] = (value.strip() or None) if value is not None else None
+
+    agent_actions = data.get("agent_actions") or []
+    if not isinstance(agent_actions, list) or not all(isinstance(action, str) for action in agent_actions):
+        raise _invalid("'agent_actions' must be a list of strings", raw)
+    extraction["agent_actions"] = [action.strip() for action in agent_actions if action.strip()]
+
+    if extraction["sentiment"]:
+        extraction["sentiment"] = extraction["sentiment"].lower()
+    return extraction
+
+def _invalid(reason: str, raw: str) -> ValidationError:
+    return ValidationError(
+        message=reason,
+        code="INVALID_EXTRACTED_DATA",
+        details={"field": "extracted_data", "value": raw}
+    )
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from chatapp.domain.entities.conversation import ConversationStatus
+
+@dataclass
+class ConversationReportRow:
+    id: str
+    status: ConversationStatus
+    summary: Optional[str]
+    extracted_data: Optional[Dict[str, Any]]
+    created_at: datetime
+    updated_at: datetime
+
+@dataclass
+class ConversationReportPage:
+    conversations: List[ConversationReportRow]
+    next_cursor: Optional[str] = None
+
+@dataclass
+class ConversationDailyStats:
+    day: date
+    status: ConversationStatus
+    sentiment: str
+    language_detected: str
+    conversations: int
+    summarized: int
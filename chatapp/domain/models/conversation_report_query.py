@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import List, Optional
+
+from chatapp.domain.entities.conversation import ConversationStatus
+
+@dataclass
+class ConversationReportQuery:
+    order_id: Optional[str] = None
+    sentiment: Optional[str] = None
+    language_detected: Optional[str] = None
+    statuses: List[ConversationStatus] = field(default_factory=list)
+    updated_from: Optional[datetime] = None
+    updated_to: Optional[datetime] = None
+    before: Optional[str] = None
+    limit: int = 50
+
+@dataclass
+class ConversationStatsQuery:
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    statuses: List[ConversationStatus] = field(default_factory=list)
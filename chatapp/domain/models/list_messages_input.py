@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ListMessagesInput:
+    conversation_id: str
+    before: Optional[str] = None
+    limit: int = 50
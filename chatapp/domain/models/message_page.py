@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from chatapp.domain.entities.message import MessageEntity
+
+@dataclass
+class MessagePage:
+    messages: List[MessageEntity]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import Any, Dict
+
+@dataclass(frozen=True)
+class ResponseSchema:
+    """JSON schema a structured LLM response must follow."""
+    name: str
+    schema: Dict[str, Any]
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from chatapp.domain.models.conversation_report import ConversationDailyStats, ConversationReportPage
+from chatapp.domain.models.conversation_report_query import ConversationReportQuery, ConversationStatsQuery
+
+class ConversationReportRepository(ABC):
+    """Read-only reporting over conversations, kept apart from the chat path."""
+
+    @abstractmethod
+    def search(self, query: ConversationReportQuery) -> ConversationReportPage:
+        pass
+
+    @abstractmethod
+    def get_daily_stats(self, query: ConversationStatsQuery) -> List[ConversationDailyStats]:
+        pass
+
+    @abstractmethod
+    def refresh_daily_stats(self, if_missing: bool = False) -> None:
+        """Recomputes the pre-aggregated daily statistics, or with ``if_missing`` only builds them once."""
+        pass
@@ -2,24 +2,68 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 
 from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity
 
 class ConversationRepository(ABC):    
     @abstractmethod
     def get_by_id(self, conversation_id: str) -> Optional[ConversationEntity]:
         pass
 
+    @abstractmethod
+    def exists(self, conversation_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def get_window_by_id(self, conversation_id: str, max_tokens: Optional[int] = None) -> Optional[ConversationEntity]:
+        pass
+
+    @abstractmethod
+    def get_unfolded_by_id(self, conversation_id: str, keep_tokens: int, max_tokens: Optional[int] = None) -> Optional[ConversationEntity]:
+        """Loads the oldest turns not yet folded into the memory summary, leaving out the newest ``keep_tokens``.
+
+        At most ``max_tokens`` of turns are loaded (by default what fits next to the system
+        prompt), but never fewer than one while any turn is left to fold.
+        """
+        pass
+
     @abstractmethod
     def create(self, conversation: ConversationEntity) -> ConversationEntity:
         pass
 
     @abstractmethod
     def update(self, conversation: ConversationEntity) -> ConversationEntity:
+        """Saves a chat turn: the new messages. Summary, extracted data and status are left as stored."""
+        pass
+
+    @abstractmethod
+    def update_summary(self, conversation: ConversationEntity) -> ConversationEntity:
+        """Saves the summary, extracted data and status of a conversation."""
         pass
         
+    @abstractmethod
+    def update_memory_summary(self, conversation_id: str, memory_summary: str, folded_until: MessageEntity) -> None:
+        pass
+
     @abstractmethod
     def delete(self, conversation_id: str) -> None:
         pass
 
+    @abstractmethod
+    async def aget_by_id(self, conversation_id: str) -> Optional[ConversationEntity]:
+        pass
+
+    @abstractmethod
+    async def aget_window_by_id(self, conversation_id: str, max_tokens: Optional[int] = None) -> Optional[ConversationEntity]:
+        pass
+
+    @abstractmethod
+    async def acreate(self, conversation: ConversationEntity) -> ConversationEntity:
+        pass
+
+    @abstractmethod
+    async def aupdate(self, conversation: ConversationEntity) -> ConversationEntity:
+        pass
+
     @abstractmethod
     def get_all_by_user_id(self, user_id: str) -> List[ConversationEntity]:
         pass
\ No newline at end of file
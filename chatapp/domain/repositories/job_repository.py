@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from chatapp.domain.entities.job import JobEntity, JobKind
+
+class JobRepository(ABC):
+    @abstractmethod
+    def get_by_id(self, job_id: str) -> Optional[JobEntity]:
+        pass
+
+    @abstractmethod
+    def enqueue(self, job: JobEntity) -> JobEntity:
+        pass
+
+    @abstractmethod
+    def claim(self, limit: int, lease_seconds: int, kinds: Optional[List[JobKind]] = None) -> List[JobEntity]:
+        pass
+
+    @abstractmethod
+    def update(self, job: JobEntity) -> JobEntity:
+        """Records the outcome of a claimed job; returns the stored job instead if the claim was lost."""
+        pass
+
+    @abstractmethod
+    def has_pending(self, kind: JobKind, payload: Dict[str, Any]) -> bool:
+        """Whether a queued or running job of ``kind`` has a payload containing ``payload``."""
+        pass
+
+    @abstractmethod
+    async def aenqueue(self, job: JobEntity) -> JobEntity:
+        pass
+
+    @abstractmethod
+    async def ahas_pending(self, kind: JobKind, payload: Dict[str, Any]) -> bool:
+        pass
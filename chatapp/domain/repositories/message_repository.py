@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 
 from chatapp.domain.entities.message import MessageEntity
+from chatapp.domain.models.message_page import MessagePage
 
 class MessageRepository(ABC):
     @abstractmethod
@@ -18,4 +19,8 @@ class MessageRepository(ABC):
 
     @abstractmethod
     def get_by_conversation_id(self, conversation_id: str) -> List[MessageEntity]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_page_by_conversation_id(self, conversation_id: str, before: Optional[str] = None, limit: int = 50) -> MessagePage:
+        pass
@@ -14,4 +14,12 @@ class UserRepository(ABC):
 
     @abstractmethod
     def create_anonymous(self) -> UserEntity:
+        pass
+
+    @abstractmethod
+    async def aget_by_id(self, user_id: str) -> Optional[UserEntity]:
+        pass
+
+    @abstractmethod
+    async def acreate_anonymous(self) -> UserEntity:
         pass
\ No newline at end of file
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+class GreetingService(ABC):
+    @abstractmethod
+    def get_greeting(self, system_prompt: str, language: str) -> Optional[str]:
+        """Returns a ready-made opening message, or None when none is available yet."""
+        pass
+
+    @abstractmethod
+    def prefetch(self, system_prompt: str) -> None:
+        """Prepares greetings for ``system_prompt`` ahead of the first conversation."""
+        pass
@@ -1,14 +1,41 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterator
 
 from chatapp.domain.entities.conversation import ConversationEntity
 from chatapp.domain.entities.message import MessageEntity
+from chatapp.domain.models.response_schema import ResponseSchema
 
 class LLMService(ABC):
     @abstractmethod
     def generate_response(self, conversation: ConversationEntity) -> MessageEntity:
         pass
 
+    @abstractmethod
+    def generate_structured_response(self, conversation: ConversationEntity, schema: ResponseSchema) -> MessageEntity:
+        """Generates a reply whose content is JSON following ``schema``."""
+        pass
+
+    @abstractmethod
+    def generate_response_stream(self, conversation: ConversationEntity) -> Iterator[str]:
+        pass
+
     @abstractmethod
     def generate_transcription(self, audio_file: bytes) -> str:
         pass
+
+    @abstractmethod
+    async def agenerate_response(self, conversation: ConversationEntity) -> MessageEntity:
+        pass
+
+    @abstractmethod
+    async def agenerate_structured_response(self, conversation: ConversationEntity, schema: ResponseSchema) -> MessageEntity:
+        pass
+
+    @abstractmethod
+    def agenerate_response_stream(self, conversation: ConversationEntity) -> AsyncIterator[str]:
+        pass
+
+    @abstractmethod
+    async def agenerate_transcription(self, audio_file: bytes) -> str:
+        pass
     
\ No newline at end of file
@@ -0,0 +1,54 @@
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from chatapp.domain.exceptions.validation_error import ValidationError
+
+DEFAULT_MODEL = "gpt-4o"
+
+# Dated snapshots (gpt-4o-2024-08-06) share the budgets and prices of their alias.
+SNAPSHOT_SUFFIX = re.compile(r"-\d{4}-\d{2}-\d{2}$")
+
+@dataclass(frozen=True)
+class ModelSpec:
+    name: str
+    encoding: str
+    context_window: int
+    max_output_tokens: int
+    # USD per million tokens.
+    input_price: float
+    output_price: float
+
+    def get_prompt_budget(self) -> int:
+        """Tokens left for the prompt once the largest possible answer is reserved."""
+        return self.context_window - self.max_output_tokens
+
+    def estimate_cost(self, input_tokens: int, output_tokens: int = 0) -> float:
+        return (input_tokens * self.input_price + output_tokens * self.output_price) / 1_000_000
+
+MODELS: Dict[str, ModelSpec] = {
+    spec.name: spec
+    for spec in (
+        ModelSpec("gpt-4o", "o200k_base", 128_000, 16_384, 2.50, 10.00),
+        ModelSpec("gpt-4o-mini", "o200k_base", 128_000, 16_384, 0.15, 0.60),
+        ModelSpec("gpt-4.1", "o200k_base", 1_047_576, 32_768, 2.00, 8.00),
+        ModelSpec("gpt-4.1-mini", "o200k_base", 1_047_576, 32_768, 0.40, 1.60),
+        ModelSpec("gpt-4.1-nano", "o200k_base", 1_047_576, 32_768, 0.10, 0.40),
+        ModelSpec("gpt-4-turbo", "cl100k_base", 128_000, 4_096, 10.00, 30.00),
+        ModelSpec("gpt-3.5-turbo", "cl100k_base", 16_385, 4_096, 0.50, 1.50),
+        ModelSpec("text-embedding-3-small", "cl100k_base", 8_191, 0, 0.02, 0.00),
+        ModelSpec("text-embedding-3-large", "cl100k_base", 8_191, 0, 0.13, 0.00),
+    )
+}
+
+def get_model_spec(model: Optional[str] = None) -> ModelSpec:
+    """Returns the budgets and prices of ``model`` (the default model when empty)."""
+    name = model or DEFAULT_MODEL
+    spec = MODELS.get(name) or MODELS.get(SNAPSHOT_SUFFIX.sub("", name))
+    if spec is None:
+        raise ValidationError(
+            message=f"Unknown model '{name}'",
+            code="UNKNOWN_MODEL",
+            details={"field": "model", "value": name, "expected": sorted(MODELS)}
+        )
+    return spec
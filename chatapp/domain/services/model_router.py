@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+from chatapp.domain.entities.conversation import ConversationEntity
+
+class LLMTask(Enum):
+    GREETING = "greeting"
+    CHAT = "chat"
+    SUMMARY = "summary"
+    EXTRACTION = "extraction"
+    MEMORY_FOLD = "memory_fold"
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    task: LLMTask
+    model: str
+    prompt_tokens: int
+    reason: str
+
+class ModelRouter(ABC):
+    @abstractmethod
+    def route(self, conversation: ConversationEntity, task: LLMTask) -> RoutingDecision:
+        """Picks the model that should answer ``task`` over ``conversation``."""
+        pass
+
+    def apply(self, conversation: ConversationEntity, task: LLMTask) -> ConversationEntity:
+        """Returns the conversation to send to the LLM, as a copy when the routed model differs."""
+        return conversation.with_model(self.route(conversation, task).model)
+
+def route_conversation(router: Optional[ModelRouter], conversation: ConversationEntity, task: LLMTask) -> ConversationEntity:
+    """Routes ``conversation`` when a router is configured, otherwise keeps its model."""
+    if router is None:
+        return conversation
+    return router.apply(conversation, task)
@@ -0,0 +1,82 @@
+from functools import lru_cache
+from typing import Optional
+
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.services.token_counter import ENCODING_MODEL, count_tokens
+
+PROMPT_LANGUAGE = """
+    Conversation Language:
+
+The assistant's response language must follow these rules:
+
+1. If the user explicitly requests to be answered in a specific language, or if the user's preferred language can be clearly inferred from the conversation context, the assistant must respond in that language.
+
+2. If the user has already sent a message and no specific language was requested, the assistant must reply in the same language as the user's message.
+
+3. If the user has not sent any message yet and no preferred language can be inferred, the assistant must use the conversation's preconfigured language: **{language}**.
+
+   - If the configured language is 'es', respond in **Spanish**.
+   - If the configured language is 'en', respond in **English**.
+   - If the configured language is 'fr', respond in **French**.
+
+The goal is to keep the conversation smooth, coherent, and personalized for the user, without switching languages arbitrarily. Do not translate previous messages — always respond directly in the appropriate language..
+"""
+
+RAG_CONTEXT = """
+If additional context has been provided at the end of this prompt, it is relevant to the current situation. This context has been retrieved from external documents (knowledge base, policies, FAQs, etc.) to help answer the question more effectively.
+
+Use it only if it's relevant to the user's query.
+
+---
+
+<< BEGIN RAG CONTEXT >>
+{rag_context}
+<< END RAG CONTEXT >>
+"""
+
+MEMORY_SUMMARY = """
+The earlier part of this conversation is no longer shown in full. This is a running summary of it; rely on it for anything the customer said or was told before the messages that follow.
+
+<< BEGIN CONVERSATION SUMMARY >>
+{memory_summary}
+<< END CONVERSATION SUMMARY >>
+"""
+
+BLOCK_SEPARATOR = "\n\n"
+
+@lru_cache(maxsize=1024)
+def count_block_tokens(block: str, encoding_name: str = ENCODING_MODEL) -> int:
+    """Token count of a prompt block, memoized so unchanged prompts and contexts are tokenized once."""
+    return count_tokens(block, encoding_name)
+
+def assemble_system_prompt(
+    base_prompt: str,
+    language: Optional[str] = None,
+    rag_context: Optional[str] = None,
+    memory_summary: Optional[str] = None,
+    encoding_name: str = ENCODING_MODEL
+) -> MessageEntity:
+    """Composes the base prompt, the language, RAG and conversation summary blocks into a new system message.
+
+    Nothing is mutated, so assembling the same conversation twice (e.g. on a
+    retry) yields the same prompt. The token count is the sum of the blocks,
+    which can differ from tokenizing the joined text by a token or so at each
+    separator.
+    """
+    blocks = [base_prompt]
+    if language:
+        blocks.append(PROMPT_LANGUAGE.format(language=language))
+    if rag_context:
+        blocks.append(RAG_CONTEXT.format(rag_context=rag_context))
+    if memory_summary:
+        blocks.append(MEMORY_SUMMARY.format(memory_summary=memory_summary))
+
+    return MessageEntity(
+        role=MessageRole.SYSTEM,
+        content=BLOCK_SEPARATOR.join(blocks),
+        token_count=(
+            sum(count_block_tokens(block, encoding_name) for block in blocks)
+            + count_block_tokens(BLOCK_SEPARATOR, encoding_name) * (len(blocks) - 1)
+        ),
+        token_encoding=encoding_name
+    )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 class RAGRetrieveService(ABC):
     @abstractmethod
@@ -7,5 +7,13 @@ class RAGRetrieveService(ABC):
         pass
 
     @abstractmethod
-    def retrieve_context(self, query: str, k: int = 3) -> str:
+    def retrieve_context(self, query: str, k: Optional[int] = None) -> str:
+        pass
+
+    @abstractmethod
+    async def aget_embedding(self, text: str) -> List[float]:
+        pass
+
+    @abstractmethod
+    async def aretrieve_context(self, query: str, k: Optional[int] = None) -> str:
         pass
\ No newline at end of file
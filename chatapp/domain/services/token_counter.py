@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+import tiktoken
+
+from chatapp.domain.services.model_registry import get_model_spec
+
+# Encoding of the default chat model; other models pass their own from the registry.
+ENCODING_MODEL = get_model_spec().encoding
+
+@lru_cache(maxsize=None)
+def get_encoding(encoding_name: str = ENCODING_MODEL) -> tiktoken.Encoding:
+    return tiktoken.get_encoding(encoding_name)
+
+def count_tokens(text: str, encoding_name: str = ENCODING_MODEL) -> int:
+    if not text:
+        return 0
+
+    return len(get_encoding(encoding_name).encode(text))
@@ -0,0 +1,48 @@
+import json
+
+from django.http import JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.utils.encoders import JSONEncoder
+
+from chatapp.domain.exceptions.domain_error import DomainError
+from chatapp.domain.exceptions.validation_error import ValidationError
+
+class AsyncAPIView(View):
+    """Minimal async counterpart of DRF's APIView, used on the ASGI request path.
+
+    DRF views are sync-only, so these views parse the request themselves and map
+    domain errors to the same payload produced by ``custom_exception_handler``.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        except DomainError as exc:
+            error_dict = exc.to_dict()
+            return self.json_response(
+                {"error": error_dict},
+                status=error_dict.get("status") or status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @staticmethod
+    def json_response(data, status: int, content_type: str = 'application/json') -> JsonResponse:
+        return JsonResponse(data, status=status, encoder=JSONEncoder, safe=False, content_type=content_type)
+
+    @staticmethod
+    def get_data(request) -> dict:
+        if request.content_type != 'application/json':
+            return request.POST
+
+        try:
+            return json.loads(request.body or b"{}")
+        except json.JSONDecodeError as e:
+            raise ValidationError(
+                message="Malformed JSON body",
+                details={"original_error": str(e)}
+            )
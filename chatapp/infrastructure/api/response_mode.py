@@ -0,0 +1,15 @@
+from typing import Mapping
+
+from rest_framework.renderers import JSONRenderer
+
+# Message endpoints answer with the whole conversation by default. Clients that
+# only need the current turn ask for the delta representation, either with
+# ``?view=delta`` or by accepting DELTA_MEDIA_TYPE.
+DELTA_VIEW = 'delta'
+DELTA_MEDIA_TYPE = 'application/vnd.chatapp.delta+json'
+
+class DeltaJSONRenderer(JSONRenderer):
+    media_type = DELTA_MEDIA_TYPE
+
+def wants_delta(query_params: Mapping[str, str], accept: str) -> bool:
+    return query_params.get('view', '').lower() == DELTA_VIEW or DELTA_MEDIA_TYPE in (accept or '')
@@ -0,0 +1,30 @@
+from rest_framework import status
+
+from chatapp.container import container
+from chatapp.application.process_message_audio_use_case import ProcessMessageAudioCommand
+from chatapp.infrastructure.api.async_api_view import AsyncAPIView
+from chatapp.infrastructure.api.response_mode import DELTA_MEDIA_TYPE, wants_delta
+from chatapp.infrastructure.controllers.conversation_audio_view import ConversationAudioView
+from chatapp.infrastructure.presenters.conversation_presenter import ConversationPresenter
+from chatapp.infrastructure.presenters.conversation_delta_presenter import ConversationDeltaPresenter
+
+class AsyncConversationAudioView(AsyncAPIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._process_message_audio_use_case = container.process_message_audio_use_case()
+
+    async def post(self, request, conversation_id: str):
+        audio_file = request.FILES.get('audio')
+        ConversationAudioView.validate_audio_file(audio_file)
+
+        command = ProcessMessageAudioCommand(
+            audio_content=audio_file.read(),
+            language=request.POST.get('language')
+        )
+
+        delta = wants_delta(request.GET, request.headers.get('Accept'))
+        conversation = await self._process_message_audio_use_case.aexecute(conversation_id, command, full_history=not delta)
+
+        if delta:
+            return self.json_response(ConversationDeltaPresenter(conversation).data, status=status.HTTP_200_OK, content_type=DELTA_MEDIA_TYPE)
+        return self.json_response(ConversationPresenter(conversation).data, status=status.HTTP_200_OK)
@@ -0,0 +1,47 @@
+from django.http import StreamingHttpResponse
+from rest_framework import status
+
+from chatapp.infrastructure.api.async_api_view import AsyncAPIView
+from chatapp.infrastructure.api.response_mode import DELTA_MEDIA_TYPE, wants_delta
+from chatapp.infrastructure.controllers.conversation_view import STREAM_ENABLED_VALUES
+from chatapp.infrastructure.dtos.send_message_dto import SendMessageInputDTO
+from chatapp.infrastructure.presenters.conversation_presenter import ConversationPresenter
+from chatapp.infrastructure.presenters.conversation_delta_presenter import ConversationDeltaPresenter
+from chatapp.infrastructure.presenters.sse_presenter import SSEPresenter
+from chatapp.container import container
+
+class AsyncConversationView(AsyncAPIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.use_case = container.process_message_use_case()
+
+    async def post(self, request, conversation_id: str):
+        serializer = SendMessageInputDTO(data=self.get_data(request))
+        if not serializer.is_valid():
+            return self.json_response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        if request.GET.get('stream', '').lower() in STREAM_ENABLED_VALUES:
+            return await self._stream(serializer, conversation_id)
+
+        delta = wants_delta(request.GET, request.headers.get('Accept'))
+        conversation = await self.use_case.aexecute(
+            serializer.to_domain(conversation_id),
+            full_history=not delta
+        )
+
+        if delta:
+            return self.json_response(ConversationDeltaPresenter(conversation).data, status=status.HTTP_200_OK, content_type=DELTA_MEDIA_TYPE)
+        return self.json_response(ConversationPresenter(conversation).data, status=status.HTTP_200_OK)
+
+    async def _stream(self, serializer: SendMessageInputDTO, conversation_id: str) -> StreamingHttpResponse:
+        response_stream = await self.use_case.aexecute_stream(
+            serializer.to_domain(conversation_id)
+        )
+
+        response = StreamingHttpResponse(
+            SSEPresenter.astream(response_stream),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
@@ -0,0 +1,22 @@
+from rest_framework import status
+
+from chatapp.infrastructure.api.async_api_view import AsyncAPIView
+from chatapp.infrastructure.presenters.conversation_presenter import ConversationPresenter
+from chatapp.infrastructure.dtos.create_conversation_dto import CreateConversationInputDTO
+from chatapp.container import container
+
+class AsyncCreateConversationView(AsyncAPIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.use_case = container.create_conversation_use_case()
+
+    async def post(self, request):
+        serializer = CreateConversationInputDTO(data=self.get_data(request))
+        if not serializer.is_valid():
+            return self.json_response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        conversation = await self.use_case.aexecute(
+            serializer.to_domain()
+        )
+
+        return self.json_response(ConversationPresenter(conversation).data, status=status.HTTP_201_CREATED)
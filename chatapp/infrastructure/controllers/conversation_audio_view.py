@@ -2,17 +2,21 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework import status
+from rest_framework.settings import api_settings
 import logging
 
-from chatapp.container import Container
+from chatapp.container import container
 from chatapp.application.process_message_audio_use_case import ProcessMessageAudioCommand
+from chatapp.infrastructure.api.response_mode import DeltaJSONRenderer, wants_delta
 from chatapp.infrastructure.presenters.conversation_presenter import ConversationPresenter
+from chatapp.infrastructure.presenters.conversation_delta_presenter import ConversationDeltaPresenter
 from chatapp.domain.exceptions.validation_error import ValidationError
 
 logger = logging.getLogger(__name__)
 
 class ConversationAudioView(APIView):
     parser_classes = [MultiPartParser, FormParser]
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES + [DeltaJSONRenderer]
     ALLOWED_EXTENSIONS = ('.wav', '.mp3')
     ALLOWED_CONTENT_TYPES = {
         'audio/wav', 'audio/x-wav',
@@ -21,11 +25,27 @@ class ConversationAudioView(APIView):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        container = Container()
         self._process_message_audio_use_case = container.process_message_audio_use_case()
 
     def post(self, request, conversation_id: str):
         audio_file = request.FILES.get('audio')
+        self.validate_audio_file(audio_file)
+
+        audio_content = audio_file.read()
+            
+        command = ProcessMessageAudioCommand(
+            audio_content=audio_content,
+            language=request.data.get('language')
+        )
+            
+        delta = wants_delta(request.query_params, request.headers.get('Accept'))
+        conversation = self._process_message_audio_use_case.execute(conversation_id, command, full_history=not delta)
+            
+        presenter = ConversationDeltaPresenter if delta else ConversationPresenter
+        return Response(presenter(conversation).data, status=status.HTTP_200_OK)
+
+    @classmethod
+    def validate_audio_file(cls, audio_file) -> None:
         if not audio_file:
             raise ValidationError(
                 message="No audio file provided"
@@ -36,23 +56,12 @@ class ConversationAudioView(APIView):
         
         logger.info(f"Received file: {filename} with content type: {content_type}")
         
-        if not any(filename.endswith(ext) for ext in self.ALLOWED_EXTENSIONS):
+        if not any(filename.endswith(ext) for ext in cls.ALLOWED_EXTENSIONS):
             raise ValidationError(
                 message="Invalid file type. Must be a WAV or MP3 file"
             )
 
-        if content_type not in self.ALLOWED_CONTENT_TYPES:
+        if content_type not in cls.ALLOWED_CONTENT_TYPES:
             raise ValidationError(
                 message=f"Invalid content type. Must be WAV or MP3. Received: {content_type}"
             )
-
-        audio_content = audio_file.read()
-            
-        command = ProcessMessageAudioCommand(
-            audio_content=audio_content,
-            language=request.data.get('language')
-        )
-            
-        conversation = self._process_message_audio_use_case.execute(conversation_id, command)
-            
-        return Response(ConversationPresenter(conversation).data, status=status.HTTP_200_OK)
@@ -0,0 +1,23 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from chatapp.infrastructure.dtos.list_messages_dto import ListMessagesInputDTO
+from chatapp.infrastructure.presenters.message_page_presenter import MessagePagePresenter
+from chatapp.container import container
+
+class ConversationMessagesView(APIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.use_case = container.list_conversation_messages_use_case()
+
+    def get(self, request, conversation_id: str) -> Response:
+        serializer = ListMessagesInputDTO(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        page = self.use_case.execute(
+            serializer.to_domain(conversation_id)
+        )
+
+        return Response(MessagePagePresenter(page).data, status=status.HTTP_200_OK)
@@ -0,0 +1,38 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from chatapp.infrastructure.dtos.conversation_report_dto import ConversationReportInputDTO, ConversationStatsInputDTO
+from chatapp.infrastructure.presenters.conversation_report_presenter import (
+    ConversationDailyStatsPresenter,
+    ConversationReportPagePresenter,
+)
+from chatapp.container import container
+
+class ConversationReportView(APIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.use_case = container.search_conversation_reports_use_case()
+
+    def get(self, request) -> Response:
+        serializer = ConversationReportInputDTO(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        page = self.use_case.execute(serializer.to_domain())
+
+        return Response(ConversationReportPagePresenter(page).data, status=status.HTTP_200_OK)
+
+class ConversationStatsView(APIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.use_case = container.get_conversation_stats_use_case()
+
+    def get(self, request) -> Response:
+        serializer = ConversationStatsInputDTO(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        stats = self.use_case.execute(serializer.to_domain())
+
+        return Response({'stats': ConversationDailyStatsPresenter(stats, many=True).data}, status=status.HTTP_200_OK)
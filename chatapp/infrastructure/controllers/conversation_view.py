@@ -1,26 +1,52 @@
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.settings import api_settings
 
+from chatapp.infrastructure.api.response_mode import DeltaJSONRenderer, wants_delta
 from chatapp.infrastructure.dtos.send_message_dto import SendMessageInputDTO
+from chatapp.infrastructure.presenters.conversation_delta_presenter import ConversationDeltaPresenter
 from chatapp.infrastructure.presenters.conversation_presenter import ConversationPresenter
-from chatapp.container import Container
+from chatapp.infrastructure.presenters.sse_presenter import SSEPresenter
+from chatapp.container import container
+
+STREAM_ENABLED_VALUES = ('1', 'true')
 
 class ConversationView(APIView):
+    renderer_classes = api_settings.DEFAULT_RENDERER_CLASSES + [DeltaJSONRenderer]
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        container = Container()
         self.use_case = container.process_message_use_case()
 
     def post(self, request, conversation_id: str):
         serializer = SendMessageInputDTO(data=request.data)
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-            
+
+        if request.query_params.get('stream', '').lower() in STREAM_ENABLED_VALUES:
+            return self._stream(serializer, conversation_id)
+
+        delta = wants_delta(request.query_params, request.headers.get('Accept'))
         conversation = self.use_case.execute(
+            serializer.to_domain(conversation_id),
+            full_history=not delta
+        )
+
+        presenter = ConversationDeltaPresenter if delta else ConversationPresenter
+        return Response(presenter(conversation).data, status=status.HTTP_200_OK)
+
+    def _stream(self, serializer: SendMessageInputDTO, conversation_id: str) -> StreamingHttpResponse:
+        response_stream = self.use_case.execute_stream(
             serializer.to_domain(conversation_id)
         )
 
-        return Response(ConversationPresenter(conversation).data, status=status.HTTP_200_OK)
-        
\ No newline at end of file
+        response = StreamingHttpResponse(
+            SSEPresenter.stream(response_stream),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
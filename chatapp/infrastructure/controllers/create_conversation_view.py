@@ -4,18 +4,17 @@ from rest_framework.views import APIView
 
 from chatapp.infrastructure.presenters.conversation_presenter import ConversationPresenter
 from chatapp.infrastructure.dtos.create_conversation_dto import CreateConversationInputDTO
-from chatapp.container import Container
+from chatapp.container import container
 
 class CreateConversationView(APIView):    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        container = Container()
         self.use_case = container.create_conversation_use_case()
 
     def post(self, request) -> Response:
         serializer = CreateConversationInputDTO(data=request.data)
         if not serializer.is_valid():
-            return Response(input_dto.errors, status=status.HTTP_400_BAD_REQUEST)
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
             
         conversation = self.use_case.execute(
             serializer.to_domain()
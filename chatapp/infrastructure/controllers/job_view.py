@@ -0,0 +1,16 @@
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from chatapp.infrastructure.presenters.job_presenter import JobPresenter
+from chatapp.container import container
+
+class JobView(APIView):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.use_case = container.get_job_use_case()
+
+    def get(self, request, job_id: str) -> Response:
+        job = self.use_case.execute(job_id)
+
+        return Response(JobPresenter(job).data, status=status.HTTP_200_OK)
@@ -0,0 +1,51 @@
+from rest_framework import serializers
+
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.models.conversation_report_query import ConversationReportQuery, ConversationStatsQuery
+
+STATUS_CHOICES = [status.value for status in ConversationStatus]
+
+class ConversationReportInputDTO(serializers.Serializer):
+    order_id = serializers.CharField(required=False, allow_blank=True, default=None)
+    sentiment = serializers.CharField(required=False, allow_blank=True, default=None)
+    language_detected = serializers.CharField(required=False, allow_blank=True, default=None)
+    # Repeatable: ?status=completed&status=failed
+    status = serializers.ListField(child=serializers.ChoiceField(choices=STATUS_CHOICES), required=False, default=list)
+    updated_from = serializers.DateTimeField(required=False, default=None)
+    updated_to = serializers.DateTimeField(required=False, default=None)
+    before = serializers.CharField(required=False, allow_blank=True, default=None)
+    limit = serializers.IntegerField(
+        required=False,
+        default=50,
+        min_value=1,
+        max_value=200,
+        error_messages={
+            'invalid': 'Limit must be an integer',
+            'min_value': 'Limit must be at least 1',
+            'max_value': 'Limit cannot exceed 200'
+        }
+    )
+
+    def to_domain(self) -> ConversationReportQuery:
+        return ConversationReportQuery(
+            order_id=self.validated_data["order_id"] or None,
+            sentiment=self.validated_data["sentiment"] or None,
+            language_detected=self.validated_data["language_detected"] or None,
+            statuses=[ConversationStatus(status) for status in self.validated_data["status"]],
+            updated_from=self.validated_data["updated_from"],
+            updated_to=self.validated_data["updated_to"],
+            before=self.validated_data["before"] or None,
+            limit=self.validated_data["limit"]
+        )
+
+class ConversationStatsInputDTO(serializers.Serializer):
+    date_from = serializers.DateField(required=False, default=None)
+    date_to = serializers.DateField(required=False, default=None)
+    status = serializers.ListField(child=serializers.ChoiceField(choices=STATUS_CHOICES), required=False, default=list)
+
+    def to_domain(self) -> ConversationStatsQuery:
+        return ConversationStatsQuery(
+            date_from=self.validated_data["date_from"],
+            date_to=self.validated_data["date_to"],
+            statuses=[ConversationStatus(status) for status in self.validated_data["status"]]
+        )
@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from chatapp.domain.models.list_messages_input import ListMessagesInput
+
+class ListMessagesInputDTO(serializers.Serializer):
+    before = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        default=None
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=50,
+        min_value=1,
+        max_value=200,
+        error_messages={
+            'invalid': 'Limit must be an integer',
+            'min_value': 'Limit must be at least 1',
+            'max_value': 'Limit cannot exceed 200'
+        }
+    )
+
+    def to_domain(self, conversation_id: str) -> ListMessagesInput:
+        return ListMessagesInput(
+            conversation_id=conversation_id,
+            before=self.validated_data["before"] or None,
+            limit=self.validated_data["limit"]
+        )
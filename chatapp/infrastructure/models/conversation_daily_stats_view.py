@@ -0,0 +1,35 @@
+# Daily conversation counts per status, sentiment and language, pre-aggregated
+# for dashboards. Not a Django model: the view is created and refreshed by
+# `python manage.py refresh_conversation_stats`. Missing extracted fields are
+# grouped as 'unknown' so the unique index (needed to refresh concurrently)
+# never sees NULLs.
+VIEW_NAME = "conversation_daily_stats"
+
+CREATE_VIEW_SQL = f"""
+CREATE MATERIALIZED VIEW IF NOT EXISTS {VIEW_NAME} AS
+SELECT
+    (created_at AT TIME ZONE 'UTC')::date AS day,
+    status,
+    COALESCE(extracted_data->>'sentiment', 'unknown') AS sentiment,
+    COALESCE(extracted_data->>'language_detected', 'unknown') AS language_detected,
+    count(*) AS conversations,
+    count(summary) AS summarized
+FROM conversations
+GROUP BY 1, 2, 3, 4
+"""
+
+CREATE_INDEX_SQL = f"""
+CREATE UNIQUE INDEX IF NOT EXISTS {VIEW_NAME}_key
+ON {VIEW_NAME} (day, status, sentiment, language_detected)
+"""
+
+REFRESH_VIEW_SQL = f"REFRESH MATERIALIZED VIEW CONCURRENTLY {VIEW_NAME}"
+
+SELECT_STATS_SQL = f"""
+SELECT day, status, sentiment, language_detected, conversations, summarized
+FROM {VIEW_NAME}
+WHERE (%(date_from)s::date IS NULL OR day >= %(date_from)s::date)
+  AND (%(date_to)s::date IS NULL OR day <= %(date_to)s::date)
+  AND (cardinality(%(statuses)s::text[]) = 0 OR status = ANY(%(statuses)s::text[]))
+ORDER BY day, status, sentiment, language_detected
+"""
@@ -1,9 +1,11 @@
 import uuid
-from typing import List
+from typing import Iterable, List, Optional
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.db.models import JSONField
 
 from chatapp.domain.entities.conversation import ConversationEntity, ConversationStatus
+from chatapp.domain.entities.message import MessageRole
 from .message_db import MessageDB
 from .user_db import UserDB
 
@@ -12,6 +14,10 @@ class ConversationDB(models.Model):
     user = models.ForeignKey(UserDB, on_delete=models.CASCADE, related_name='conversations')
     extracted_data = JSONField(null=True, blank=True)
     summary = models.TextField(null=True, blank=True)
+    # Running summary of the turns folded out of the prompt, and the last folded message (created_at, id).
+    memory_summary = models.TextField(null=True, blank=True)
+    memory_folded_until = models.DateTimeField(null=True, blank=True)
+    memory_folded_until_id = models.UUIDField(null=True, blank=True)
     status = models.CharField(
         max_length=20,
         choices=[(status.value, status.name) for status in ConversationStatus],
@@ -22,16 +28,25 @@ class ConversationDB(models.Model):
 
     class Meta:
         db_table = 'conversations'
+        indexes = [
+            # Containment lookups on the extracted fields, e.g. extracted_data__contains={"order_id": "123"}.
+            GinIndex(fields=['extracted_data'], name='conversations_extracted_data', opclasses=['jsonb_path_ops']),
+            # Reporting: newest-first pages, with or without a status filter.
+            models.Index(fields=['status', '-updated_at'], name='conversations_status_updated'),
+            models.Index(fields=['-updated_at'], name='conversations_updated'),
+        ]
 
-    def to_entity(self) -> ConversationEntity:
-        messages = [msg.to_entity() for msg in self.messages.all()]
+    def to_entity(self, messages: Optional[Iterable[MessageDB]] = None) -> ConversationEntity:
+        messages = [msg.to_entity() for msg in (self.messages.all() if messages is None else messages)]
         return ConversationEntity(
             _id=str(self.id),
             user=self.user.to_entity(),
             messages=messages,
+            system_prompt=next((msg for msg in messages if msg.role == MessageRole.SYSTEM), None),
             extracted_data=self.extracted_data,
             summary=self.summary,
-            status=ConversationStatus(self.status)
+            status=ConversationStatus(self.status),
+            memory_summary=self.memory_summary
         )
 
     @classmethod
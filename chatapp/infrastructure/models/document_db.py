@@ -1,10 +1,53 @@
+from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
-from pgvector.django import VectorField
+from pgvector.django import VectorField, HnswIndex, IvfflatIndex, L2Distance, CosineDistance
+
+# Each metric maps to the distance expression used at query time, the operator
+# class the ANN index must be built with for pgvector to use it, and the SQL
+# operator used by raw queries.
+DISTANCE_METRICS = {
+    'l2': (L2Distance, 'vector_l2_ops', '<->'),
+    'cosine': (CosineDistance, 'vector_cosine_ops', '<=>'),
+}
+
+def embedding_distance(embedding):
+    distance, _, _ = DISTANCE_METRICS[settings.RAG_DISTANCE_METRIC]
+    return distance("embedding", embedding)
+
+def embedding_operator() -> str:
+    _, _, operator = DISTANCE_METRICS[settings.RAG_DISTANCE_METRIC]
+    return operator
+
+def content_search_vector() -> SearchVector:
+    return SearchVector('content', config=settings.RAG_TEXT_SEARCH_CONFIG)
+
+def embedding_index() -> models.Index:
+    _, opclass, _ = DISTANCE_METRICS[settings.RAG_DISTANCE_METRIC]
+
+    if settings.RAG_VECTOR_INDEX == 'ivfflat':
+        return IvfflatIndex(
+            name='documents_embedding_ivfflat',
+            fields=['embedding'],
+            lists=settings.RAG_IVFFLAT_LISTS,
+            opclasses=[opclass]
+        )
+
+    return HnswIndex(
+        name='documents_embedding_hnsw',
+        fields=['embedding'],
+        m=settings.RAG_HNSW_M,
+        ef_construction=settings.RAG_HNSW_EF_CONSTRUCTION,
+        opclasses=[opclass]
+    )
 
 class DocumentDB(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
     embedding = VectorField(dimensions=1536)
+    content_hash = models.CharField(max_length=64, blank=True, default='')
+    search_vector = SearchVectorField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     metadata = models.JSONField(default=dict, blank=True)
 
@@ -12,8 +55,11 @@ class DocumentDB(models.Model):
         db_table = 'documents'
         indexes = [
             models.Index(fields=['title']),
+            models.Index(fields=['title', 'content_hash']),
             models.Index(fields=['created_at']),
+            embedding_index(),
+            GinIndex(fields=['search_vector'], name='documents_search_vector_gin'),
         ]
 
     def __str__(self):
-        return f"{self.title} ({self.created_at.strftime('%Y-%m-%d')})"
\ No newline at end of file
+        return f"{self.title} ({self.created_at.strftime('%Y-%m-%d')})"
@@ -0,0 +1,62 @@
+import uuid
+from django.db import models
+from django.utils import timezone
+
+from chatapp.domain.entities.job import JobEntity, JobKind, JobStatus
+
+class JobDB(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(
+        max_length=50,
+        choices=[(kind.value, kind.name) for kind in JobKind]
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=[(status.value, status.name) for status in JobStatus],
+        default=JobStatus.QUEUED.value
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=3)
+    last_error = models.TextField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'jobs'
+        indexes = [
+            # Workers poll for runnable jobs ordered by run_after.
+            models.Index(fields=['status', 'run_after'], name='jobs_status_run_after'),
+        ]
+
+    def to_entity(self) -> JobEntity:
+        return JobEntity(
+            _id=str(self.id),
+            kind=JobKind(self.kind),
+            payload=self.payload,
+            status=JobStatus(self.status),
+            attempts=self.attempts,
+            max_attempts=self.max_attempts,
+            last_error=self.last_error,
+            result=self.result,
+            run_after=self.run_after,
+            created_at=self.created_at,
+            updated_at=self.updated_at
+        )
+
+    @classmethod
+    def from_entity(cls, entity: JobEntity) -> 'JobDB':
+        return cls(
+            id=uuid.UUID(entity.id) if isinstance(entity.id, str) else entity.id,
+            kind=entity.kind.value,
+            payload=entity.payload,
+            status=entity.status.value,
+            attempts=entity.attempts,
+            max_attempts=entity.max_attempts,
+            last_error=entity.last_error,
+            result=entity.result,
+            run_after=timezone.make_aware(entity.run_after) if timezone.is_naive(entity.run_after) else entity.run_after
+        )
@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.utils import timezone
 from chatapp.domain.entities.message import MessageEntity, MessageRole
 
 class MessageDB(models.Model):
@@ -10,17 +11,27 @@ class MessageDB(models.Model):
         max_length=10,
         choices=[(role.value, role.name) for role in MessageRole]
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    token_count = models.PositiveIntegerField(null=True, blank=True)
+    # Tokenizer token_count was measured with; counts from another one are redone.
+    token_encoding = models.CharField(max_length=32, null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         db_table = 'messages'
         ordering = ['created_at']
+        indexes = [
+            # Serves the newest-first keyset scans of the context window and the messages endpoint.
+            models.Index(fields=['conversation', 'created_at'], name='messages_conversation_created'),
+        ]
 
     def to_entity(self) -> MessageEntity:
         return MessageEntity(
             _id=str(self.id),
             content=self.content,
-            role=MessageRole(self.role)
+            role=MessageRole(self.role),
+            created_at=self.created_at,
+            token_count=self.token_count,
+            token_encoding=self.token_encoding
         )
 
     @classmethod
@@ -29,5 +40,8 @@ class MessageDB(models.Model):
             id=uuid.UUID(entity.id) if isinstance(entity.id, str) else entity.id,
             conversation_id=conversation_id,
             content=entity.content,
-            role=entity.role.value
+            role=entity.role.value,
+            token_count=entity.get_token_count(),
+            token_encoding=entity.token_encoding,
+            created_at=timezone.make_aware(entity.created_at) if timezone.is_naive(entity.created_at) else entity.created_at
         )
\ No newline at end of file
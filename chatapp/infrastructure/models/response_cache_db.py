@@ -0,0 +1,30 @@
+from django.db import models
+from pgvector.django import HnswIndex, VectorField
+
+class ResponseCacheDB(models.Model):
+    """Cached assistant answer, looked up by exact prompt/context hashes and question similarity."""
+
+    prompt_hash = models.CharField(max_length=64)
+    context_hash = models.CharField(max_length=64)
+    model = models.CharField(max_length=100)
+    question = models.TextField()
+    embedding = VectorField(dimensions=1536)
+    response = models.TextField()
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_hit_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'response_cache'
+        indexes = [
+            models.Index(fields=['prompt_hash', 'context_hash', 'model'], name='response_cache_key'),
+            models.Index(fields=['expires_at'], name='response_cache_expires_at'),
+            HnswIndex(
+                name='response_cache_embedding_hnsw',
+                fields=['embedding'],
+                m=16,
+                ef_construction=64,
+                opclasses=['vector_cosine_ops']
+            ),
+        ]
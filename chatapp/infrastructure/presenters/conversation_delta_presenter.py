@@ -0,0 +1,19 @@
+from rest_framework import serializers
+
+from chatapp.infrastructure.presenters.message_presenter import MessagePresenter
+
+class ConversationDeltaPresenter(serializers.Serializer):
+    id = serializers.CharField()
+    status = serializers.CharField()
+    messages = MessagePresenter(many=True)
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'status': instance.status.value,
+            'messages': MessagePresenter(instance.get_last_saved_messages(), many=True).data,
+            'created_at': instance.created_at,
+            'updated_at': instance.updated_at
+        }
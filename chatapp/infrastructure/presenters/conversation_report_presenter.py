@@ -0,0 +1,47 @@
+from rest_framework import serializers
+
+class ConversationReportRowPresenter(serializers.Serializer):
+    id = serializers.CharField()
+    status = serializers.CharField()
+    summary = serializers.CharField(allow_null=True)
+    extracted_data = serializers.JSONField(allow_null=True)
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'status': instance.status.value,
+            'summary': instance.summary,
+            'extracted_data': instance.extracted_data,
+            'created_at': instance.created_at,
+            'updated_at': instance.updated_at
+        }
+
+class ConversationReportPagePresenter(serializers.Serializer):
+    conversations = ConversationReportRowPresenter(many=True)
+    next_cursor = serializers.CharField(allow_null=True)
+
+    def to_representation(self, instance):
+        return {
+            'conversations': ConversationReportRowPresenter(instance.conversations, many=True).data,
+            'next_cursor': instance.next_cursor
+        }
+
+class ConversationDailyStatsPresenter(serializers.Serializer):
+    day = serializers.DateField()
+    status = serializers.CharField()
+    sentiment = serializers.CharField()
+    language_detected = serializers.CharField()
+    conversations = serializers.IntegerField()
+    summarized = serializers.IntegerField()
+
+    def to_representation(self, instance):
+        return {
+            'day': instance.day,
+            'status': instance.status.value,
+            'sentiment': instance.sentiment,
+            'language_detected': instance.language_detected,
+            'conversations': instance.conversations,
+            'summarized': instance.summarized
+        }
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+class JobPresenter(serializers.Serializer):
+    id = serializers.CharField()
+    kind = serializers.CharField()
+    status = serializers.CharField()
+    attempts = serializers.IntegerField()
+    last_error = serializers.CharField(allow_null=True)
+    result = serializers.JSONField(allow_null=True)
+    created_at = serializers.DateTimeField()
+    updated_at = serializers.DateTimeField()
+
+    def to_representation(self, instance):
+        return {
+            'id': instance.id,
+            'kind': instance.kind.value,
+            'status': instance.status.value,
+            'attempts': instance.attempts,
+            'last_error': instance.last_error,
+            'result': instance.result,
+            'created_at': instance.created_at,
+            'updated_at': instance.updated_at
+        }
@@ -0,0 +1,13 @@
+from rest_framework import serializers
+
+from chatapp.infrastructure.presenters.message_presenter import MessagePresenter
+
+class MessagePagePresenter(serializers.Serializer):
+    messages = MessagePresenter(many=True)
+    next_cursor = serializers.CharField(allow_null=True)
+
+    def to_representation(self, instance):
+        return {
+            'messages': MessagePresenter(instance.messages, many=True).data,
+            'next_cursor': instance.next_cursor
+        }
@@ -0,0 +1,39 @@
+import json
+from typing import Any, AsyncIterator, Iterator
+
+from rest_framework.utils.encoders import JSONEncoder
+
+from chatapp.application.process_message_use_case import MessageStreamItem
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.exceptions.domain_error import DomainError
+from chatapp.infrastructure.presenters.message_presenter import MessagePresenter
+
+class SSEPresenter:
+    @staticmethod
+    def event(name: str, data: Any) -> str:
+        return f"event: {name}\ndata: {json.dumps(data, cls=JSONEncoder)}\n\n"
+
+    @classmethod
+    def stream(cls, response_stream: Iterator[MessageStreamItem]) -> Iterator[str]:
+        try:
+            for item in response_stream:
+                yield cls._to_event(item)
+        except DomainError as e:
+            yield cls.event("error", e.to_dict())
+
+    @classmethod
+    async def astream(cls, response_stream: AsyncIterator[MessageStreamItem]) -> AsyncIterator[str]:
+        try:
+            async for item in response_stream:
+                yield cls._to_event(item)
+        except DomainError as e:
+            yield cls.event("error", e.to_dict())
+
+    @classmethod
+    def _to_event(cls, item: MessageStreamItem) -> str:
+        if isinstance(item, ConversationEntity):
+            return cls.event("done", {
+                "id": item.id,
+                "message": MessagePresenter(item.messages[-1]).data
+            })
+        return cls.event("token", {"content": item})
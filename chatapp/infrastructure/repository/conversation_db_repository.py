@@ -1,10 +1,18 @@
 import logging
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Tuple
+from uuid import UUID
+from asgiref.sync import sync_to_async
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, before_log, after_log
 
 from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
 from chatapp.domain.repositories.conversation_repository import ConversationRepository
+from chatapp.domain.services.token_counter import ENCODING_MODEL
 from chatapp.infrastructure.models.conversation_db import ConversationDB
 from chatapp.infrastructure.models.message_db import MessageDB
 from chatapp.domain.exceptions.bad_request import BadRequestError
@@ -12,14 +20,178 @@ from chatapp.domain.exceptions.validation_error import ValidationError
 
 logger = logging.getLogger(__name__)
 
+WINDOW_PAGE_SIZE = 50
+
 class ConversationDBRepository(ConversationRepository):
     def get_by_id(self, conversation_id: str) -> Optional[ConversationEntity]:
         try:
             conversation_db = ConversationDB.objects.select_related('user').prefetch_related('messages').get(id=conversation_id)
-            return conversation_db.to_entity()
         except ObjectDoesNotExist:
             return None
 
+        self._backfill_token_counts(conversation_db.messages.all())
+        return conversation_db.to_entity()
+
+    async def aget_by_id(self, conversation_id: str) -> Optional[ConversationEntity]:
+        try:
+            conversation_db = await ConversationDB.objects.select_related('user').prefetch_related('messages').aget(id=conversation_id)
+        except ObjectDoesNotExist:
+            return None
+
+        backfilled = self._count_missing_tokens(conversation_db.messages.all())
+        if backfilled:
+            await MessageDB.objects.abulk_update(backfilled, ['token_count', 'token_encoding'])
+        return conversation_db.to_entity()
+
+    def exists(self, conversation_id: str) -> bool:
+        return ConversationDB.objects.filter(id=conversation_id).exists()
+
+    def get_window_by_id(self, conversation_id: str, max_tokens: Optional[int] = None) -> Optional[ConversationEntity]:
+        loaded = self._get_head(conversation_id, max_tokens)
+        if loaded is None:
+            return None
+
+        conversation_db, conversation, budget = loaded
+        conversation.messages.extend(
+            msg.to_entity() for msg in self._get_recent_messages(conversation_db.id, budget, self._folded_until(conversation_db))
+        )
+        return conversation
+
+    async def aget_window_by_id(self, conversation_id: str, max_tokens: Optional[int] = None) -> Optional[ConversationEntity]:
+        return await sync_to_async(self.get_window_by_id)(conversation_id, max_tokens)
+
+    def get_unfolded_by_id(self, conversation_id: str, keep_tokens: int, max_tokens: Optional[int] = None) -> Optional[ConversationEntity]:
+        loaded = self._get_head(conversation_id, max_tokens)
+        if loaded is None:
+            return None
+
+        conversation_db, conversation, budget = loaded
+        folded_until = self._folded_until(conversation_db)
+        kept = self._get_recent_messages(conversation_db.id, keep_tokens, folded_until)
+        kept_from = (kept[0].created_at, kept[0].id) if kept else None
+        conversation.messages.extend(
+            msg.to_entity() for msg in self._get_oldest_messages(conversation_db.id, budget, folded_until, kept_from)
+        )
+        return conversation
+
+    def _get_head(self, conversation_id: str, max_tokens: Optional[int]) -> Optional[Tuple[ConversationDB, ConversationEntity, int]]:
+        """Loads the conversation with only its system prompt, and the token budget left for history."""
+        try:
+            conversation_db = ConversationDB.objects.select_related('user').get(id=conversation_id)
+        except ObjectDoesNotExist:
+            return None
+
+        system_prompt = MessageDB.objects.filter(
+            conversation_id=conversation_db.id,
+            role=MessageRole.SYSTEM.value
+        ).order_by('created_at').first()
+        head = [system_prompt] if system_prompt else []
+        self._backfill_token_counts(head)
+
+        conversation = conversation_db.to_entity(messages=head)
+        budget = conversation.get_available_tokens() if max_tokens is None else max_tokens
+        if conversation.system_prompt:
+            budget -= conversation.get_assembled_system_prompt().get_token_count()
+        return conversation_db, conversation, budget
+
+    @staticmethod
+    def _folded_until(conversation_db: ConversationDB) -> Optional[Tuple[datetime, UUID]]:
+        # Turns already folded into the memory summary are represented by it, not loaded again.
+        if not conversation_db.memory_folded_until:
+            return None
+        return (conversation_db.memory_folded_until, conversation_db.memory_folded_until_id)
+
+    def _get_recent_messages(self, conversation_id, budget: int, after: Optional[Tuple[datetime, UUID]] = None) -> List[MessageDB]:
+        """Walks the conversation backwards page by page (keyset on created_at, id) until the budget is spent.
+
+        ``after`` stops the walk at a (created_at, id) position, excluding it.
+        """
+        window, used_tokens, before = [], 0, None
+        while True:
+            page = list(self._window_page_query(conversation_id, after, before)[:WINDOW_PAGE_SIZE])
+            self._backfill_token_counts(page)
+
+            for msg in page:
+                if used_tokens + msg.token_count > budget:
+                    return list(reversed(window))
+                used_tokens += msg.token_count
+                window.append(msg)
+
+            if len(page) < WINDOW_PAGE_SIZE:
+                return list(reversed(window))
+            before = (page[-1].created_at, page[-1].id)
+
+    def _get_oldest_messages(
+        self,
+        conversation_id,
+        budget: int,
+        after: Optional[Tuple[datetime, UUID]],
+        before: Optional[Tuple[datetime, UUID]]
+    ) -> List[MessageDB]:
+        """Walks the conversation forwards from ``after`` page by page until the budget is spent or ``before`` is reached.
+
+        The first message is always returned, even over the budget, so a caller folding
+        the result always moves forward.
+        """
+        chunk, used_tokens = [], 0
+        while True:
+            page = list(self._window_page_query(conversation_id, after, before, oldest_first=True)[:WINDOW_PAGE_SIZE])
+            self._backfill_token_counts(page)
+
+            for msg in page:
+                if chunk and used_tokens + msg.token_count > budget:
+                    return chunk
+                used_tokens += msg.token_count
+                chunk.append(msg)
+
+            if len(page) < WINDOW_PAGE_SIZE:
+                return chunk
+            after = (page[-1].created_at, page[-1].id)
+
+    @staticmethod
+    def _window_page_query(
+        conversation_id,
+        after: Optional[Tuple[datetime, UUID]],
+        before: Optional[Tuple[datetime, UUID]],
+        oldest_first: bool = False
+    ) -> QuerySet:
+        """Non-system messages strictly between ``after`` and ``before``, newest first unless ``oldest_first``."""
+        query = MessageDB.objects.filter(conversation_id=conversation_id).exclude(
+            role=MessageRole.SYSTEM.value
+        ).order_by(*(('created_at', 'id') if oldest_first else ('-created_at', '-id')))
+        if after is not None:
+            query = query.filter(Q(created_at__gt=after[0]) | Q(created_at=after[0], id__gt=after[1]))
+        if before is not None:
+            query = query.filter(Q(created_at__lt=before[0]) | Q(created_at=before[0], id__lt=before[1]))
+        return query
+
+    def update_memory_summary(self, conversation_id: str, memory_summary: str, folded_until: MessageEntity) -> None:
+        folded_until_at = folded_until.created_at
+        updated_rows = ConversationDB.objects.filter(id=conversation_id).update(
+            memory_summary=memory_summary,
+            memory_folded_until=timezone.make_aware(folded_until_at) if timezone.is_naive(folded_until_at) else folded_until_at,
+            memory_folded_until_id=folded_until.id
+        )
+        if not updated_rows:
+            raise self._conversation_not_found(conversation_id)
+
+    def _backfill_token_counts(self, messages: List[MessageDB]) -> None:
+        backfilled = self._count_missing_tokens(messages)
+        if backfilled:
+            MessageDB.objects.bulk_update(backfilled, ['token_count', 'token_encoding'])
+
+    def _count_missing_tokens(self, messages: List[MessageDB]) -> List[MessageDB]:
+        """(Re)counts messages without a count in the default encoding, which sizes the stored window."""
+        missing = [msg for msg in messages if msg.token_count is None or msg.token_encoding != ENCODING_MODEL]
+        for msg in missing:
+            entity = msg.to_entity()
+            msg.token_count = entity.get_token_count(ENCODING_MODEL)
+            msg.token_encoding = entity.token_encoding
+
+        if missing:
+            logger.info(f"Backfilled token counts for {len(missing)} messages")
+        return missing
+
     @retry(
         retry=retry_if_exception_type((ValidationError)),
         stop=stop_after_attempt(3),
@@ -28,42 +200,65 @@ class ConversationDBRepository(ConversationRepository):
         after=after_log(logger, logging.INFO)
     )
     def create(self, conversation: ConversationEntity) -> ConversationEntity:
-        if self.get_by_id(conversation.id):
+        try:
+            with transaction.atomic():
+                ConversationDB.from_entity(conversation).save(force_insert=True)
+                self._insert_unsaved_messages(conversation)
+        except IntegrityError:
+            if not ConversationDB.objects.filter(id=conversation.id).exists():
+                raise
             conversation.generate_new_id()
             raise ValidationError("Duplicate ID, retrying with a new one.")
 
-        conversation_db = ConversationDB.from_entity(conversation)
-        conversation_db.save()
-
-        unsaved_messages = conversation.get_unsaved_messages()
-        for message in unsaved_messages:
-            MessageDB.from_entity(message, conversation_db.id).save()
         conversation.mark_messages_as_saved()
-
-        return self.get_by_id(conversation_db.id)
+        return conversation
 
     def update(self, conversation: ConversationEntity) -> ConversationEntity:
-        if not self.get_by_id(conversation.id):
-            raise BadRequestError(
-                message="The conversation you are trying to update does not exist.",
-                code="CONVERSATION_NOT_FOUND",
-                details={"conversation_id": conversation.id}
+        # A turn must not write back the summary fields it loaded: the summary job
+        # may have stored new ones while the reply was being generated.
+        with transaction.atomic():
+            updated_rows = ConversationDB.objects.filter(id=conversation.id).update(
+                updated_at=timezone.now()
             )
+            if not updated_rows:
+                raise self._conversation_not_found(conversation.id)
 
-        conversation_db = ConversationDB.objects.get(id=conversation.id)
+            self._insert_unsaved_messages(conversation)
 
-        conversation_db.extracted_data = conversation.extracted_data
-        conversation_db.summary = conversation.summary
-        conversation_db.status = conversation.status.value
-        conversation_db.save()
+        conversation.mark_messages_as_saved()
+        return conversation
+
+    def update_summary(self, conversation: ConversationEntity) -> ConversationEntity:
+        updated_rows = ConversationDB.objects.filter(id=conversation.id).update(
+            extracted_data=conversation.extracted_data,
+            summary=conversation.summary,
+            status=conversation.status.value,
+            updated_at=timezone.now()
+        )
+        if not updated_rows:
+            raise self._conversation_not_found(conversation.id)
+        return conversation
+
+    @staticmethod
+    def _conversation_not_found(conversation_id: str) -> BadRequestError:
+        return BadRequestError(
+            message="The conversation you are trying to update does not exist.",
+            code="CONVERSATION_NOT_FOUND",
+            details={"conversation_id": conversation_id}
+        )
 
+    def _insert_unsaved_messages(self, conversation: ConversationEntity) -> None:
         unsaved_messages = conversation.get_unsaved_messages()
-        print(unsaved_messages)
-        for message in unsaved_messages:
-            MessageDB.from_entity(message, conversation_db.id).save()
-        conversation.mark_messages_as_saved()
+        if unsaved_messages:
+            MessageDB.objects.bulk_create([
+                MessageDB.from_entity(message, conversation.id) for message in unsaved_messages
+            ])
+
+    async def acreate(self, conversation: ConversationEntity) -> ConversationEntity:
+        return await sync_to_async(self.create)(conversation)
 
-        return self.get_by_id(conversation_db.id)
+    async def aupdate(self, conversation: ConversationEntity) -> ConversationEntity:
+        return await sync_to_async(self.update)(conversation)
 
     def delete(self, conversation_id: str) -> None:
         ConversationDB.objects.filter(id=conversation_id).delete()
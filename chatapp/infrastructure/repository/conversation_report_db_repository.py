@@ -0,0 +1,120 @@
+import logging
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Q
+
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.exceptions.service_unavailable_error import ServiceUnavailableError
+from chatapp.domain.models.conversation_report import ConversationDailyStats, ConversationReportPage, ConversationReportRow
+from chatapp.domain.models.conversation_report_query import ConversationReportQuery, ConversationStatsQuery
+from chatapp.domain.repositories.conversation_report_repository import ConversationReportRepository
+from chatapp.infrastructure.models.conversation_daily_stats_view import (
+    CREATE_INDEX_SQL,
+    CREATE_VIEW_SQL,
+    REFRESH_VIEW_SQL,
+    SELECT_STATS_SQL,
+    VIEW_NAME,
+)
+from chatapp.infrastructure.models.conversation_db import ConversationDB
+from chatapp.infrastructure.repository.message_db_repository import MessageDBRepository
+
+logger = logging.getLogger(__name__)
+
+class ConversationReportDBRepository(ConversationReportRepository):
+    """Reads go to the analytics database alias (a replica and/or a connection with a statement timeout)."""
+
+    def __init__(self, using: Optional[str] = None):
+        self._using = using or settings.ANALYTICS_DB_ALIAS
+
+    def search(self, query: ConversationReportQuery) -> ConversationReportPage:
+        rows = (
+            ConversationDB.objects.using(self._using)
+            .only('id', 'status', 'summary', 'extracted_data', 'created_at', 'updated_at')
+            .order_by('-updated_at', '-id')
+        )
+
+        # One containment filter over the extracted fields is served by the GIN index.
+        extracted = {
+            "order_id": query.order_id,
+            "sentiment": query.sentiment.lower() if query.sentiment else None,
+            "language_detected": query.language_detected,
+        }
+        extracted = {key: value for key, value in extracted.items() if value}
+        if extracted:
+            rows = rows.filter(extracted_data__contains=extracted)
+        if query.statuses:
+            rows = rows.filter(status__in=[status.value for status in query.statuses])
+        if query.updated_from:
+            rows = rows.filter(updated_at__gte=query.updated_from)
+        if query.updated_to:
+            rows = rows.filter(updated_at__lte=query.updated_to)
+        if query.before:
+            updated_at, conversation_id = MessageDBRepository.decode_cursor(query.before)
+            rows = rows.filter(Q(updated_at__lt=updated_at) | Q(updated_at=updated_at, id__lt=conversation_id))
+
+        # One extra row tells whether another page exists without a COUNT.
+        page = list(rows[:query.limit + 1])
+        has_more = len(page) > query.limit
+        page = page[:query.limit]
+
+        return ConversationReportPage(
+            conversations=[
+                ConversationReportRow(
+                    id=str(row.id),
+                    status=ConversationStatus(row.status),
+                    summary=row.summary,
+                    extracted_data=row.extracted_data if isinstance(row.extracted_data, dict) else None,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at
+                )
+                for row in page
+            ],
+            next_cursor=MessageDBRepository.encode_cursor(page[-1].updated_at, str(page[-1].id)) if has_more else None
+        )
+
+    def get_daily_stats(self, query: ConversationStatsQuery) -> List[ConversationDailyStats]:
+        with connections[self._using].cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [VIEW_NAME])
+            if cursor.fetchone()[0] is None:
+                raise ServiceUnavailableError(
+                    message="Conversation statistics are not available yet. Run refresh_conversation_stats to build them.",
+                    code="STATS_NOT_READY",
+                    details={"view": VIEW_NAME}
+                )
+
+            cursor.execute(SELECT_STATS_SQL, {
+                "date_from": query.date_from,
+                "date_to": query.date_to,
+                "statuses": [status.value for status in query.statuses],
+            })
+            return [
+                ConversationDailyStats(
+                    day=day,
+                    status=ConversationStatus(status),
+                    sentiment=sentiment,
+                    language_detected=language_detected,
+                    conversations=conversations,
+                    summarized=summarized
+                )
+                for day, status, sentiment, language_detected, conversations, summarized in cursor.fetchall()
+            ]
+
+    def refresh_daily_stats(self, if_missing: bool = False) -> None:
+        # Replicas are read-only, so the view is always built on the primary.
+        with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+            cursor.execute("SELECT to_regclass(%s)", [VIEW_NAME])
+            if cursor.fetchone()[0] is None:
+                # Creating the view populates it, so there is nothing to refresh yet.
+                cursor.execute(CREATE_VIEW_SQL)
+                cursor.execute(CREATE_INDEX_SQL)
+                logger.info(f"Created the {VIEW_NAME} materialized view")
+                return
+            if if_missing:
+                return
+
+            cursor.execute(CREATE_INDEX_SQL)
+            # Concurrent refreshes keep the view readable while it is recomputed.
+            cursor.execute(REFRESH_VIEW_SQL)
+            logger.info(f"Refreshed the {VIEW_NAME} materialized view")
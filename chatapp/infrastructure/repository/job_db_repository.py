@@ -0,0 +1,111 @@
+import logging
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from chatapp.domain.entities.job import JobEntity, JobKind, JobStatus
+from chatapp.domain.exceptions.bad_request import BadRequestError
+from chatapp.domain.repositories.job_repository import JobRepository
+from chatapp.infrastructure.models.job_db import JobDB
+
+logger = logging.getLogger(__name__)
+
+LEASE_EXPIRED_ERROR = "The worker stopped before finishing the last attempt (lease expired)"
+
+class JobDBRepository(JobRepository):
+    def get_by_id(self, job_id: str) -> Optional[JobEntity]:
+        try:
+            return JobDB.objects.get(id=job_id).to_entity()
+        except ObjectDoesNotExist:
+            return None
+
+    def enqueue(self, job: JobEntity) -> JobEntity:
+        job_db = JobDB.from_entity(job)
+        job_db.save(force_insert=True)
+        return job_db.to_entity()
+
+    def claim(self, limit: int, lease_seconds: int, kinds: Optional[List[JobKind]] = None) -> List[JobEntity]:
+        """Locks up to ``limit`` runnable jobs with SKIP LOCKED so concurrent workers never share one.
+
+        Running jobs whose lease expired (their worker died) are runnable again
+        while they have attempts left, and failed once they have none.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            # A job that kills its worker never reaches mark_failed, so its attempts run out here.
+            JobDB.objects.filter(
+                status=JobStatus.RUNNING.value,
+                locked_until__lt=now,
+                attempts__gte=F('max_attempts')
+            ).update(
+                status=JobStatus.FAILED.value,
+                last_error=LEASE_EXPIRED_ERROR,
+                locked_until=None,
+                updated_at=now
+            )
+
+            query = JobDB.objects.select_for_update(skip_locked=True).filter(
+                Q(status=JobStatus.QUEUED.value, run_after__lte=now) |
+                Q(status=JobStatus.RUNNING.value, locked_until__lt=now, attempts__lt=F('max_attempts'))
+            )
+            if kinds:
+                query = query.filter(kind__in=[kind.value for kind in kinds])
+
+            job_ids = list(query.order_by('run_after').values_list('id', flat=True)[:limit])
+            JobDB.objects.filter(id__in=job_ids).update(
+                status=JobStatus.RUNNING.value,
+                attempts=F('attempts') + 1,
+                locked_until=now + timedelta(seconds=lease_seconds),
+                updated_at=now
+            )
+
+        return [job.to_entity() for job in JobDB.objects.filter(id__in=job_ids).order_by('run_after')]
+
+    def update(self, job: JobEntity) -> JobEntity:
+        """Records the outcome of a claimed job, only while this claim still owns it.
+
+        Each claim bumps ``attempts``, so it identifies the claim. When the lease
+        expired and another worker reclaimed (or failed) the job, nothing is
+        written and the stored job is returned instead.
+        """
+        updated_rows = JobDB.objects.filter(
+            id=job.id,
+            status=JobStatus.RUNNING.value,
+            attempts=job.attempts
+        ).update(
+            status=job.status.value,
+            last_error=job.last_error,
+            result=job.result,
+            run_after=timezone.make_aware(job.run_after) if timezone.is_naive(job.run_after) else job.run_after,
+            locked_until=None,
+            updated_at=timezone.now()
+        )
+        if updated_rows:
+            return job
+
+        stored = self.get_by_id(job.id)
+        if stored is None:
+            raise BadRequestError(
+                message="The job you are trying to update does not exist.",
+                code="JOB_NOT_FOUND",
+                details={"job_id": job.id}
+            )
+        logger.warning(f"Job {job.id} lost its lease after attempt {job.attempts}; its {job.status.value} outcome was discarded")
+        return stored
+
+    def has_pending(self, kind: JobKind, payload: Dict[str, Any]) -> bool:
+        return JobDB.objects.filter(
+            kind=kind.value,
+            status__in=[JobStatus.QUEUED.value, JobStatus.RUNNING.value],
+            payload__contains=payload
+        ).exists()
+
+    async def aenqueue(self, job: JobEntity) -> JobEntity:
+        return await sync_to_async(self.enqueue)(job)
+
+    async def ahas_pending(self, kind: JobKind, payload: Dict[str, Any]) -> bool:
+        return await sync_to_async(self.has_pending)(kind, payload)
@@ -1,7 +1,15 @@
-from typing import Optional, List
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Optional, List, Tuple
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Q
 
 from chatapp.domain.entities.message import MessageEntity
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.message_page import MessagePage
 from chatapp.domain.repositories.message_repository import MessageRepository
 from chatapp.infrastructure.models.message_db import MessageDB
 
@@ -23,4 +31,38 @@ class MessageDBRepository(MessageRepository):
 
     def get_by_conversation_id(self, conversation_id: str) -> List[MessageEntity]:
         messages = MessageDB.objects.filter(conversation_id=conversation_id).order_by('created_at')
-        return [msg.to_entity() for msg in messages]
\ No newline at end of file
+        return [msg.to_entity() for msg in messages]
+
+    def get_page_by_conversation_id(self, conversation_id: str, before: Optional[str] = None, limit: int = 50) -> MessagePage:
+        query = MessageDB.objects.filter(conversation_id=conversation_id).order_by('-created_at', '-id')
+        if before:
+            created_at, message_id = self.decode_cursor(before)
+            query = query.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=message_id))
+
+        # One extra row tells whether an older page exists without a COUNT.
+        rows = list(query[:limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        return MessagePage(
+            messages=[msg.to_entity() for msg in reversed(rows)],
+            next_cursor=self.encode_cursor(rows[-1].created_at, str(rows[-1].id)) if has_more else None
+        )
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, message_id: str) -> str:
+        payload = json.dumps({"created_at": created_at.isoformat(), "id": message_id})
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return datetime.fromisoformat(payload["created_at"]), str(uuid.UUID(payload["id"]))
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+            raise ValidationError(
+                message="Invalid pagination cursor",
+                code="INVALID_CURSOR",
+                details={"field": "before", "original_error": str(e)}
+            )
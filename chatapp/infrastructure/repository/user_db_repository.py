@@ -20,9 +20,24 @@ class UserDBRepository(UserRepository):
         return user_db.to_entity()
 
     def create_anonymous(self) -> UserEntity:
+        return self.save(self._new_anonymous_user())
+
+    async def aget_by_id(self, user_id: str) -> Optional[UserEntity]:
+        try:
+            user_db = await UserDB.objects.aget(id=user_id)
+            return user_db.to_entity()
+        except ObjectDoesNotExist:
+            return None
+
+    async def acreate_anonymous(self) -> UserEntity:
+        user_db = UserDB.from_entity(self._new_anonymous_user())
+        await user_db.asave()
+        return user_db.to_entity()
+
+    @staticmethod
+    def _new_anonymous_user() -> UserEntity:
         user_id = str(uuid4())
-        user = UserEntity(
+        return UserEntity(
             _id=user_id,
             name=f"Anonymous_{user_id[:8]}",
-        )
-        return self.save(user)
\ No newline at end of file
+        )
\ No newline at end of file
@@ -0,0 +1,266 @@
+import hashlib
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from pgvector.django import CosineDistance
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.models.response_schema import ResponseSchema
+from chatapp.domain.services.llm_service import LLMService
+from chatapp.domain.services.rag_retrieve_service import RAGRetrieveService
+from chatapp.infrastructure.models.response_cache_db import ResponseCacheDB
+
+# Eviction runs after this many stored entries rather than on every write.
+EVICT_EVERY = 100
+# Order numbers, tracking codes, emails, amounts: questions that differ only in
+# these embed almost identically but need different answers, so they are only
+# served from an entry with exactly the same question.
+IDENTIFIER = re.compile(r"\d|[^\s@]+@[^\s@]+")
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class CacheKey:
+    prompt_hash: str
+    context_hash: str
+    model: str
+    question: str
+    embedding: List[float]
+    exact_only: bool = False
+
+def _hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def evict_response_cache(max_entries: Optional[int] = None) -> int:
+    """Deletes expired entries and the least recently used ones beyond ``max_entries``."""
+    max_entries = max_entries if max_entries is not None else settings.RESPONSE_CACHE_MAX_ENTRIES
+    deleted, _ = ResponseCacheDB.objects.filter(expires_at__lte=timezone.now()).delete()
+
+    overflow = list(
+        ResponseCacheDB.objects
+        .order_by(Coalesce('last_hit_at', 'created_at').desc())
+        .values_list('id', flat=True)[max_entries:]
+    )
+    if overflow:
+        evicted, _ = ResponseCacheDB.objects.filter(id__in=overflow).delete()
+        deleted += evicted
+    return deleted
+
+class CachedLLMService(LLMService):
+    """Semantic response cache in front of an LLMService.
+
+    Only conversations with at most ``max_user_turns`` user messages are
+    cached, since deeper history can change the answer. A cached answer is
+    served when the system prompt (with its language), the RAG context and the
+    model match exactly and the latest user message is at least
+    ``similarity`` cosine-similar to the cached question. Questions with
+    digits or emails (see ``IDENTIFIER``) skip the similarity search and
+    only match an identical cached question. The question
+    embedding is the same one the RAG retrieval just asked for, so a lookup
+    normally costs a single indexed query.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        rag_service: RAGRetrieveService,
+        similarity: Optional[float] = None,
+        ttl: Optional[int] = None,
+        max_user_turns: Optional[int] = None
+    ):
+        self._llm_service = llm_service
+        self._rag_service = rag_service
+        self._similarity = similarity if similarity is not None else settings.RESPONSE_CACHE_SIMILARITY
+        self._ttl = ttl if ttl is not None else settings.RESPONSE_CACHE_TTL
+        self._max_user_turns = max_user_turns if max_user_turns is not None else settings.RESPONSE_CACHE_MAX_USER_TURNS
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats = {"hits": 0, "misses": 0, "bypassed": 0}
+
+    def generate_response(self, conversation: ConversationEntity) -> MessageEntity:
+        key = self._make_key(conversation)
+        cached = self._find(key)
+        if cached is not None:
+            return self._cached_message(cached)
+
+        response = self._llm_service.generate_response(conversation)
+        self._store(key, response.content)
+        return response
+
+    async def agenerate_response(self, conversation: ConversationEntity) -> MessageEntity:
+        key = await self._amake_key(conversation)
+        cached = await sync_to_async(self._find)(key)
+        if cached is not None:
+            return self._cached_message(cached)
+
+        response = await self._llm_service.agenerate_response(conversation)
+        await sync_to_async(self._store)(key, response.content)
+        return response
+
+    def generate_structured_response(self, conversation: ConversationEntity, schema: ResponseSchema) -> MessageEntity:
+        return self._llm_service.generate_structured_response(conversation, schema)
+
+    async def agenerate_structured_response(self, conversation: ConversationEntity, schema: ResponseSchema) -> MessageEntity:
+        return await self._llm_service.agenerate_structured_response(conversation, schema)
+
+    def generate_response_stream(self, conversation: ConversationEntity) -> Iterator[str]:
+        key = self._make_key(conversation)
+        cached = self._find(key)
+        if cached is not None:
+            yield cached
+            return
+
+        deltas = []
+        for delta in self._llm_service.generate_response_stream(conversation):
+            deltas.append(delta)
+            yield delta
+        self._store(key, "".join(deltas))
+
+    async def agenerate_response_stream(self, conversation: ConversationEntity) -> AsyncIterator[str]:
+        key = await self._amake_key(conversation)
+        cached = await sync_to_async(self._find)(key)
+        if cached is not None:
+            yield cached
+            return
+
+        deltas = []
+        async for delta in self._llm_service.agenerate_response_stream(conversation):
+            deltas.append(delta)
+            yield delta
+        await sync_to_async(self._store)(key, "".join(deltas))
+
+    def generate_transcription(self, audio_file: bytes) -> str:
+        return self._llm_service.generate_transcription(audio_file)
+
+    async def agenerate_transcription(self, audio_file: bytes) -> str:
+        return await self._llm_service.agenerate_transcription(audio_file)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _question(self, conversation: ConversationEntity) -> Optional[str]:
+        """Returns the latest user message when the conversation is shallow enough to cache."""
+        if conversation.memory_summary:
+            return None
+
+        user_messages = [msg for msg in conversation.messages if msg.role == MessageRole.USER]
+        if not user_messages or len(user_messages) > self._max_user_turns:
+            return None
+        return user_messages[-1].content
+
+    def _make_key(self, conversation: ConversationEntity) -> Optional[CacheKey]:
+        question = self._question(conversation)
+        if question is None:
+            self._record("bypassed")
+            return None
+
+        try:
+            return self._build_key(conversation, question, self._rag_service.get_embedding(question))
+        except Exception as e:
+            logger.warning(f"Response cache bypassed, embedding failed: {e}")
+            self._record("bypassed")
+            return None
+
+    async def _amake_key(self, conversation: ConversationEntity) -> Optional[CacheKey]:
+        question = self._question(conversation)
+        if question is None:
+            self._record("bypassed")
+            return None
+
+        try:
+            return self._build_key(conversation, question, await self._rag_service.aget_embedding(question))
+        except Exception as e:
+            logger.warning(f"Response cache bypassed, embedding failed: {e}")
+            self._record("bypassed")
+            return None
+
+    @staticmethod
+    def _build_key(conversation: ConversationEntity, question: str, embedding: List[float]) -> CacheKey:
+        system_prompt = conversation.get_system_prompt()
+        return CacheKey(
+            prompt_hash=_hash(f"{system_prompt.content if system_prompt else ''}\n{conversation.language}"),
+            context_hash=_hash(conversation.rag_context or ""),
+            model=conversation.model,
+            question=question,
+            embedding=embedding,
+            exact_only=IDENTIFIER.search(question) is not None
+        )
+
+    def _find(self, key: Optional[CacheKey]) -> Optional[str]:
+        if key is None:
+            return None
+
+        try:
+            entries = ResponseCacheDB.objects.filter(
+                prompt_hash=key.prompt_hash,
+                context_hash=key.context_hash,
+                model=key.model,
+                expires_at__gt=timezone.now()
+            )
+            if key.exact_only:
+                entries = entries.filter(question=key.question).order_by('-created_at')
+            else:
+                entries = (
+                    entries
+                    .annotate(distance=CosineDistance('embedding', key.embedding))
+                    .filter(distance__lte=1 - self._similarity)
+                    .order_by('distance')
+                )
+            entry = entries.only('id', 'response').first()
+            if entry is None:
+                self._record("misses")
+                return None
+
+            ResponseCacheDB.objects.filter(id=entry.id).update(hits=F('hits') + 1, last_hit_at=timezone.now())
+            self._record("hits")
+            logger.info(f"Response cache hit, stats: {self.stats()}")
+            return entry.response
+        except Exception as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            self._record("misses")
+            return None
+
+    def _store(self, key: Optional[CacheKey], response: str) -> None:
+        if key is None or not response:
+            return
+
+        try:
+            ResponseCacheDB.objects.create(
+                prompt_hash=key.prompt_hash,
+                context_hash=key.context_hash,
+                model=key.model,
+                question=key.question,
+                embedding=key.embedding,
+                response=response,
+                expires_at=timezone.now() + timedelta(seconds=self._ttl)
+            )
+            with self._lock:
+                self._writes += 1
+                evict = self._writes % EVICT_EVERY == 0
+            if evict:
+                evict_response_cache()
+            logger.info(f"Response cache miss stored, stats: {self.stats()}")
+        except Exception as e:
+            logger.warning(f"Response cache store failed: {e}")
+
+    def _record(self, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+
+    @staticmethod
+    def _cached_message(content: str) -> MessageEntity:
+        return MessageEntity(content=content, role=MessageRole.ASSISTANT)
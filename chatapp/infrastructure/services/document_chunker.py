@@ -0,0 +1,55 @@
+import hashlib
+from dataclasses import dataclass
+from typing import List
+
+from chatapp.domain.services.token_counter import ENCODING_MODEL, get_encoding
+
+DEFAULT_CHUNK_TOKENS = 800
+DEFAULT_OVERLAP_TOKENS = 100
+
+@dataclass
+class DocumentChunk:
+    index: int
+    content: str
+    token_count: int
+
+    @property
+    def content_hash(self) -> str:
+        return hash_content(self.content)
+
+def hash_content(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def chunk_text(
+    text: str,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+    encoding_name: str = ENCODING_MODEL
+) -> List[DocumentChunk]:
+    if chunk_tokens <= 0:
+        raise ValueError("chunk_tokens must be positive")
+    if not 0 <= overlap_tokens < chunk_tokens:
+        raise ValueError("overlap_tokens must be between 0 and chunk_tokens")
+
+    encoding = get_encoding(encoding_name)
+    tokens = encoding.encode(text)
+    step = chunk_tokens - overlap_tokens
+
+    # Windows are cut on character offsets, not by decoding token slices: a token
+    # boundary can fall inside a multi-byte character (accents, ñ), which would
+    # decode to U+FFFD. A window starting mid-character takes the whole
+    # character; one ending mid-character leaves it to the next window.
+    text, offsets = encoding.decode_with_offsets(tokens)
+    offsets.append(len(text))
+
+    chunks = []
+    for start in range(0, len(tokens), step):
+        end = min(start + chunk_tokens, len(tokens))
+        content = text[offsets[start]:offsets[end]].strip()
+        if content:
+            chunks.append(DocumentChunk(index=len(chunks), content=content, token_count=end - start))
+
+        if start + chunk_tokens >= len(tokens):
+            break
+
+    return chunks
@@ -0,0 +1,127 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+class EmbeddingCache:
+    """Two-tier cache for query embeddings.
+
+    The first tier is an in-process LRU with TTL; the optional second tier is a
+    Django cache shared by every worker (by default a Postgres-backed
+    DatabaseCache, see ``CACHES['embeddings']``). Keys are the normalized text
+    plus the embedding model, so the same question asked twice only pays for
+    one embeddings API round-trip.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[int] = None,
+        shared_cache: Optional[BaseCache] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._max_size = max_size if max_size is not None else settings.EMBEDDING_CACHE_MAX_SIZE
+        self._ttl = ttl if ttl is not None else settings.EMBEDDING_CACHE_TTL
+        if shared_cache is None and settings.EMBEDDING_CACHE_SHARED:
+            shared_cache = caches['embeddings']
+        self._shared_cache = shared_cache
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join(text.split()).lower()
+
+    def make_key(self, text: str, model: str) -> str:
+        digest = hashlib.sha256(f"{model}:{self.normalize(text)}".encode("utf-8")).hexdigest()
+        return f"embedding:{digest}"
+
+    def get(self, text: str, model: str) -> Optional[List[float]]:
+        key = self.make_key(text, model)
+
+        embedding = self._get_local(key)
+        if embedding is not None:
+            self._record("local_hits")
+            return embedding
+
+        if self._shared_cache is not None:
+            embedding = self._shared_cache.get(key)
+            if embedding is not None:
+                self._set_local(key, embedding)
+                self._record("shared_hits")
+                return embedding
+
+        self._record("misses")
+        return None
+
+    async def aget(self, text: str, model: str) -> Optional[List[float]]:
+        key = self.make_key(text, model)
+
+        embedding = self._get_local(key)
+        if embedding is not None:
+            self._record("local_hits")
+            return embedding
+
+        if self._shared_cache is not None:
+            embedding = await self._shared_cache.aget(key)
+            if embedding is not None:
+                self._set_local(key, embedding)
+                self._record("shared_hits")
+                return embedding
+
+        self._record("misses")
+        return None
+
+    def set(self, text: str, model: str, embedding: List[float]) -> None:
+        key = self.make_key(text, model)
+        self._set_local(key, embedding)
+        if self._shared_cache is not None:
+            self._shared_cache.set(key, embedding, timeout=self._ttl)
+
+    async def aset(self, text: str, model: str, embedding: List[float]) -> None:
+        key = self.make_key(text, model)
+        self._set_local(key, embedding)
+        if self._shared_cache is not None:
+            await self._shared_cache.aset(key, embedding, timeout=self._ttl)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["local_hits"] + stats["shared_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["local_hits"] + stats["shared_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def _get_local(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, embedding = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return embedding
+
+    def _set_local(self, key: str, embedding: List[float]) -> None:
+        if self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl, embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def _record(self, counter: str) -> None:
+        with self._lock:
+            self._stats[counter] += 1
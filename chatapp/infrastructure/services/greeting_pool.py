@@ -0,0 +1,115 @@
+import hashlib
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+from django.conf import settings
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.domain.services.greeting_service import GreetingService
+from chatapp.domain.services.llm_service import LLMService
+from chatapp.domain.services.model_router import LLMTask, ModelRouter, route_conversation
+from chatapp.infrastructure.services.llm_scheduler import LLMPriority, llm_priority
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PoolEntry:
+    prompt_hash: str
+    greetings: List[str]
+    created_at: float
+
+class GreetingPool(GreetingService):
+    """Per-language pool of opening messages generated in the background.
+
+    The opening message only depends on the system prompt and the language, so
+    a few variants per language are generated once and served at random. A
+    pool built for another system prompt (its hash changed) or older than
+    ``ttl`` is regenerated in the background; until a pool is ready callers get
+    ``None`` and fall back to generating the greeting themselves. Greetings go
+    through ``model_router`` like the ones generated on demand.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        variants: Optional[int] = None,
+        ttl: Optional[int] = None,
+        languages: Optional[List[str]] = None,
+        executor: Optional[Executor] = None,
+        clock: Callable[[], float] = time.monotonic,
+        model_router: Optional[ModelRouter] = None
+    ):
+        self._llm_service = llm_service
+        self._model_router = model_router
+        self._variants = variants if variants is not None else settings.GREETING_POOL_VARIANTS
+        self._ttl = ttl if ttl is not None else settings.GREETING_POOL_TTL
+        self._languages = languages if languages is not None else settings.GREETING_POOL_LANGUAGES
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="greeting-pool")
+        self._clock = clock
+        self._entries: Dict[str, PoolEntry] = {}
+        self._refreshing: Set[Tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def get_greeting(self, system_prompt: str, language: str) -> Optional[str]:
+        prompt_hash = self._hash(system_prompt)
+        with self._lock:
+            entry = self._entries.get(language)
+
+        if entry is None or entry.prompt_hash != prompt_hash:
+            self._refresh(system_prompt, language)
+            return None
+
+        if self._clock() - entry.created_at > self._ttl:
+            self._refresh(system_prompt, language)
+        return random.choice(entry.greetings)
+
+    def prefetch(self, system_prompt: str) -> None:
+        for language in self._languages:
+            self._refresh(system_prompt, language)
+
+    def _refresh(self, system_prompt: str, language: str) -> None:
+        key = (self._hash(system_prompt), language)
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._executor.submit(self._generate, system_prompt, language)
+
+    def _generate(self, system_prompt: str, language: str) -> None:
+        prompt_hash = self._hash(system_prompt)
+        try:
+            with llm_priority(LLMPriority.BATCH):
+                greetings = [
+                    self._llm_service.generate_response(route_conversation(
+                        self._model_router, self._new_conversation(system_prompt, language), LLMTask.GREETING
+                    )).content
+                    for _ in range(self._variants)
+                ]
+            with self._lock:
+                self._entries[language] = PoolEntry(prompt_hash=prompt_hash, greetings=greetings, created_at=self._clock())
+            logger.info(f"Greeting pool ready for '{language}' ({len(greetings)} variants)")
+        except Exception as e:
+            logger.warning(f"Failed to generate greetings for '{language}': {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard((prompt_hash, language))
+
+    @staticmethod
+    def _new_conversation(system_prompt: str, language: str) -> ConversationEntity:
+        # Greetings are generated before any user exists, so a throwaway user stands in.
+        conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="greeting-pool"))
+        conversation.update_language(language)
+        conversation.update_system_prompt(MessageEntity(role=MessageRole.SYSTEM, content=system_prompt))
+        return conversation
+
+    @staticmethod
+    def _hash(system_prompt: str) -> str:
+        return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
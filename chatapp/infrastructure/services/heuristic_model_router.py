@@ -0,0 +1,89 @@
+import logging
+import re
+import threading
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.services.model_registry import get_model_spec
+from chatapp.domain.services.model_router import LLMTask, ModelRouter, RoutingDecision
+from chatapp.domain.services.token_counter import count_tokens
+
+# Support turns that usually need more than a lookup: disputes, money, legal
+# threats, multi-step reasoning. Spanish and English, matched on word starts.
+COMPLEX_MESSAGE = re.compile(
+    r"\b("
+    r"refund|reembols|chargeback|charged twice|cobr|complain|queja|reclam|"
+    r"lawyer|abogad|legal|denunci|fraud|fraude|"
+    r"cancel|damaged|dañad|broken|missing|perdid|"
+    r"why|por ?qu[eé]|explain|expl[ií]ca|compar|difference|diferencia|"
+    r"step by step|paso a paso"
+    r")",
+    re.IGNORECASE
+)
+
+logger = logging.getLogger(__name__)
+
+class HeuristicModelRouter(ModelRouter):
+    """Sends simple turns to a small model and everything else to a large one.
+
+    Extraction always uses the large model, since its output is parsed. Any
+    prompt above ``max_prompt_tokens`` (or beyond the small model's window)
+    goes to the large model. Greetings, summaries and memory folds otherwise go
+    to the small model. Chat turns do too, unless the latest user message is
+    longer than ``max_message_tokens``, asks more than one question or
+    matches ``COMPLEX_MESSAGE``. Every decision is logged and counted in
+    ``stats()``.
+    """
+
+    def __init__(
+        self,
+        small_model: Optional[str] = None,
+        large_model: Optional[str] = None,
+        max_prompt_tokens: Optional[int] = None,
+        max_message_tokens: Optional[int] = None
+    ):
+        self._small_model = small_model or settings.MODEL_ROUTER_SMALL_MODEL
+        self._large_model = large_model or settings.MODEL_ROUTER_LARGE_MODEL
+        max_prompt_tokens = max_prompt_tokens if max_prompt_tokens is not None else settings.MODEL_ROUTER_MAX_PROMPT_TOKENS
+        # Unknown models fail here, at startup, rather than on the first call.
+        small_spec = get_model_spec(self._small_model)
+        get_model_spec(self._large_model)
+        self._max_prompt_tokens = min(max_prompt_tokens, small_spec.get_prompt_budget())
+        self._max_message_tokens = max_message_tokens if max_message_tokens is not None else settings.MODEL_ROUTER_MAX_MESSAGE_TOKENS
+        self._small_encoding = small_spec.encoding
+        self._lock = threading.Lock()
+        self._stats: Counter = Counter()
+
+    def route(self, conversation: ConversationEntity, task: LLMTask) -> RoutingDecision:
+        prompt_tokens = conversation.get_memory_token_count()
+        model, reason = self._choose(conversation, task, prompt_tokens)
+        decision = RoutingDecision(task=task, model=model, prompt_tokens=prompt_tokens, reason=reason)
+
+        with self._lock:
+            self._stats[(task.value, model)] += 1
+        logger.info(f"Routed {task.value} of conversation {conversation.id} to {model} ({reason}, {prompt_tokens} prompt tokens)")
+        return decision
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {f"{task}:{model}": count for (task, model), count in self._stats.items()}
+
+    def _choose(self, conversation: ConversationEntity, task: LLMTask, prompt_tokens: int) -> Tuple[str, str]:
+        if task == LLMTask.EXTRACTION:
+            return self._large_model, "extraction"
+        if prompt_tokens > self._max_prompt_tokens:
+            return self._large_model, "long_prompt"
+        if task != LLMTask.CHAT:
+            return self._small_model, task.value
+
+        message = conversation.get_last_user_message()
+        if message is None:
+            return self._small_model, "no_user_message"
+        if count_tokens(message.content, self._small_encoding) > self._max_message_tokens:
+            return self._large_model, "long_message"
+        if message.content.count("?") > 1 or COMPLEX_MESSAGE.search(message.content):
+            return self._large_model, "complex_message"
+        return self._small_model, "simple_message"
@@ -1,11 +1,17 @@
 import os
 import logging
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError, AuthenticationError, APITimeoutError, InternalServerError
+from typing import Any, AsyncIterator, Dict, Iterator, List, NoReturn, Optional
+from openai import OpenAI, AsyncOpenAI, Stream, APIError, RateLimitError, APIConnectionError, AuthenticationError, APITimeoutError, InternalServerError
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 import tempfile
 from chatapp.domain.exceptions.llm.generic_error import LLMGenericError
 from chatapp.domain.entities.conversation import ConversationEntity
 from chatapp.domain.entities.message import MessageEntity
+from chatapp.domain.models.llm_message_model import LLMMessage
+from chatapp.domain.models.response_schema import ResponseSchema
+from chatapp.domain.services.model_registry import get_model_spec
+from chatapp.domain.services.token_counter import count_tokens
 from chatapp.infrastructure.models.llm_data_response import LLMDataServiceResponse
 from chatapp.infrastructure.models.llm_data_response_mapper import LLMDataResponseMapper
 from chatapp.domain.services.llm_service import LLMService
@@ -13,13 +19,23 @@ from chatapp.domain.exceptions.llm.authentication_error import LLMAuthentication
 from chatapp.domain.exceptions.llm.rate_limit_error import LLMRateLimitError
 from chatapp.domain.exceptions.llm.connection_error import LLMConnectionError
 from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.infrastructure.services.llm_scheduler import LLMEndpoint, LLMScheduler
 
 TEMPERATURE = 0.7
+# Structured responses are parsed, so they are generated deterministically.
+STRUCTURED_TEMPERATURE = 0.0
+TEXT_RESPONSE_FORMAT = {"type": "text"}
+TRANSCRIPTION_MODEL = "whisper-1"
+TRANSCRIPTION_FILENAME = "audio.mp3"
+# Rate-limit estimate of a chat call: prompt tokens, per-message framing and a typical answer
+# (capped at the model's output limit).
+MESSAGE_TOKENS_OVERHEAD = 4
+COMPLETION_TOKENS_ESTIMATE = 512
 
 logger = logging.getLogger(__name__)
 
 class LLMDataService(LLMService):
-    def __init__(self):
+    def __init__(self, scheduler: Optional[LLMScheduler] = None):
         apiKey = os.getenv("OPENAI_API_KEY")
         if not apiKey:
             raise LLMAuthenticationError(
@@ -27,90 +43,265 @@ class LLMDataService(LLMService):
                 details={"env_var": "OPENAI_API_KEY"}
             )
         self.client = OpenAI(api_key=apiKey)
+        self.async_client = AsyncOpenAI(api_key=apiKey)
+        self.scheduler = scheduler
         logger.info("LLMDataService initialized successfully")
 
+    def generate_response(self, conversation: ConversationEntity) -> MessageEntity:
+        return self._complete(conversation, TEXT_RESPONSE_FORMAT, TEMPERATURE)
+
+    async def agenerate_response(self, conversation: ConversationEntity) -> MessageEntity:
+        return await self._acomplete(conversation, TEXT_RESPONSE_FORMAT, TEMPERATURE)
+
+    def generate_structured_response(self, conversation: ConversationEntity, schema: ResponseSchema) -> MessageEntity:
+        return self._complete(conversation, self._json_schema_format(schema), STRUCTURED_TEMPERATURE)
+
+    async def agenerate_structured_response(self, conversation: ConversationEntity, schema: ResponseSchema) -> MessageEntity:
+        return await self._acomplete(conversation, self._json_schema_format(schema), STRUCTURED_TEMPERATURE)
+
+    def _complete(self, conversation: ConversationEntity, response_format: Dict[str, Any], temperature: float) -> MessageEntity:
+        try:
+            openaiResponse = self._create_completion(conversation, response_format, temperature)
+
+            self._log_usage(conversation.model, openaiResponse)
+            response = LLMDataResponseMapper.to_domain(LLMDataServiceResponse(openaiResponse))
+            logger.info(f"Response generated successfully: {response.content[:50]}...")
+            return response
+
+        except Exception as e:
+            # Only reached once the retries are exhausted, or for errors that are not retried.
+            self._raise_response_error(e)
+
+    async def _acomplete(self, conversation: ConversationEntity, response_format: Dict[str, Any], temperature: float) -> MessageEntity:
+        try:
+            openaiResponse = await self._acreate_completion(conversation, response_format, temperature)
+
+            self._log_usage(conversation.model, openaiResponse)
+            response = LLMDataResponseMapper.to_domain(LLMDataServiceResponse(openaiResponse))
+            logger.info(f"Response generated successfully: {response.content[:50]}...")
+            return response
+
+        except Exception as e:
+            self._raise_response_error(e)
+
+    # The OpenAI errors must escape these calls for the retries to see them; every
+    # attempt goes through the scheduler again.
     @retry(
         retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         reraise=True
     )
-    def generate_response(self, conversation: ConversationEntity) -> MessageEntity:
+    def _create_completion(self, conversation: ConversationEntity, response_format: Dict[str, Any], temperature: float) -> ChatCompletion:
+        messages = conversation.get_memory()
+        self._acquire_chat(messages, conversation.model)
+        return self.client.chat.completions.create(
+            model=conversation.model,
+            messages=messages,
+            temperature=temperature,
+            response_format=response_format
+        )
+
+    @retry(
+        retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        reraise=True
+    )
+    async def _acreate_completion(self, conversation: ConversationEntity, response_format: Dict[str, Any], temperature: float) -> ChatCompletion:
+        messages = conversation.get_memory()
+        await self._aacquire_chat(messages, conversation.model)
+        return await self.async_client.chat.completions.create(
+            model=conversation.model,
+            messages=messages,
+            temperature=temperature,
+            response_format=response_format
+        )
+
+    @retry(
+        retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        reraise=True
+    )
+    def _create_completion_stream(self, conversation: ConversationEntity) -> Stream[ChatCompletionChunk]:
+        messages = conversation.get_memory()
+        self._acquire_chat(messages, conversation.model)
+        return self.client.chat.completions.create(
+            model=conversation.model,
+            messages=messages,
+            temperature=TEMPERATURE,
+            response_format=TEXT_RESPONSE_FORMAT,
+            stream=True
+        )
+
+    def generate_response_stream(self, conversation: ConversationEntity) -> Iterator[str]:
         try:
-            openaiResponse = self.client.chat.completions.create(
-                model=conversation.model,
-                messages=conversation.get_memory(),
-                temperature=TEMPERATURE,
-                response_format={"type": "text"}
-            )
+            stream = self._create_completion_stream(conversation)
 
-            response = LLMDataResponseMapper.to_domain(LLMDataServiceResponse(openaiResponse))
-            logger.info(f"Response generated successfully: {response.content[:50]}...")
-            return response
+            for chunk in stream:
+                delta = self._get_chunk_delta(chunk)
+                if delta:
+                    yield delta
 
-        except AuthenticationError as e:
-            logger.error(f"Error authenticating with OpenAI: {str(e)}")
-            raise LLMAuthenticationError(details={"original_error": str(e)})
+            logger.info("Response stream completed successfully")
 
-        except RateLimitError as e:
-            logger.error(f"Rate limit exceeded: {str(e)}")
-            raise LLMRateLimitError(details={"original_error": str(e)})
+        except Exception as e:
+            self._raise_response_error(e)
 
-        except APIConnectionError as e:
-            logger.error(f"Connection error with OpenAI: {str(e)}")
-            raise LLMConnectionError(details={"original_error": str(e)})
+    @retry(
+        retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        reraise=True
+    )
+    async def _acreate_completion_stream(self, conversation: ConversationEntity):
+        messages = conversation.get_memory()
+        await self._aacquire_chat(messages, conversation.model)
+        return await self.async_client.chat.completions.create(
+            model=conversation.model,
+            messages=messages,
+            temperature=TEMPERATURE,
+            response_format=TEXT_RESPONSE_FORMAT,
+            stream=True
+        )
 
-        except APIError as e:
-            logger.error(f"Error in the OpenAI API: {str(e)}")
-            raise LLMConnectionError(
-                message=f"Error in the OpenAI API: {str(e)}",
-                details={"original_error": str(e)}
-            )
+    async def agenerate_response_stream(self, conversation: ConversationEntity) -> AsyncIterator[str]:
+        try:
+            stream = await self._acreate_completion_stream(conversation)
+
+            async for chunk in stream:
+                delta = self._get_chunk_delta(chunk)
+                if delta:
+                    yield delta
+
+            logger.info("Response stream completed successfully")
 
         except Exception as e:
-            logger.exception("Unexpected error processing the message")
-            raise LLMGenericError(
-                message="Unexpected error processing the message",
-                details={"original_error": str(e)}
-            )
+            self._raise_response_error(e)
 
     def generate_transcription(self, audio_file: bytes) -> str:
+        if self.scheduler is not None:
+            self.scheduler.acquire(LLMEndpoint.TRANSCRIPTION)
         try:
             with tempfile.NamedTemporaryFile(suffix='.mp3', delete=True) as temp_file:
                 temp_file.write(audio_file)
                 temp_file.flush()
-                
+
                 with open(temp_file.name, 'rb') as audio:
                     response = self.client.audio.transcriptions.create(
-                        model="whisper-1",
+                        model=TRANSCRIPTION_MODEL,
                         file=audio,
                         response_format="text"
                     )
-                    
+
                     return response
 
-        except AuthenticationError as e:
+        except Exception as e:
+            self._raise_transcription_error(e)
+
+    async def agenerate_transcription(self, audio_file: bytes) -> str:
+        if self.scheduler is not None:
+            await self.scheduler.aacquire(LLMEndpoint.TRANSCRIPTION)
+        try:
+            return await self.async_client.audio.transcriptions.create(
+                model=TRANSCRIPTION_MODEL,
+                file=(TRANSCRIPTION_FILENAME, audio_file),
+                response_format="text"
+            )
+
+        except Exception as e:
+            self._raise_transcription_error(e)
+
+    def _acquire_chat(self, messages: List[LLMMessage], model: Optional[str]) -> None:
+        if self.scheduler is not None:
+            self.scheduler.acquire(LLMEndpoint.CHAT, self._estimate_tokens(messages, model))
+
+    async def _aacquire_chat(self, messages: List[LLMMessage], model: Optional[str]) -> None:
+        if self.scheduler is not None:
+            await self.scheduler.aacquire(LLMEndpoint.CHAT, self._estimate_tokens(messages, model))
+
+    @staticmethod
+    def _estimate_tokens(messages: List[LLMMessage], model: Optional[str]) -> int:
+        spec = get_model_spec(model)
+        prompt_tokens = sum(count_tokens(message["content"], spec.encoding) + MESSAGE_TOKENS_OVERHEAD for message in messages)
+        return prompt_tokens + min(COMPLETION_TOKENS_ESTIMATE, spec.max_output_tokens)
+
+    @staticmethod
+    def _log_usage(model: Optional[str], completion) -> None:
+        usage = getattr(completion, "usage", None)
+        if usage is None:
+            return
+        cost = get_model_spec(model).estimate_cost(usage.prompt_tokens, usage.completion_tokens)
+        logger.info(f"{model}: {usage.prompt_tokens} prompt + {usage.completion_tokens} completion tokens, ~${cost:.5f}")
+
+    @staticmethod
+    def _json_schema_format(schema: ResponseSchema) -> Dict[str, Any]:
+        return {
+            "type": "json_schema",
+            "json_schema": {"name": schema.name, "schema": schema.schema, "strict": True}
+        }
+
+    @staticmethod
+    def _get_chunk_delta(chunk: ChatCompletionChunk) -> str:
+        if not chunk.choices:
+            return ""
+        return chunk.choices[0].delta.content or ""
+
+    @staticmethod
+    def _raise_response_error(e: Exception) -> NoReturn:
+        if isinstance(e, LLMRateLimitError):
+            raise e
+
+        if isinstance(e, AuthenticationError):
+            logger.error(f"Error authenticating with OpenAI: {str(e)}")
+            raise LLMAuthenticationError(details={"original_error": str(e)})
+
+        if isinstance(e, RateLimitError):
+            logger.error(f"Rate limit exceeded: {str(e)}")
+            raise LLMRateLimitError(details={"original_error": str(e)})
+
+        if isinstance(e, APIConnectionError):
+            logger.error(f"Connection error with OpenAI: {str(e)}")
+            raise LLMConnectionError(details={"original_error": str(e)})
+
+        if isinstance(e, APIError):
+            logger.error(f"Error in the OpenAI API: {str(e)}")
+            raise LLMConnectionError(
+                message=f"Error in the OpenAI API: {str(e)}",
+                details={"original_error": str(e)}
+            )
+
+        logger.exception("Unexpected error processing the message")
+        raise LLMGenericError(
+            message="Unexpected error processing the message",
+            details={"original_error": str(e)}
+        )
+
+    @staticmethod
+    def _raise_transcription_error(e: Exception) -> NoReturn:
+        if isinstance(e, AuthenticationError):
             logger.error(f"Error authenticating with OpenAI: {str(e)}")
             raise LLMAuthenticationError(
                 message="Invalid API key",
                 details={"original_error": str(e)}
             )
 
-        except RateLimitError as e:
+        if isinstance(e, RateLimitError):
             logger.error(f"Rate limit exceeded: {str(e)}")
             raise LLMRateLimitError(
                 message="Too many requests",
                 details={"original_error": str(e)}
             )
 
-        except APIConnectionError as e:
+        if isinstance(e, APIConnectionError):
             logger.error(f"Connection error with OpenAI: {str(e)}")
             raise LLMConnectionError(
                 message="Could not connect to OpenAI",
                 details={"original_error": str(e)}
             )
 
-        except APIError as e:
+        if isinstance(e, APIError):
             logger.error(f"Error in the OpenAI API: {str(e)}")
             if "invalid file format" in str(e).lower():
                 raise ValidationError(
@@ -122,9 +313,8 @@ class LLMDataService(LLMService):
                 details={"original_error": str(e)}
             )
 
-        except Exception as e:
-            logger.exception("Unexpected error processing audio")
-            raise LLMGenericError(
-                message="Unexpected error during transcription",
-                details={"original_error": str(e)}
-            )
\ No newline at end of file
+        logger.exception("Unexpected error processing audio")
+        raise LLMGenericError(
+            message="Unexpected error during transcription",
+            details={"original_error": str(e)}
+        )
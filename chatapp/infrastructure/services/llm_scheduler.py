@@ -0,0 +1,202 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Callable, Dict, Iterator, List, NoReturn, Optional, Tuple
+
+from django.conf import settings
+
+from chatapp.domain.exceptions.llm.rate_limit_error import LLMRateLimitError
+from chatapp.infrastructure.services.rate_limiter import RateLimiter
+
+# Shortest sleep of a caller waiting behind others, so it notices when its turn comes.
+POLL_INTERVAL = 0.05
+
+logger = logging.getLogger(__name__)
+
+class LLMEndpoint(Enum):
+    CHAT = "chat"
+    EMBEDDINGS = "embeddings"
+    TRANSCRIPTION = "transcription"
+
+class LLMPriority(IntEnum):
+    INTERACTIVE = 0
+    BATCH = 1
+
+_priority: ContextVar[LLMPriority] = ContextVar("llm_priority", default=LLMPriority.INTERACTIVE)
+
+@contextmanager
+def llm_priority(priority: LLMPriority) -> Iterator[None]:
+    """Runs the block's OpenAI calls in the given priority class (interactive by default)."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+def current_priority() -> LLMPriority:
+    return _priority.get()
+
+@dataclass(order=True)
+class _Ticket:
+    priority: int
+    sequence: int
+    requests: int = field(compare=False)
+    tokens: int = field(compare=False)
+    deadline: float = field(compare=False)
+
+class LLMScheduler:
+    """Process-wide admission control for OpenAI calls.
+
+    Every endpoint has its own requests-per-minute and tokens-per-minute
+    buckets. Callers queue per endpoint ordered by priority class, then
+    arrival, and only the head of the queue may take capacity, so interactive
+    turns overtake batch summaries. A caller whose expected wait exceeds the
+    deadline of its priority class is rejected up front with
+    ``LLMRateLimitError`` instead of sleeping into a timeout.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[LLMEndpoint, Tuple[Optional[int], Optional[int]]]] = None,
+        deadlines: Optional[Dict[LLMPriority, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        if limits is None:
+            limits = {
+                LLMEndpoint.CHAT: (settings.LLM_CHAT_RPM, settings.LLM_CHAT_TPM),
+                LLMEndpoint.EMBEDDINGS: (settings.LLM_EMBEDDINGS_RPM, settings.LLM_EMBEDDINGS_TPM),
+                LLMEndpoint.TRANSCRIPTION: (settings.LLM_TRANSCRIPTION_RPM, None),
+            }
+        if deadlines is None:
+            deadlines = {
+                LLMPriority.INTERACTIVE: settings.LLM_INTERACTIVE_DEADLINE,
+                LLMPriority.BATCH: settings.LLM_BATCH_DEADLINE,
+            }
+        self._limiters = {endpoint: RateLimiter(rpm, tpm, clock=clock) for endpoint, (rpm, tpm) in limits.items()}
+        self._queues: Dict[LLMEndpoint, List[_Ticket]] = {endpoint: [] for endpoint in limits}
+        self._deadlines = deadlines
+        self._clock = clock
+        self._sleep = sleep
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._stats = {"granted": 0, "rejected": 0, "waited_seconds": 0.0}
+
+    def acquire(self, endpoint: LLMEndpoint, tokens: int = 0, requests: int = 1) -> float:
+        """Blocks until the call may be sent and returns the seconds spent queued."""
+        ticket = self._admit(endpoint, requests, tokens)
+        waited = 0.0
+        try:
+            while True:
+                delay = self._poll(endpoint, ticket)
+                if delay == 0.0:
+                    self._record(waited)
+                    return waited
+                self._sleep(delay)
+                waited += delay
+        except BaseException:
+            # Cancelled or rejected callers must not hold up the queue behind them.
+            self._discard(endpoint, ticket)
+            raise
+
+    async def aacquire(self, endpoint: LLMEndpoint, tokens: int = 0, requests: int = 1) -> float:
+        ticket = self._admit(endpoint, requests, tokens)
+        waited = 0.0
+        try:
+            while True:
+                delay = self._poll(endpoint, ticket)
+                if delay == 0.0:
+                    self._record(waited)
+                    return waited
+                await asyncio.sleep(delay)
+                waited += delay
+        except BaseException:
+            # Cancelled or rejected callers must not hold up the queue behind them.
+            self._discard(endpoint, ticket)
+            raise
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _admit(self, endpoint: LLMEndpoint, requests: int, tokens: int) -> _Ticket:
+        priority = current_priority()
+        limiter = self._limiters[endpoint]
+        requests, tokens = limiter.fit(requests, tokens)
+
+        with self._lock:
+            queue = self._queues[endpoint]
+            ticket = _Ticket(
+                priority=priority,
+                sequence=next(self._sequence),
+                requests=requests,
+                tokens=tokens,
+                deadline=self._clock() + self._deadlines[priority]
+            )
+            expected_wait = self._expected_wait(limiter, queue, ticket)
+            if expected_wait > self._deadlines[priority]:
+                self._stats["rejected"] += 1
+                self._raise_rejected(endpoint, priority, expected_wait)
+
+            heapq.heappush(queue, ticket)
+            return ticket
+
+    def _poll(self, endpoint: LLMEndpoint, ticket: _Ticket) -> float:
+        """Grants the ticket (returning 0) when it heads the queue and fits, otherwise returns how long to sleep."""
+        limiter = self._limiters[endpoint]
+
+        with self._lock:
+            queue = self._queues[endpoint]
+            if queue[0] is ticket:
+                delay = limiter.try_acquire(ticket.requests, ticket.tokens)
+                if delay == 0.0:
+                    heapq.heappop(queue)
+                    return 0.0
+            else:
+                delay = max(self._expected_wait(limiter, queue, ticket), POLL_INTERVAL)
+
+            # A higher priority class can overtake a queued caller past its deadline.
+            if self._clock() + delay > ticket.deadline:
+                self._stats["rejected"] += 1
+                self._raise_rejected(endpoint, LLMPriority(ticket.priority), delay)
+
+            return delay
+
+    @staticmethod
+    def _expected_wait(limiter: RateLimiter, queue: List[_Ticket], ticket: _Ticket) -> float:
+        ahead = [queued for queued in queue if queued < ticket]
+        return limiter.wait_time(
+            ticket.requests + sum(queued.requests for queued in ahead),
+            ticket.tokens + sum(queued.tokens for queued in ahead)
+        )
+
+    def _discard(self, endpoint: LLMEndpoint, ticket: _Ticket) -> None:
+        with self._lock:
+            queue = self._queues[endpoint]
+            if ticket in queue:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+
+    def _record(self, waited: float) -> None:
+        with self._lock:
+            self._stats["granted"] += 1
+            self._stats["waited_seconds"] += waited
+
+    @staticmethod
+    def _raise_rejected(endpoint: LLMEndpoint, priority: LLMPriority, expected_wait: float) -> NoReturn:
+        logger.warning(f"Rejecting {priority.name.lower()} {endpoint.value} call, expected wait {expected_wait:.1f}s")
+        raise LLMRateLimitError(
+            message="LLM rate limit budget exhausted, try again later",
+            details={
+                "endpoint": endpoint.value,
+                "priority": priority.name.lower(),
+                "expected_wait_seconds": round(expected_wait, 2)
+            }
+        )
@@ -1,18 +1,65 @@
 import os
 import logging
-from typing import List
+from typing import List, NoReturn, Optional
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
 from chatapp.domain.exceptions.llm.authentication_error import LLMAuthenticationError
 from chatapp.domain.exceptions.llm.connection_error import LLMConnectionError
 from chatapp.domain.exceptions.llm.generic_error import LLMGenericError
-from openai import OpenAI, APIError, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
-from pgvector.django import L2Distance
-from chatapp.infrastructure.models.document_db import DocumentDB
+from chatapp.domain.exceptions.llm.rate_limit_error import LLMRateLimitError
+from chatapp.domain.services.rag_retrieve_service import RAGRetrieveService
+from chatapp.domain.services.model_registry import get_model_spec
+from chatapp.domain.services.token_counter import count_tokens
+from pgvector.django import VectorField
+from openai import OpenAI, AsyncOpenAI, APIError, AuthenticationError, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError
+from chatapp.infrastructure.models.document_db import DocumentDB, embedding_operator
+from chatapp.infrastructure.services.embedding_cache import EmbeddingCache
+from chatapp.infrastructure.services.llm_scheduler import LLMEndpoint, LLMScheduler
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_ENCODING = get_model_spec(EMBEDDING_MODEL).encoding
+
+# Nearest neighbours (within the distance cut-off) and full-text matches are
+# ranked separately and merged with reciprocal rank fusion in one round-trip.
+# The text query ORs the query lexemes so a single exact term (an order ID, a
+# SKU) is enough to match.
+HYBRID_SEARCH_SQL = """
+WITH vector_hits AS (
+    SELECT id, distance, row_number() OVER (ORDER BY distance) AS rank
+    FROM (
+        SELECT id, embedding {operator} %(embedding)s::vector AS distance
+        FROM {table}
+        ORDER BY embedding {operator} %(embedding)s::vector
+        LIMIT %(candidates)s
+    ) AS nearest
+    WHERE distance <= %(max_distance)s
+),
+text_hits AS (
+    SELECT id, row_number() OVER (ORDER BY text_rank DESC) AS rank
+    FROM (
+        SELECT id, ts_rank_cd(search_vector, query) AS text_rank
+        FROM {table}, replace(plainto_tsquery(%(config)s::regconfig, %(query)s)::text, ' & ', ' | ')::tsquery AS query
+        WHERE search_vector @@ query
+        ORDER BY text_rank DESC
+        LIMIT %(candidates)s
+    ) AS matches
+)
+SELECT
+    {table}.id, {table}.title, {table}.content, vector_hits.distance,
+    COALESCE(1.0 / (%(rrf_k)s + vector_hits.rank), 0) + COALESCE(1.0 / (%(rrf_k)s + text_hits.rank), 0) AS score
+FROM vector_hits
+FULL OUTER JOIN text_hits ON text_hits.id = vector_hits.id
+JOIN {table} ON {table}.id = COALESCE(vector_hits.id, text_hits.id)
+ORDER BY score DESC
+LIMIT %(k)s
+"""
+
 logger = logging.getLogger(__name__)
 
-class RAGRetrieverService:
-    def __init__(self):
+class RAGRetrieverService(RAGRetrieveService):
+    def __init__(self, embedding_cache: Optional[EmbeddingCache] = None, scheduler: Optional[LLMScheduler] = None):
         apiKey = os.getenv("OPENAI_API_KEY")
         if not apiKey:
             raise LLMAuthenticationError(
@@ -20,59 +67,151 @@ class RAGRetrieverService:
                 details={"env_var": "OPENAI_API_KEY"}
             )
         self.client = OpenAI(api_key=apiKey)
+        self.async_client = AsyncOpenAI(api_key=apiKey)
+        self.embedding_cache = embedding_cache
+        self.scheduler = scheduler
         logger.info("RAGRetrieverService initialized successfully")
 
+    def get_embedding(self, text: str) -> List[float]:
+        if self.embedding_cache is None:
+            return self._create_embedding(text)
+
+        embedding = self.embedding_cache.get(text, EMBEDDING_MODEL)
+        if embedding is None:
+            embedding = self._create_embedding(text)
+            self.embedding_cache.set(text, EMBEDDING_MODEL, embedding)
+            logger.info(f"Embedding cache miss, stats: {self.embedding_cache.stats()}")
+        return embedding
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        if self.embedding_cache is None:
+            return await self._acreate_embedding(text)
+
+        embedding = await self.embedding_cache.aget(text, EMBEDDING_MODEL)
+        if embedding is None:
+            embedding = await self._acreate_embedding(text)
+            await self.embedding_cache.aset(text, EMBEDDING_MODEL, embedding)
+            logger.info(f"Embedding cache miss, stats: {self.embedding_cache.stats()}")
+        return embedding
+
+    def _create_embedding(self, text: str) -> List[float]:
+        try:
+            logger.info("Getting embedding for query")
+            return self._request_embedding(text.replace('\n', ' '))
+        except Exception as e:
+            # Only reached once the retries are exhausted, or for errors that are not retried.
+            self._raise_embedding_error(e)
+
+    async def _acreate_embedding(self, text: str) -> List[float]:
+        try:
+            logger.info("Getting embedding for query")
+            return await self._arequest_embedding(text.replace('\n', ' '))
+        except Exception as e:
+            self._raise_embedding_error(e)
+
+    # The OpenAI errors must escape these calls for the retries to see them; every
+    # attempt goes through the scheduler again.
     @retry(
         retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=4, max=10),
         reraise=True
     )
-    def get_embedding(self, text: str) -> List[float]:
+    def _request_embedding(self, text: str) -> List[float]:
+        if self.scheduler is not None:
+            self.scheduler.acquire(LLMEndpoint.EMBEDDINGS, count_tokens(text, EMBEDDING_ENCODING))
+        response = self.client.embeddings.create(
+            input=[text],
+            model=EMBEDDING_MODEL
+        )
+        return response.data[0].embedding
+
+    @retry(
+        retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        reraise=True
+    )
+    async def _arequest_embedding(self, text: str) -> List[float]:
+        if self.scheduler is not None:
+            await self.scheduler.aacquire(LLMEndpoint.EMBEDDINGS, count_tokens(text, EMBEDDING_ENCODING))
+        response = await self.async_client.embeddings.create(
+            input=[text],
+            model=EMBEDDING_MODEL
+        )
+        return response.data[0].embedding
+
+    def retrieve_context(self, query: str, k: Optional[int] = None) -> str:
         try:
-            logger.info("Getting embedding for query")
-            text=text.replace('\n', ' ')
-            response = self.client.embeddings.create(
-                input=[text],
-                model="text-embedding-3-small"
-            )
-            return response.data[0].embedding
-        except AuthenticationError as e:
+            embedding = self.get_embedding(query)
+
+            docs = self._search_documents(query, embedding, k or settings.RAG_TOP_K)
+
+            logger.info(f"Retrieved {len(docs)} documents")
+            return "\n\n".join([doc.content for doc in docs])
+        except Exception as e:
+            logger.error(f"Failed retrieving context: {e}")
+            return ""
+
+    async def aretrieve_context(self, query: str, k: Optional[int] = None) -> str:
+        try:
+            embedding = await self.aget_embedding(query)
+
+            docs = await sync_to_async(self._search_documents)(query, embedding, k or settings.RAG_TOP_K)
+
+            logger.info(f"Retrieved {len(docs)} documents")
+            return "\n\n".join([doc.content for doc in docs])
+        except Exception as e:
+            logger.error(f"Failed retrieving context: {e}")
+            return ""
+
+    def _search_documents(self, query: str, embedding: List[float], k: int) -> List[DocumentDB]:
+        sql = HYBRID_SEARCH_SQL.format(operator=embedding_operator(), table=DocumentDB._meta.db_table)
+        params = {
+            "embedding": VectorField().get_prep_value(embedding),
+            "query": query,
+            "config": settings.RAG_TEXT_SEARCH_CONFIG,
+            "candidates": max(settings.RAG_CANDIDATES, k),
+            "max_distance": settings.RAG_MAX_DISTANCE,
+            "rrf_k": settings.RAG_RRF_K,
+            "k": k,
+        }
+        with transaction.atomic():
+            self._set_search_parameters()
+            return list(DocumentDB.objects.raw(sql, params))
+
+    @staticmethod
+    def _set_search_parameters() -> None:
+        # SET LOCAL semantics: the knobs only last for the current transaction.
+        with connection.cursor() as cursor:
+            if settings.RAG_VECTOR_INDEX == 'ivfflat':
+                cursor.execute("SELECT set_config('ivfflat.probes', %s, true)", [str(settings.RAG_IVFFLAT_PROBES)])
+            else:
+                cursor.execute("SELECT set_config('hnsw.ef_search', %s, true)", [str(settings.RAG_HNSW_EF_SEARCH)])
+
+    @staticmethod
+    def _raise_embedding_error(e: Exception) -> NoReturn:
+        if isinstance(e, AuthenticationError):
             logger.error(f"Error authenticating with OpenAI: {str(e)}")
             raise LLMAuthenticationError(details={"original_error": str(e)})
 
-        except RateLimitError as e:
+        if isinstance(e, RateLimitError):
             logger.error(f"Rate limit exceeded: {str(e)}")
             raise LLMRateLimitError(details={"original_error": str(e)})
 
-        except APIConnectionError as e:
+        if isinstance(e, APIConnectionError):
             logger.error(f"Connection error with OpenAI: {str(e)}")
             raise LLMConnectionError(details={"original_error": str(e)})
 
-        except APIError as e:
+        if isinstance(e, APIError):
             logger.error(f"Error in the OpenAI API: {str(e)}")
             raise LLMConnectionError(
                 message=f"Error in the OpenAI API: {str(e)}",
                 details={"original_error": str(e)}
             )
 
-        except Exception as e:
-            logger.exception("Unexpected error processing the message")
-            raise LLMGenericError(
-                message="Unexpected error processing the message",
-                details={"original_error": str(e)}
-            )
-
-    def retrieve_context(self, query: str, k: int = 3) -> str:
-        try:
-            embedding = self.get_embedding(query)
-
-            docs = DocumentDB.objects.annotate(
-                distance=L2Distance("embedding", embedding)
-            ).order_by("distance")[:k]
-
-            logger.info(f"Retrieved {len(docs)} documents")
-            return "\n\n".join([doc.content for doc in docs])
-        except Exception as e:
-            logger.error(f"Failed retrieving context: {e}")
-            return ""
\ No newline at end of file
+        logger.exception("Unexpected error processing the message")
+        raise LLMGenericError(
+            message="Unexpected error processing the message",
+            details={"original_error": str(e)}
+        )
@@ -0,0 +1,84 @@
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+class TokenBucket:
+    """Holds up to ``capacity`` units and refills ``capacity`` units per minute."""
+
+    def __init__(self, capacity: int, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.rate = capacity / 60.0
+        self._clock = clock
+        self._available = float(capacity)
+        self._updated_at = clock()
+
+    def refill(self) -> None:
+        now = self._clock()
+        self._available = min(self.capacity, self._available + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        return max(0.0, (amount - self._available) / self.rate)
+
+    def take(self, amount: float) -> None:
+        self._available -= amount
+
+class RateLimiter:
+    """Blocks callers until a request fits both the requests-per-minute and tokens-per-minute budgets.
+
+    A limit of ``None`` (or 0) disables that budget. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self._requests = TokenBucket(requests_per_minute, clock) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, clock) if tokens_per_minute else None
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+    def acquire(self, requests: int = 1, tokens: int = 0) -> float:
+        """Waits for capacity and consumes it; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            delay = self.try_acquire(requests, tokens)
+            if delay == 0.0:
+                return waited
+            self._sleep(delay)
+            waited += delay
+
+    def try_acquire(self, requests: int = 1, tokens: int = 0) -> float:
+        """Consumes capacity if available and returns 0, otherwise returns how long to wait."""
+        requests, tokens = self.fit(requests, tokens)
+        with self._lock:
+            delay = self._wait_time(requests, tokens)
+            if delay == 0.0:
+                for bucket, amount in self._needs(requests, tokens):
+                    bucket.take(amount)
+            return delay
+
+    def wait_time(self, requests: int = 1, tokens: int = 0) -> float:
+        """Seconds until ``requests`` and ``tokens`` would fit, without consuming anything."""
+        with self._lock:
+            return self._wait_time(requests, tokens)
+
+    def fit(self, requests: int, tokens: int) -> Tuple[int, int]:
+        """Caps a single request to the bucket sizes so it can always be served eventually."""
+        if self._requests:
+            requests = min(requests, self._requests.capacity)
+        if self._tokens:
+            tokens = min(tokens, self._tokens.capacity)
+        return requests, tokens
+
+    def _needs(self, requests: int, tokens: int) -> List[Tuple[TokenBucket, int]]:
+        return [(bucket, amount) for bucket, amount in ((self._requests, requests), (self._tokens, tokens)) if bucket]
+
+    def _wait_time(self, requests: int, tokens: int) -> float:
+        needs = self._needs(requests, tokens)
+        for bucket, _ in needs:
+            bucket.refill()
+        return max((bucket.wait_time(amount) for bucket, amount in needs), default=0.0)
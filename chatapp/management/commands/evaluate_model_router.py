@@ -0,0 +1,130 @@
+import json
+from collections import Counter, defaultdict
+from dataclasses import replace
+from typing import Iterator, Optional, Tuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from chatapp.application.create_conversation_summary_use_case import SYSTEM_PROMPT_DATE_EXTRACTION, SYSTEM_PROMPT_SUMMARY
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.services.model_registry import get_model_spec
+from chatapp.domain.services.model_router import LLMTask
+from chatapp.domain.services.token_counter import count_tokens
+from chatapp.infrastructure.models.conversation_db import ConversationDB
+from chatapp.infrastructure.repository.conversation_db_repository import ConversationDBRepository
+from chatapp.infrastructure.services.heuristic_model_router import HeuristicModelRouter
+
+# A replayed call: the conversation as the LLM saw it, the task and the tokens of the answer it got.
+ReplayedCall = Tuple[ConversationEntity, LLMTask, int]
+
+class Command(BaseCommand):
+    help = 'Replays stored conversations through the heuristic model router and estimates its model mix and cost'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=200, help='Most recently updated conversations to replay')
+        parser.add_argument('--small-model', type=str, default=settings.MODEL_ROUTER_SMALL_MODEL, help='Model for simple calls')
+        parser.add_argument('--large-model', type=str, default=settings.MODEL_ROUTER_LARGE_MODEL, help='Model for everything else')
+        parser.add_argument('--max-prompt-tokens', type=int, default=settings.MODEL_ROUTER_MAX_PROMPT_TOKENS, help='Longest prompt the small model gets')
+        parser.add_argument('--max-message-tokens', type=int, default=settings.MODEL_ROUTER_MAX_MESSAGE_TOKENS, help='Longest user message the small model gets')
+        parser.add_argument('--output', type=str, default=None, help='Write every decision as JSON lines to this file, e.g. for labelling')
+
+    def handle(self, *args, **kwargs):
+        router = HeuristicModelRouter(
+            small_model=kwargs['small_model'],
+            large_model=kwargs['large_model'],
+            max_prompt_tokens=kwargs['max_prompt_tokens'],
+            max_message_tokens=kwargs['max_message_tokens']
+        )
+        large_spec = get_model_spec(kwargs['large_model'])
+        repository = ConversationDBRepository()
+
+        conversation_ids = (
+            ConversationDB.objects
+            .order_by('-updated_at')
+            .values_list('id', flat=True)[:kwargs['limit']]
+        )
+
+        decisions = Counter()
+        calls_by_task = defaultdict(Counter)
+        routed_cost, baseline_cost, replayed = 0.0, 0.0, 0
+
+        output = open(kwargs['output'], 'w', encoding='utf-8') if kwargs['output'] else None
+        try:
+            for conversation_id in conversation_ids:
+                conversation = repository.get_by_id(str(conversation_id))
+                if conversation is None:
+                    continue
+                replayed += 1
+
+                for call, task, output_tokens in self._replay(conversation):
+                    decision = router.route(call, task)
+                    decisions[(task.value, decision.model, decision.reason)] += 1
+                    calls_by_task[task.value][decision.model] += 1
+                    routed_cost += get_model_spec(decision.model).estimate_cost(decision.prompt_tokens, output_tokens)
+                    baseline_cost += large_spec.estimate_cost(decision.prompt_tokens, output_tokens)
+
+                    if output is not None:
+                        message = call.get_last_user_message()
+                        output.write(json.dumps({
+                            "conversation_id": conversation.id,
+                            "task": task.value,
+                            "model": decision.model,
+                            "reason": decision.reason,
+                            "prompt_tokens": decision.prompt_tokens,
+                            "message": message.content if message else None,
+                        }, ensure_ascii=False) + "\n")
+        finally:
+            if output is not None:
+                output.close()
+
+        self.stdout.write(f"{replayed} conversations replayed.\n")
+        for task, models in sorted(calls_by_task.items()):
+            total = sum(models.values())
+            mix = ", ".join(f"{model} {count / total:.0%}" for model, count in models.most_common())
+            self.stdout.write(f"{task}: {total} calls ({mix})")
+        self.stdout.write("\nDecisions:")
+        for (task, model, reason), count in decisions.most_common():
+            self.stdout.write(f"  {count:>6}  {task:<12} {model:<16} {reason}")
+
+        savings = 1 - routed_cost / baseline_cost if baseline_cost else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"\nEstimated cost ${routed_cost:.4f} routed vs ${baseline_cost:.4f} with {large_spec.name} only "
+            f"({savings:.0%} saved)."
+        ))
+        self.stdout.write("RAG context is not stored, so prompt sizes (and costs) are underestimates.")
+
+    @staticmethod
+    def _replay(conversation: ConversationEntity) -> Iterator[ReplayedCall]:
+        """Rebuilds every completion the conversation went through from its stored transcript."""
+        # Each turn is replayed with the history it had, without the memory summary folded in later.
+        history = replace(conversation, memory_summary=None)
+        for index, message in enumerate(conversation.messages):
+            if message.role != MessageRole.ASSISTANT:
+                continue
+            call = replace(history, messages=conversation.messages[:index])
+            task = LLMTask.CHAT if call.get_last_user_message() else LLMTask.GREETING
+            yield call, task, message.get_token_count()
+
+        if conversation.summary:
+            yield (
+                Command._with_prompt(history, SYSTEM_PROMPT_SUMMARY),
+                LLMTask.SUMMARY,
+                count_tokens(conversation.summary)
+            )
+            yield (
+                Command._with_prompt(history, SYSTEM_PROMPT_DATE_EXTRACTION),
+                LLMTask.EXTRACTION,
+                Command._extraction_tokens(conversation.extracted_data)
+            )
+
+    @staticmethod
+    def _with_prompt(conversation: ConversationEntity, system_prompt: str) -> ConversationEntity:
+        return conversation.with_system_prompt(MessageEntity(role=MessageRole.SYSTEM, content=system_prompt))
+
+    @staticmethod
+    def _extraction_tokens(extracted_data: Optional[object]) -> int:
+        if not extracted_data:
+            return 0
+        return count_tokens(extracted_data if isinstance(extracted_data, str) else json.dumps(extracted_data))
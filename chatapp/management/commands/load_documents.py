@@ -1,38 +1,147 @@
 import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from openai import OpenAI, APIError, RateLimitError, APIConnectionError, APITimeoutError, InternalServerError, AuthenticationError
-from chatapp.infrastructure.models.document_db import DocumentDB
+from chatapp.infrastructure.models.document_db import DocumentDB, content_search_vector
+from chatapp.infrastructure.services.document_chunker import DEFAULT_CHUNK_TOKENS, DEFAULT_OVERLAP_TOKENS, DocumentChunk, chunk_text, hash_content
+from chatapp.infrastructure.services.rag_retrieve_data_service import EMBEDDING_ENCODING, EMBEDDING_MODEL
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+@dataclass
+class PendingFile:
+    filename: str
+    file_hash: str
+    chunks: List[DocumentChunk]
+    embeddings: List[Optional[List[float]]] = field(default_factory=list)
+    failed: bool = False
+
+    @property
+    def missing(self) -> int:
+        return sum(1 for embedding in self.embeddings if embedding is None)
+
+Batch = List[Tuple[PendingFile, DocumentChunk]]
+
 class Command(BaseCommand):
-    help = 'Loads .txt and .md files into the database with embeddings'
+    help = 'Loads .txt and .md files into the database with embeddings, re-embedding only what changed'
 
     def add_arguments(self, parser):
         parser.add_argument('directory', type=str, help='Path to the documents folder')
+        parser.add_argument('--chunk-tokens', type=int, default=DEFAULT_CHUNK_TOKENS, help='Maximum tokens per chunk')
+        parser.add_argument('--overlap-tokens', type=int, default=DEFAULT_OVERLAP_TOKENS, help='Tokens shared by consecutive chunks')
+        parser.add_argument('--batch-size', type=int, default=64, help='Chunks sent per embeddings request')
+        parser.add_argument('--workers', type=int, default=4, help='Embeddings requests in flight at once')
+        parser.add_argument('--no-prune', action='store_true', help='Keep documents whose file no longer exists')
 
-    @retry(
-        retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True
-    )
     def handle(self, *args, **kwargs):
         directory = kwargs['directory']
-        
+
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             self.stderr.write(self.style.ERROR("OPENAI_API_KEY not configured in environment variables"))
             return
-            
-        client = OpenAI(api_key=api_key)
+
+        self.client = OpenAI(api_key=api_key)
 
         if not os.path.exists(directory):
             self.stderr.write(self.style.ERROR(f"Folder not found: {directory}"))
             return
 
-        files_loaded = 0
+        # Documents stored before full-text search existed get their search vector backfilled once.
+        DocumentDB.objects.filter(search_vector__isnull=True).update(search_vector=content_search_vector())
+
+        stored_hashes = self._stored_file_hashes()
+        files, seen = self._read_changed_files(directory, stored_hashes, kwargs['chunk_tokens'], kwargs['overlap_tokens'])
+        unchanged = len(seen) - len(files)
+
+        pruned = 0
+        if not kwargs['no_prune']:
+            pruned = self._prune(set(stored_hashes) - seen)
+
+        pending = self._reuse_embeddings(files)
+        chunks = [(file, chunk) for file in pending for chunk in file.chunks if file.embeddings[chunk.index] is None]
+
+        total_tokens = sum(chunk.token_count for _, chunk in chunks)
+        batches = list(self._batches(chunks, kwargs['batch_size']))
+        self.stdout.write(
+            f"{len(files)} new or changed files, {unchanged} unchanged, {pruned} pruned. "
+            f"Embedding {len(chunks)} chunks ({total_tokens} tokens) in {len(batches)} batches "
+            f"with {kwargs['workers']} workers..."
+        )
+
+        pending_names = {file.filename for file in pending}
+        files_loaded = len(files) - len(pending)
+        for file in files:
+            if file.filename not in pending_names:
+                self._replace_file(file)
+
+        started = time.perf_counter()
+        chunks_loaded, tokens_loaded, failed_batches = 0, 0, 0
+
+        with ThreadPoolExecutor(max_workers=kwargs['workers']) as pool:
+            futures = {pool.submit(self._embed_batch, batch): batch for batch in batches}
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch = futures.pop(future)
+                    try:
+                        embeddings = future.result()
+                    except (AuthenticationError, RateLimitError) as e:
+                        for remaining in futures:
+                            remaining.cancel()
+                        futures.clear()
+                        self._write_batch_error(e)
+                        break
+                    except Exception as e:
+                        failed_batches += 1
+                        for file, _ in batch:
+                            file.failed = True
+                        self._write_batch_error(e, batch)
+                        continue
+
+                    # Writes stay on the main thread so every batch reuses its DB connection.
+                    for (file, chunk), embedding in zip(batch, embeddings):
+                        file.embeddings[chunk.index] = embedding
+                    for file in {file.filename: file for file, _ in batch}.values():
+                        if not file.failed and file.missing == 0:
+                            self._replace_file(file)
+                            files_loaded += 1
+
+                    chunks_loaded += len(batch)
+                    tokens_loaded += sum(chunk.token_count for _, chunk in batch)
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f"[{chunks_loaded}/{len(chunks)}] {chunks_loaded / elapsed:.1f} chunks/s, "
+                        f"{tokens_loaded / elapsed:.0f} tokens/s"
+                    )
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"\n🎉 {files_loaded} files ({chunks_loaded} new chunks) loaded in {elapsed:.1f}s "
+            f"({failed_batches} batches failed)."
+        ))
+
+    @staticmethod
+    def _stored_file_hashes() -> Dict[str, str]:
+        stored = {}
+        for title, file_hash in DocumentDB.objects.values_list('title', 'metadata__file_hash').distinct():
+            # A file whose chunks disagree on the hash is treated as changed.
+            stored[title] = file_hash if stored.get(title, file_hash) == file_hash else None
+        return stored
 
-        for filename in os.listdir(directory):
+    def _read_changed_files(
+        self,
+        directory: str,
+        stored_hashes: Dict[str, str],
+        chunk_tokens: int,
+        overlap_tokens: int
+    ) -> Tuple[List[PendingFile], set]:
+        files, seen = [], set()
+        for filename in sorted(os.listdir(directory)):
             if not filename.endswith(('.txt', '.md')):
                 continue
 
@@ -40,40 +149,95 @@ class Command(BaseCommand):
             with open(path, 'r', encoding='utf-8') as f:
                 content = f.read()
 
-                if len(content.strip()) == 0:
-                    self.stdout.write(self.style.WARNING(f"⚠️  {filename} is empty. Skipping."))
-                    continue
-
-                try:
-                    content = content.replace('\n', ' ')
-                    embedding = client.embeddings.create(
-                        input=[content],
-                        model="text-embedding-3-small"
-                    ).data[0].embedding
-
-                    DocumentDB.objects.create(
-                        title=filename,
-                        content=content,
-                        embedding=embedding
-                    )
+            if len(content.strip()) == 0:
+                self.stdout.write(self.style.WARNING(f"⚠️  {filename} is empty. Skipping."))
+                continue
+
+            seen.add(filename)
+            # Chunking parameters and model are part of the hash: changing them re-chunks every file.
+            file_hash = hash_content(f"{EMBEDDING_MODEL}:{chunk_tokens}:{overlap_tokens}:{content}")
+            if stored_hashes.get(filename) == file_hash:
+                continue
+
+            file_chunks = chunk_text(content, chunk_tokens, overlap_tokens, EMBEDDING_ENCODING)
+            files.append(PendingFile(filename=filename, file_hash=file_hash, chunks=file_chunks))
+            self.stdout.write(f"Chunked: {filename} ({len(file_chunks)} chunks)")
+
+        return files, seen
+
+    def _prune(self, filenames: set) -> int:
+        if not filenames:
+            return 0
+
+        DocumentDB.objects.filter(title__in=filenames).delete()
+        for filename in sorted(filenames):
+            self.stdout.write(f"Pruned: {filename}")
+        return len(filenames)
+
+    @staticmethod
+    def _reuse_embeddings(files: List[PendingFile]) -> List[PendingFile]:
+        """Fills in embeddings of chunks already stored for the same file and returns the files still missing some."""
+        pending = []
+        for file in files:
+            stored = dict(
+                DocumentDB.objects.filter(
+                    title=file.filename,
+                    content_hash__in=[chunk.content_hash for chunk in file.chunks]
+                ).values_list('content_hash', 'embedding')
+            )
+            file.embeddings = [stored.get(chunk.content_hash) for chunk in file.chunks]
+            if file.missing:
+                pending.append(file)
+        return pending
+
+    @staticmethod
+    def _replace_file(file: PendingFile) -> None:
+        with transaction.atomic():
+            DocumentDB.objects.filter(title=file.filename).delete()
+            DocumentDB.objects.bulk_create([
+                DocumentDB(
+                    title=file.filename,
+                    content=chunk.content,
+                    content_hash=chunk.content_hash,
+                    embedding=embedding,
+                    metadata={
+                        "source": file.filename,
+                        "file_hash": file.file_hash,
+                        "chunk_index": chunk.index,
+                        "token_count": chunk.token_count
+                    }
+                )
+                for chunk, embedding in zip(file.chunks, file.embeddings)
+            ])
+            DocumentDB.objects.filter(title=file.filename).update(search_vector=content_search_vector())
+
+    @staticmethod
+    def _batches(chunks: Batch, batch_size: int) -> Iterator[Batch]:
+        for start in range(0, len(chunks), batch_size):
+            yield chunks[start:start + batch_size]
+
+    @retry(
+        retry=retry_if_exception_type((APIConnectionError, RateLimitError, APITimeoutError, InternalServerError)),
+        stop=stop_after_attempt(5),
+        wait=wait_exponential(multiplier=1, min=4, max=60),
+        reraise=True
+    )
+    def _embed_batch(self, batch: Batch) -> List[List[float]]:
+        response = self.client.embeddings.create(
+            input=[chunk.content.replace('\n', ' ') for _, chunk in batch],
+            model=EMBEDDING_MODEL
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
 
-                    self.stdout.write(self.style.SUCCESS(f"Loaded: {filename}"))
-                    files_loaded += 1
-
-                except AuthenticationError:
-                    self.stderr.write(self.style.ERROR("Authentication error with OpenAI"))
-                    return
-                except (APIConnectionError, APITimeoutError):
-                    self.stderr.write(self.style.ERROR(f"Connection error while processing {filename}. Retrying..."))
-                    continue
-                except RateLimitError:
-                    self.stderr.write(self.style.ERROR(f"Rate limit reached. Please wait a few minutes and try again."))
-                    return
-                except APIError as e:
-                    self.stderr.write(self.style.ERROR(f"API error while processing {filename}: {str(e)}"))
-                    continue
-                except Exception as e:
-                    self.stderr.write(self.style.ERROR(f"Unexpected error while processing {filename}: {str(e)}"))
-                    continue
-
-        self.stdout.write(self.style.SUCCESS(f"\n🎉 {files_loaded} files successfully loaded."))
\ No newline at end of file
+    def _write_batch_error(self, e: Exception, batch: Batch = ()) -> None:
+        files = ", ".join(sorted({file.filename for file, _ in batch}))
+        if isinstance(e, AuthenticationError):
+            self.stderr.write(self.style.ERROR("Authentication error with OpenAI"))
+        elif isinstance(e, RateLimitError):
+            self.stderr.write(self.style.ERROR("Rate limit reached. Please wait a few minutes and try again."))
+        elif isinstance(e, (APIConnectionError, APITimeoutError)):
+            self.stderr.write(self.style.ERROR(f"Connection error while processing {files}"))
+        elif isinstance(e, APIError):
+            self.stderr.write(self.style.ERROR(f"API error while processing {files}: {str(e)}"))
+        else:
+            self.stderr.write(self.style.ERROR(f"Unexpected error while processing {files}: {str(e)}"))
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.conversation_extraction import parse_conversation_extraction
+from chatapp.infrastructure.models.conversation_db import ConversationDB
+
+class Command(BaseCommand):
+    help = 'Parses extracted data stored as raw JSON strings into JSON objects'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Conversations updated per query')
+        parser.add_argument('--clear-invalid', action='store_true', help='Set unparseable extracted data to null instead of leaving it')
+
+    def handle(self, *args, **kwargs):
+        batch_size = kwargs['batch_size']
+        rows = (
+            ConversationDB.objects
+            .filter(extracted_data__isnull=False)
+            .only('id', 'extracted_data')
+            .iterator(chunk_size=batch_size)
+        )
+
+        pending, converted, invalid = [], 0, 0
+        for conversation in rows:
+            if not isinstance(conversation.extracted_data, str):
+                continue
+
+            try:
+                conversation.extracted_data = parse_conversation_extraction(conversation.extracted_data)
+                converted += 1
+            except ValidationError as e:
+                invalid += 1
+                self.stderr.write(self.style.WARNING(f"⚠️  {conversation.id}: {e.message}"))
+                if not kwargs['clear_invalid']:
+                    continue
+                conversation.extracted_data = None
+
+            pending.append(conversation)
+            if len(pending) >= batch_size:
+                ConversationDB.objects.bulk_update(pending, ['extracted_data'])
+                pending.clear()
+
+        if pending:
+            ConversationDB.objects.bulk_update(pending, ['extracted_data'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🎉 {converted} conversations normalized, {invalid} with invalid extracted data"
+            f"{' cleared' if kwargs['clear_invalid'] else ' left as is'}."
+        ))
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db.models import Sum
+
+from chatapp.infrastructure.models.response_cache_db import ResponseCacheDB
+from chatapp.infrastructure.services.cached_llm_service import evict_response_cache
+
+class Command(BaseCommand):
+    help = 'Evicts expired and least recently used response cache entries and reports the hit rate'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-entries', type=int, default=settings.RESPONSE_CACHE_MAX_ENTRIES, help='Entries kept after eviction')
+
+    def handle(self, *args, **kwargs):
+        deleted = evict_response_cache(kwargs['max_entries'])
+
+        entries = ResponseCacheDB.objects.count()
+        hits = ResponseCacheDB.objects.aggregate(hits=Sum('hits'))['hits'] or 0
+        # Every entry was stored by one miss, so hits / (hits + entries) is the hit rate of the cached entries' lifetime.
+        hit_rate = hits / (hits + entries) if entries else 0.0
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{deleted} entries evicted. {entries} entries cached, {hits} hits served, hit rate {hit_rate:.1%}."
+        ))
@@ -0,0 +1,42 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from chatapp.container import container
+
+class Command(BaseCommand):
+    help = 'Creates or refreshes the conversation_daily_stats materialized view behind the reporting API'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--every', type=float, default=None, help='Keep running and refresh every this many seconds')
+        parser.add_argument('--if-missing', action='store_true', help='Only create the view when it does not exist yet, e.g. on deploy')
+
+    def handle(self, *args, **kwargs):
+        repository = container.conversation_report_repository()
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        while not self.stopping:
+            close_old_connections()
+            started = time.monotonic()
+            try:
+                repository.refresh_daily_stats(if_missing=kwargs['if_missing'])
+                self.stdout.write(self.style.SUCCESS(f"✔ Conversation stats refreshed in {time.monotonic() - started:.1f}s"))
+            except Exception as e:
+                if kwargs['every'] is None:
+                    raise
+                # A failed refresh leaves the previous snapshot readable; try again next round.
+                self.stderr.write(self.style.ERROR(f"✘ Conversation stats refresh failed: {e}"))
+
+            if kwargs['every'] is None:
+                break
+            deadline = started + kwargs['every']
+            while not self.stopping and time.monotonic() < deadline:
+                time.sleep(min(1.0, deadline - time.monotonic()))
+
+    def _stop(self, signum, frame) -> None:
+        self.stdout.write("Stop requested, exiting after the current refresh.")
+        self.stopping = True
@@ -0,0 +1,76 @@
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from chatapp.container import container
+from chatapp.domain.entities.job import JobEntity, JobKind, JobStatus
+from chatapp.infrastructure.services.llm_scheduler import LLMPriority, llm_priority
+
+class Command(BaseCommand):
+    help = 'Drains the background job queue (conversation summaries) with a bounded pool of workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=4, help='Jobs processed at once')
+        parser.add_argument('--poll-interval', type=float, default=2.0, help='Seconds to wait when the queue is empty')
+        parser.add_argument('--kind', action='append', choices=[kind.value for kind in JobKind], help='Only run jobs of this kind (repeatable)')
+        parser.add_argument('--once', action='store_true', help='Exit once no runnable job is left')
+
+    def handle(self, *args, **kwargs):
+        self.job_repository = container.job_repository()
+        self.process_job_use_case = container.process_job_use_case()
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        concurrency = kwargs['concurrency']
+        kinds = [JobKind(kind) for kind in kwargs['kind'] or []]
+        self.stdout.write(f"Job worker started with concurrency {concurrency}")
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            running = set()
+            while not self.stopping:
+                free_slots = concurrency - len(running)
+                jobs = self.job_repository.claim(free_slots, settings.JOB_LEASE_SECONDS, kinds) if free_slots else []
+                running.update(pool.submit(self._run, job) for job in jobs)
+
+                if not running:
+                    if kwargs['once']:
+                        break
+                    time.sleep(kwargs['poll_interval'])
+                    continue
+
+                done, running = wait(running, timeout=kwargs['poll_interval'], return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception():
+                        # The job keeps its lease and is picked up again once it expires.
+                        self.stderr.write(self.style.ERROR(f"Worker error: {future.exception()}"))
+
+            if running:
+                self.stdout.write(f"Waiting for {len(running)} running jobs to finish...")
+                wait(running)
+
+        self.stdout.write(self.style.SUCCESS("Job worker stopped."))
+
+    def _run(self, job: JobEntity) -> None:
+        close_old_connections()
+        try:
+            with llm_priority(LLMPriority.BATCH):
+                job = self.process_job_use_case.execute(job)
+        finally:
+            close_old_connections()
+
+        if job.status == JobStatus.SUCCEEDED:
+            self.stdout.write(self.style.SUCCESS(f"✔ {job.kind.value} {job.id}"))
+        elif job.status == JobStatus.RUNNING:
+            self.stdout.write(self.style.WARNING(f"⚠ {job.kind.value} {job.id} lost its lease to another worker; outcome discarded"))
+        elif job.status == JobStatus.QUEUED:
+            self.stdout.write(self.style.WARNING(f"↻ {job.kind.value} {job.id} will retry (attempt {job.attempts}/{job.max_attempts}): {job.last_error}"))
+        else:
+            self.stderr.write(self.style.ERROR(f"✘ {job.kind.value} {job.id} failed: {job.last_error}"))
+
+    def _stop(self, signum, frame) -> None:
+        self.stdout.write("Stop requested, no new jobs will be claimed.")
+        self.stopping = True
@@ -0,0 +1,164 @@
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import timedelta
+from typing import Iterator, Set, Tuple
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from django.db.models import Sum
+from django.db.models.functions import Coalesce, Length
+from django.utils import timezone
+
+from chatapp.application.create_conversation_summary_use_case import SYSTEM_PROMPT_DATE_EXTRACTION, SYSTEM_PROMPT_SUMMARY
+from chatapp.container import container
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.services.token_counter import count_tokens
+from chatapp.infrastructure.models.conversation_db import ConversationDB
+from chatapp.infrastructure.services.llm_scheduler import LLMPriority, llm_priority
+from chatapp.infrastructure.services.rate_limiter import RateLimiter
+
+# Output budget reserved per completion when estimating the tokens of a summary.
+COMPLETION_TOKENS_ESTIMATE = 1024
+
+class Command(BaseCommand):
+    help = 'Summarizes a backlog of conversations with a bounded, rate-limited pool and a resumable checkpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--status', action='append', choices=[status.value for status in ConversationStatus], help='Only conversations in this status (repeatable, default: completed)')
+        parser.add_argument('--older-than-hours', type=float, default=24, help='Only conversations not updated for this many hours')
+        parser.add_argument('--include-summarized', action='store_true', help='Also summarize conversations that already have a summary')
+        parser.add_argument('--limit', type=int, default=None, help='Stop after this many conversations')
+        parser.add_argument('--concurrency', type=int, default=8, help='Conversations summarized at once')
+        parser.add_argument('--rpm', type=int, default=500, help='Requests per minute budget (0 disables it)')
+        parser.add_argument('--tpm', type=int, default=800_000, help='Tokens per minute budget (0 disables it)')
+        parser.add_argument('--checkpoint', type=str, default='summarize_conversations.checkpoint', help='File recording summarized conversation ids')
+        parser.add_argument('--reset-checkpoint', action='store_true', help='Ignore and overwrite an existing checkpoint')
+
+    def handle(self, *args, **kwargs):
+        self.use_case = container.create_conversation_summary_use_case()
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        checkpoint_path = kwargs['checkpoint']
+        if kwargs['reset_checkpoint'] and os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        done_ids = self._read_checkpoint(checkpoint_path)
+
+        statuses = kwargs['status'] or [ConversationStatus.COMPLETED.value]
+        queryset = ConversationDB.objects.filter(
+            status__in=statuses,
+            updated_at__lte=timezone.now() - timedelta(hours=kwargs['older_than_hours'])
+        )
+        if not kwargs['include_summarized']:
+            queryset = queryset.filter(summary__isnull=True)
+
+        total = queryset.count()
+        if kwargs['limit'] is not None:
+            total = min(total, kwargs['limit'])
+        self.stdout.write(
+            f"{total} conversations match ({len(done_ids)} already in the checkpoint). "
+            f"Summarizing with concurrency {kwargs['concurrency']}, {kwargs['rpm']} RPM, {kwargs['tpm']} TPM..."
+        )
+
+        # Each summary is two completions over the whole transcript: the summary and the data extraction.
+        prompt_tokens = count_tokens(SYSTEM_PROMPT_SUMMARY) + count_tokens(SYSTEM_PROMPT_DATE_EXTRACTION)
+        limiter = RateLimiter(requests_per_minute=kwargs['rpm'], tokens_per_minute=kwargs['tpm'])
+
+        started = time.perf_counter()
+        summarized, failed, skipped, tokens_sent = 0, 0, 0, 0
+
+        with ThreadPoolExecutor(max_workers=kwargs['concurrency']) as pool, open(checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            running = {}
+            for conversation_id, status, transcript_tokens in self._stream(queryset, kwargs['limit']):
+                if self.stopping:
+                    break
+                if conversation_id in done_ids:
+                    skipped += 1
+                    continue
+
+                estimate = 2 * (transcript_tokens + COMPLETION_TOKENS_ESTIMATE) + prompt_tokens
+                limiter.acquire(requests=2, tokens=estimate)
+                running[pool.submit(self._summarize, conversation_id, ConversationStatus(status))] = (conversation_id, estimate)
+
+                if len(running) >= kwargs['concurrency']:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        conversation_id, estimate = running.pop(future)
+                        if self._record(future, conversation_id, checkpoint):
+                            summarized += 1
+                            tokens_sent += estimate
+                        else:
+                            failed += 1
+                    self._write_progress(summarized + failed + skipped, total, summarized, tokens_sent, started)
+
+            if running:
+                wait(running)
+                for future, (conversation_id, estimate) in running.items():
+                    if self._record(future, conversation_id, checkpoint):
+                        summarized += 1
+                        tokens_sent += estimate
+                    else:
+                        failed += 1
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"\n🎉 {summarized} conversations summarized in {elapsed:.1f}s "
+            f"({failed} failed, {skipped} skipped from the checkpoint)."
+        ))
+        if self.stopping:
+            self.stdout.write("Stopped early, run the command again to resume from the checkpoint.")
+
+    @staticmethod
+    def _read_checkpoint(path: str) -> Set[str]:
+        if not os.path.exists(path):
+            return set()
+        with open(path, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+
+    @staticmethod
+    def _stream(queryset, limit) -> Iterator[Tuple[str, str, int]]:
+        # Messages saved before token counts were stored are estimated at four characters per token.
+        rows = (
+            queryset
+            .annotate(transcript_tokens=Sum(Coalesce('messages__token_count', Length('messages__content') / 4)))
+            .order_by('updated_at', 'id')
+            .values_list('id', 'status', 'transcript_tokens')
+        )
+        if limit is not None:
+            rows = rows[:limit]
+
+        for conversation_id, status, transcript_tokens in rows.iterator(chunk_size=500):
+            yield str(conversation_id), status, transcript_tokens or 0
+
+    def _summarize(self, conversation_id: str, status: ConversationStatus) -> None:
+        close_old_connections()
+        try:
+            with llm_priority(LLMPriority.BATCH):
+                self.use_case.execute(conversation_id, status)
+        finally:
+            close_old_connections()
+
+    def _record(self, future, conversation_id: str, checkpoint) -> bool:
+        try:
+            future.result()
+        except Exception as e:
+            # Failed conversations stay out of the checkpoint and are retried on the next run.
+            self.stderr.write(self.style.ERROR(f"✘ {conversation_id}: {e}"))
+            return False
+
+        checkpoint.write(f"{conversation_id}\n")
+        checkpoint.flush()
+        return True
+
+    def _write_progress(self, processed: int, total: int, summarized: int, tokens_sent: int, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"[{processed}/{total}] {summarized / elapsed * 60:.0f} conversations/min, "
+            f"~{tokens_sent / elapsed * 60:.0f} tokens/min"
+        )
+
+    def _stop(self, signum, frame) -> None:
+        self.stdout.write("Stop requested, finishing the summaries in flight.")
+        self.stopping = True
@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+from uuid import uuid4
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.infrastructure.services.cached_llm_service import CachedLLMService
+
+class TestCachedLLMService(unittest.TestCase):
+    def setUp(self):
+        self.llm_service = Mock()
+        self.llm_service.generate_response.return_value = MessageEntity(role=MessageRole.ASSISTANT, content="Fresh answer")
+        self.rag_service = Mock()
+        self.rag_service.get_embedding.return_value = [0.1, 0.2]
+        self.service = CachedLLMService(
+            llm_service=self.llm_service,
+            rag_service=self.rag_service,
+            similarity=0.95,
+            ttl=3600,
+            max_user_turns=1
+        )
+
+        objects = patch("chatapp.infrastructure.services.cached_llm_service.ResponseCacheDB.objects", new_callable=MagicMock)
+        self.objects = objects.start()
+        self.addCleanup(objects.stop)
+        self.lookup = self.objects.filter.return_value.annotate.return_value.filter.return_value.order_by.return_value.only.return_value
+
+    def make_conversation(self, *user_messages, rag_context="Returns within 30 days"):
+        conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User"), rag_context=rag_context)
+        conversation.system_prompt = MessageEntity(role=MessageRole.SYSTEM, content="You are Orion support")
+        conversation.messages.append(MessageEntity(role=MessageRole.ASSISTANT, content="Hi, how can I help?"))
+        for content in user_messages:
+            conversation.messages.append(MessageEntity(role=MessageRole.USER, content=content))
+        return conversation
+
+    def test_hit_skips_the_completion(self):
+        self.lookup.first.return_value = MagicMock(id=1, response="Cached answer")
+
+        response = self.service.generate_response(self.make_conversation("How do I return?"))
+
+        self.assertEqual(response.content, "Cached answer")
+        self.assertEqual(response.role, MessageRole.ASSISTANT)
+        self.llm_service.generate_response.assert_not_called()
+        self.rag_service.get_embedding.assert_called_once_with("How do I return?")
+        self.assertEqual(self.service.stats()["hit_rate"], 1.0)
+
+    def test_miss_generates_and_stores_the_answer(self):
+        self.lookup.first.return_value = None
+
+        response = self.service.generate_response(self.make_conversation("How do I return?"))
+
+        self.assertEqual(response.content, "Fresh answer")
+        stored = self.objects.create.call_args.kwargs
+        self.assertEqual(stored["question"], "How do I return?")
+        self.assertEqual(stored["response"], "Fresh answer")
+        self.assertEqual(stored["embedding"], [0.1, 0.2])
+        self.assertEqual(self.service.stats()["misses"], 1)
+
+    def test_questions_with_identifiers_only_match_exactly(self):
+        exact_lookup = self.objects.filter.return_value.filter.return_value.order_by.return_value.only.return_value
+        exact_lookup.first.return_value = None
+
+        response = self.service.generate_response(self.make_conversation("Where is order 12346?"))
+
+        self.assertEqual(response.content, "Fresh answer")
+        self.objects.filter.return_value.filter.assert_called_once_with(question="Where is order 12346?")
+        self.objects.filter.return_value.annotate.assert_not_called()
+        self.lookup.first.assert_not_called()
+
+    def test_identifier_detection(self):
+        for question, exact_only in [
+            ("How do I return?", False),
+            ("Where is order 12345?", True),
+            ("Send it to ana@example.com", True),
+            ("¿Dónde está mi pedido?", False),
+        ]:
+            with self.subTest(question=question):
+                self.assertEqual(self.service._make_key(self.make_conversation(question)).exact_only, exact_only)
+
+    def test_deeper_conversations_bypass_the_cache(self):
+        response = self.service.generate_response(self.make_conversation("Hi", "How do I return?"))
+
+        self.assertEqual(response.content, "Fresh answer")
+        self.rag_service.get_embedding.assert_not_called()
+        self.objects.create.assert_not_called()
+        self.assertEqual(self.service.stats()["bypassed"], 1)
+
+    def test_rag_context_is_part_of_the_key(self):
+        returns = self.service._make_key(self.make_conversation("How do I return?", rag_context="Returns within 30 days"))
+        shipping = self.service._make_key(self.make_conversation("How do I return?", rag_context="Shipping takes 3 days"))
+
+        self.assertEqual(returns.prompt_hash, shipping.prompt_hash)
+        self.assertNotEqual(returns.context_hash, shipping.context_hash)
+
+    def test_cache_failures_fall_back_to_the_model(self):
+        self.lookup.first.side_effect = RuntimeError("database unavailable")
+        self.objects.create.side_effect = RuntimeError("database unavailable")
+
+        response = self.service.generate_response(self.make_conversation("How do I return?"))
+
+        self.assertEqual(response.content, "Fresh answer")
+
+    def test_stream_hit_yields_the_cached_answer(self):
+        self.lookup.first.return_value = MagicMock(id=1, response="Cached answer")
+
+        deltas = list(self.service.generate_response_stream(self.make_conversation("How do I return?")))
+
+        self.assertEqual(deltas, ["Cached answer"])
+        self.llm_service.generate_response_stream.assert_not_called()
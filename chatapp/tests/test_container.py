@@ -0,0 +1,29 @@
+import unittest
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from chatapp.container import Container
+
+class TestContainer(unittest.TestCase):
+    def setUp(self):
+        patcher = patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Keep the greeting pool from calling OpenAI in the background.
+        overrides = override_settings(GREETING_POOL_ENABLED=False)
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        self.container = Container()
+
+    def test_use_cases_are_built_once_per_container(self):
+        self.assertIs(self.container.process_message_use_case(), self.container.process_message_use_case())
+        self.assertIs(self.container.create_conversation_use_case(), self.container.create_conversation_use_case())
+
+    def test_use_cases_share_the_llm_client(self):
+        process_message = self.container.process_message_use_case()
+        create_conversation = self.container.create_conversation_use_case()
+
+        self.assertIs(process_message._llm_service, create_conversation._llm_service)
+        self.assertIs(process_message._llm_service.client, create_conversation._llm_service.client)
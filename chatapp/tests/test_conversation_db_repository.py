@@ -0,0 +1,241 @@
+import unittest
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, Mock, patch
+from uuid import UUID, uuid4
+
+from chatapp.domain.entities.conversation import ConversationEntity, ConversationStatus
+from chatapp.domain.entities.message import MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.domain.services.token_counter import ENCODING_MODEL
+from chatapp.infrastructure.models.conversation_db import ConversationDB
+from chatapp.infrastructure.models.message_db import MessageDB
+from chatapp.infrastructure.repository.conversation_db_repository import ConversationDBRepository
+
+REPOSITORY = "chatapp.infrastructure.repository.conversation_db_repository"
+STARTED_AT = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+def make_message(created_at: datetime, token_count: int = 10, role: MessageRole = MessageRole.USER) -> MessageDB:
+    return MessageDB(id=uuid4(), content="hi", role=role.value, token_count=token_count, created_at=created_at)
+
+def position(message: MessageDB):
+    return (message.created_at, message.id)
+
+class TestRecentMessagesWindow(unittest.TestCase):
+    """The keyset walk behind get_window_by_id, over messages held in memory."""
+
+    def setUp(self):
+        self.repository = ConversationDBRepository()
+        self.conversation_id = uuid4()
+        self.messages = []
+        self.pages = []
+
+        patchers = [
+            patch(f"{REPOSITORY}.WINDOW_PAGE_SIZE", 2),
+            patch.object(ConversationDBRepository, "_window_page_query", side_effect=self._page_query),
+            patch.object(ConversationDBRepository, "_backfill_token_counts"),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _page_query(self, conversation_id, after, before, oldest_first=False):
+        # Same semantics as the SQL: non-system rows strictly between the positions, newest first unless oldest_first.
+        self.pages.append((after, before))
+        rows = sorted(
+            (msg for msg in self.messages if msg.role != MessageRole.SYSTEM.value),
+            key=position,
+            reverse=not oldest_first
+        )
+        if after is not None:
+            rows = [msg for msg in rows if position(msg) > after]
+        if before is not None:
+            rows = [msg for msg in rows if position(msg) < before]
+        return rows
+
+    def _add_messages(self, count: int, same_timestamp: bool = False):
+        self.messages = [
+            make_message(STARTED_AT if same_timestamp else STARTED_AT + timedelta(seconds=index))
+            for index in range(count)
+        ]
+        return sorted(self.messages, key=position)
+
+    def test_walks_every_page_in_chronological_order(self):
+        chronological = self._add_messages(5)
+
+        window = self.repository._get_recent_messages(self.conversation_id, budget=1000)
+
+        self.assertEqual(window, chronological)
+        # Each page starts strictly before the oldest row of the previous one.
+        self.assertEqual(self.pages, [
+            (None, None),
+            (None, position(chronological[3])),
+            (None, position(chronological[1])),
+        ])
+
+    def test_full_last_page_needs_one_empty_page_to_stop(self):
+        chronological = self._add_messages(4)
+
+        window = self.repository._get_recent_messages(self.conversation_id, budget=1000)
+
+        self.assertEqual(window, chronological)
+        self.assertEqual(len(self.pages), 3)
+
+    def test_equal_timestamps_are_split_by_id_without_gaps_or_repeats(self):
+        chronological = self._add_messages(5, same_timestamp=True)
+
+        window = self.repository._get_recent_messages(self.conversation_id, budget=1000)
+
+        self.assertEqual(window, chronological)
+        self.assertEqual(len({msg.id for msg in window}), 5)
+
+    def test_stops_at_the_budget_inside_a_page(self):
+        chronological = self._add_messages(5)
+
+        window = self.repository._get_recent_messages(self.conversation_id, budget=35)
+
+        self.assertEqual(window, chronological[-3:])
+        self.assertEqual(len(self.pages), 2)
+
+    def test_skips_system_messages(self):
+        chronological = self._add_messages(3)
+        self.messages.append(make_message(STARTED_AT - timedelta(seconds=1), role=MessageRole.SYSTEM))
+
+        window = self.repository._get_recent_messages(self.conversation_id, budget=1000)
+
+        self.assertEqual(window, chronological)
+
+    def test_folded_cursor_excludes_folded_turns(self):
+        chronological = self._add_messages(5)
+        folded_until = position(chronological[2])
+
+        window = self.repository._get_recent_messages(self.conversation_id, budget=1000, after=folded_until)
+
+        self.assertEqual(window, chronological[3:])
+        self.assertTrue(all(after == folded_until for after, _ in self.pages))
+
+    def test_folded_cursor_with_equal_timestamps_cuts_by_id(self):
+        chronological = self._add_messages(5, same_timestamp=True)
+
+        window = self.repository._get_recent_messages(
+            self.conversation_id, budget=1000, after=position(chronological[1])
+        )
+
+        self.assertEqual(window, chronological[2:])
+
+    def test_unfolded_backlog_larger_than_the_budget_is_loaded_chunk_by_chunk(self):
+        chronological = self._add_messages(7)
+        conversation_db = Mock(
+            id=self.conversation_id,
+            memory_folded_until=chronological[0].created_at,
+            memory_folded_until_id=chronological[0].id
+        )
+        head = patch.object(
+            ConversationDBRepository, "_get_head",
+            side_effect=lambda conversation_id, max_tokens: (conversation_db, ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User")), 25)
+        )
+        head.start()
+        self.addCleanup(head.stop)
+
+        chunks = []
+        while True:
+            conversation = self.repository.get_unfolded_by_id(str(self.conversation_id), keep_tokens=20)
+            if not conversation.messages:
+                break
+            chunks.append([msg.id for msg in conversation.messages])
+            # What update_memory_summary stores once the chunk is folded.
+            conversation_db.memory_folded_until = conversation.messages[-1].created_at
+            conversation_db.memory_folded_until_id = UUID(conversation.messages[-1].id)
+
+        # Everything after the cursor but the newest 20 tokens, two 10-token turns per chunk.
+        self.assertEqual(chunks, [
+            [str(msg.id) for msg in chronological[1:3]],
+            [str(msg.id) for msg in chronological[3:5]],
+        ])
+
+    def test_oldest_turn_is_loaded_even_over_the_budget(self):
+        chronological = self._add_messages(3)
+
+        chunk = self.repository._get_oldest_messages(self.conversation_id, budget=5, after=None, before=position(chronological[2]))
+
+        self.assertEqual(chunk, chronological[:1])
+
+class TestWindowPageQuery(unittest.TestCase):
+    def test_query_is_a_keyset_range_newest_first(self):
+        folded_at, folded_id = STARTED_AT, UUID(int=1)
+        before_at, before_id = STARTED_AT + timedelta(minutes=5), UUID(int=2)
+
+        sql = str(ConversationDBRepository._window_page_query(
+            uuid4(), (folded_at, folded_id), (before_at, before_id)
+        ).query)
+
+        self.assertIn(
+            f'("messages"."created_at" > {folded_at} OR ("messages"."created_at" = {folded_at} AND "messages"."id" > {folded_id}))',
+            sql
+        )
+        self.assertIn(
+            f'("messages"."created_at" < {before_at} OR ("messages"."created_at" = {before_at} AND "messages"."id" < {before_id}))',
+            sql
+        )
+        self.assertIn(f'NOT ("messages"."role" = {MessageRole.SYSTEM.value})', sql)
+        self.assertTrue(sql.endswith('ORDER BY "messages"."created_at" DESC, "messages"."id" DESC'))
+
+    def test_oldest_first_query_is_ordered_ascending(self):
+        sql = str(ConversationDBRepository._window_page_query(uuid4(), None, None, oldest_first=True).query)
+
+        self.assertTrue(sql.endswith('ORDER BY "messages"."created_at" ASC, "messages"."id" ASC'))
+
+class TestConversationWrites(unittest.TestCase):
+    def setUp(self):
+        self.objects = MagicMock()
+        self.objects.filter.return_value.update.return_value = 1
+        patchers = [
+            patch.object(ConversationDB, "objects", self.objects),
+            patch(f"{REPOSITORY}.transaction.atomic", return_value=nullcontext()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.repository = ConversationDBRepository()
+        self.conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User"))
+        self.conversation.update_summary("Stale summary loaded before the turn")
+        self.conversation.update_status(ConversationStatus.COMPLETED)
+
+    def test_turn_update_leaves_the_summary_fields_alone(self):
+        self.repository.update(self.conversation)
+
+        written = self.objects.filter.return_value.update.call_args.kwargs
+        self.assertEqual(set(written), {"updated_at"})
+
+    def test_update_summary_writes_the_summary_fields(self):
+        self.repository.update_summary(self.conversation)
+
+        written = self.objects.filter.return_value.update.call_args.kwargs
+        self.assertEqual(written["summary"], "Stale summary loaded before the turn")
+        self.assertEqual(written["status"], ConversationStatus.COMPLETED.value)
+        self.assertIn("extracted_data", written)
+
+class TestTokenCountBackfill(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.repository = ConversationDBRepository()
+
+    def test_counts_from_another_encoding_are_redone(self):
+        current = MessageDB(id=uuid4(), content="a b", role="user", token_count=9, token_encoding=ENCODING_MODEL, created_at=STARTED_AT)
+        stale = MessageDB(id=uuid4(), content="a b c", role="user", token_count=9, token_encoding="cl100k_base", created_at=STARTED_AT)
+        unknown = MessageDB(id=uuid4(), content="a", role="user", token_count=9, created_at=STARTED_AT)
+        missing = MessageDB(id=uuid4(), content="a b c d", role="user", created_at=STARTED_AT)
+
+        recounted = self.repository._count_missing_tokens([current, stale, unknown, missing])
+
+        self.assertEqual(recounted, [stale, unknown, missing])
+        self.assertEqual([msg.token_count for msg in recounted], [3, 1, 4])
+        self.assertTrue(all(msg.token_encoding == ENCODING_MODEL for msg in recounted))
+        self.assertEqual(current.token_count, 9)
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+from uuid import uuid4
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.services.prompt_assembler import count_block_tokens
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+class TestConversationEntity(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding())
+        self.get_encoding = patcher.start()
+        self.addCleanup(patcher.stop)
+        count_block_tokens.cache_clear()
+        self.addCleanup(count_block_tokens.cache_clear)
+
+        self.user = UserEntity(_id=str(uuid4()), name="Test User")
+        self.conversation = ConversationEntity(user=self.user, language="")
+
+    def test_message_token_count_is_cached(self):
+        message = MessageEntity(role=MessageRole.USER, content="one two three")
+
+        self.assertEqual(message.get_token_count(), 3)
+        self.assertEqual(message.get_token_count(), 3)
+        self.assertEqual(message.token_count, 3)
+        self.get_encoding.assert_called_once()
+
+    def test_stored_token_count_is_not_recounted(self):
+        message = MessageEntity(role=MessageRole.USER, content="one two three", token_count=7, token_encoding="o200k_base")
+
+        self.assertEqual(message.get_token_count("o200k_base"), 7)
+        self.get_encoding.assert_not_called()
+
+    def test_token_count_from_another_encoding_is_recounted(self):
+        message = MessageEntity(role=MessageRole.USER, content="one two three", token_count=7, token_encoding="cl100k_base")
+
+        self.assertEqual(message.get_token_count("o200k_base"), 3)
+        self.assertEqual(message.token_encoding, "o200k_base")
+        self.get_encoding.assert_called_once_with("o200k_base")
+
+    def test_token_count_of_unknown_encoding_is_recounted(self):
+        message = MessageEntity(role=MessageRole.USER, content="one two three", token_count=7)
+
+        self.assertEqual(message.get_token_count("cl100k_base"), 3)
+        self.assertEqual(message.token_encoding, "cl100k_base")
+
+    def test_memory_keeps_most_recent_messages_within_limit(self):
+        self.conversation.context_windows = 10
+        self.conversation.max_out_tokens = 4
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="one two three"))
+        self.conversation.add_message(MessageEntity(role=MessageRole.ASSISTANT, content="four five six"))
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="seven eight"))
+
+        memory = self.conversation.get_memory()
+
+        self.assertEqual(memory, [
+            {"role": "assistant", "content": "four five six"},
+            {"role": "user", "content": "seven eight"},
+        ])
+
+    def test_budget_and_tokenizer_come_from_the_model(self):
+        self.conversation.model = "gpt-3.5-turbo"
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="one two three"))
+
+        self.assertEqual(self.conversation.get_available_tokens(), 16_385 - 4_096)
+        self.conversation.get_memory()
+        self.get_encoding.assert_called_with("cl100k_base")
+
+    def test_default_model_counts_with_o200k(self):
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="one two three"))
+
+        self.conversation.get_memory()
+
+        self.get_encoding.assert_called_with("o200k_base")
+
+    def test_extracted_data_must_be_an_object(self):
+        with self.assertRaises(ValidationError):
+            self.conversation.update_extracted_data('{"order_id": "123"}')
+
+        self.conversation.update_extracted_data({"order_id": "123"})
+        self.assertEqual(self.conversation.extracted_data, {"order_id": "123"})
+
+    def test_memory_does_not_grow_the_system_prompt(self):
+        self.conversation.update_system_prompt(MessageEntity(role=MessageRole.SYSTEM, content="You are Orion"))
+        self.conversation.update_language("en")
+        self.conversation.update_rag_context("Returns within 30 days")
+
+        first = self.conversation.get_memory()
+        second = self.conversation.get_memory()
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.conversation.system_prompt.content, "You are Orion")
+        self.assertTrue(first[0]["content"].startswith("You are Orion\n\n"))
+        self.assertIn("**en**", first[0]["content"])
+        self.assertIn("Returns within 30 days", first[0]["content"])
+
+    def test_static_prompt_blocks_are_tokenized_once(self):
+        self.conversation.update_system_prompt(MessageEntity(role=MessageRole.SYSTEM, content="You are Orion"))
+        self.conversation.update_language("en")
+        encoding = self.get_encoding.return_value
+
+        with patch.object(encoding, "encode", wraps=encoding.encode) as encode:
+            first = self.conversation.get_assembled_system_prompt()
+            calls = encode.call_count
+            second = self.conversation.get_assembled_system_prompt()
+
+        self.assertEqual(encode.call_count, calls)
+        self.assertEqual(first.get_token_count(), second.get_token_count())
+        self.assertEqual(first.content, second.content)
@@ -0,0 +1,24 @@
+import unittest
+
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.conversation_extraction import CONVERSATION_EXTRACTION_SCHEMA, parse_conversation_extraction
+
+class TestConversationExtraction(unittest.TestCase):
+    def test_parses_into_a_dict_with_every_field(self):
+        extraction = parse_conversation_extraction(
+            '{"order_id": " A-123 ", "user_name": "", "sentiment": "Frustrated", "agent_actions": ["Checked order", " "]}'
+        )
+
+        self.assertEqual(extraction["order_id"], "A-123")
+        self.assertIsNone(extraction["user_name"])
+        self.assertIsNone(extraction["issue"])
+        self.assertEqual(extraction["sentiment"], "frustrated")
+        self.assertEqual(extraction["agent_actions"], ["Checked order"])
+        self.assertEqual(set(extraction), set(CONVERSATION_EXTRACTION_SCHEMA.schema["required"]))
+
+    def test_rejects_malformed_responses(self):
+        for raw in ["not json", '["a list"]', '{"order_id": 123}', '{"agent_actions": "Checked order"}']:
+            with self.subTest(raw=raw):
+                with self.assertRaises(ValidationError) as ctx:
+                    parse_conversation_extraction(raw)
+                self.assertEqual(ctx.exception.code, "INVALID_EXTRACTED_DATA")
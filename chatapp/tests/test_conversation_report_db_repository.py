@@ -0,0 +1,158 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from django.db.models import Q
+
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.exceptions.service_unavailable_error import ServiceUnavailableError
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.conversation_report_query import ConversationReportQuery, ConversationStatsQuery
+from chatapp.infrastructure.models.conversation_db import ConversationDB
+from chatapp.infrastructure.repository.conversation_report_db_repository import ConversationReportDBRepository
+from chatapp.infrastructure.repository.message_db_repository import MessageDBRepository
+
+REPOSITORY = "chatapp.infrastructure.repository.conversation_report_db_repository"
+UPDATED_AT = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+class FakeQuerySet:
+    """Records the filters applied to it and serves fixed rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.filters = []
+        self.alias = None
+        self.sliced = None
+
+    def using(self, alias):
+        self.alias = alias
+        return self
+
+    def only(self, *fields):
+        return self
+
+    def order_by(self, *fields):
+        self.ordering = fields
+        return self
+
+    def filter(self, *args, **kwargs):
+        self.filters.append((args, kwargs))
+        return self
+
+    def __getitem__(self, item):
+        self.sliced = item
+        return self.rows[item]
+
+def make_row(minutes_ago: int) -> ConversationDB:
+    return ConversationDB(
+        id=uuid4(),
+        status=ConversationStatus.COMPLETED.value,
+        summary="Order delayed",
+        extracted_data={"order_id": "123", "sentiment": "negative"},
+        created_at=UPDATED_AT - timedelta(days=1),
+        updated_at=UPDATED_AT - timedelta(minutes=minutes_ago)
+    )
+
+class TestConversationReportSearch(unittest.TestCase):
+    def setUp(self):
+        self.rows = [make_row(0), make_row(1), make_row(2)]
+        self.queryset = FakeQuerySet(self.rows)
+        patcher = patch.object(ConversationDB, "objects", self.queryset)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.repository = ConversationReportDBRepository(using="analytics")
+
+    def test_reads_from_the_analytics_alias_newest_first(self):
+        self.repository.search(ConversationReportQuery())
+
+        self.assertEqual(self.queryset.alias, "analytics")
+        self.assertEqual(self.queryset.ordering, ('-updated_at', '-id'))
+        self.assertEqual(self.queryset.filters, [])
+
+    def test_extracted_fields_become_one_containment_filter(self):
+        self.repository.search(ConversationReportQuery(order_id="123", sentiment="Negative", language_detected="Spanish"))
+
+        self.assertEqual(self.queryset.filters, [
+            ((), {"extracted_data__contains": {"order_id": "123", "sentiment": "negative", "language_detected": "Spanish"}}),
+        ])
+
+    def test_status_and_date_filters(self):
+        updated_from, updated_to = UPDATED_AT - timedelta(days=7), UPDATED_AT
+        self.repository.search(ConversationReportQuery(
+            statuses=[ConversationStatus.COMPLETED, ConversationStatus.FAILED],
+            updated_from=updated_from,
+            updated_to=updated_to
+        ))
+
+        self.assertEqual(self.queryset.filters, [
+            ((), {"status__in": ["completed", "failed"]}),
+            ((), {"updated_at__gte": updated_from}),
+            ((), {"updated_at__lte": updated_to}),
+        ])
+
+    def test_next_cursor_points_at_the_last_row_of_a_full_page(self):
+        page = self.repository.search(ConversationReportQuery(limit=2))
+
+        self.assertEqual(self.queryset.sliced, slice(None, 3))
+        self.assertEqual([row.id for row in page.conversations], [str(row.id) for row in self.rows[:2]])
+        self.assertEqual(
+            MessageDBRepository.decode_cursor(page.next_cursor),
+            (self.rows[1].updated_at, str(self.rows[1].id))
+        )
+
+    def test_last_page_has_no_cursor(self):
+        page = self.repository.search(ConversationReportQuery(limit=3))
+
+        self.assertEqual(len(page.conversations), 3)
+        self.assertIsNone(page.next_cursor)
+
+    def test_cursor_continues_strictly_after_its_row(self):
+        cursor = MessageDBRepository.encode_cursor(self.rows[1].updated_at, str(self.rows[1].id))
+
+        self.repository.search(ConversationReportQuery(before=cursor))
+
+        self.assertEqual(self.queryset.filters, [
+            ((Q(updated_at__lt=self.rows[1].updated_at) | Q(updated_at=self.rows[1].updated_at, id__lt=str(self.rows[1].id)),), {}),
+        ])
+
+    def test_invalid_cursor_is_rejected(self):
+        with self.assertRaises(ValidationError) as context:
+            self.repository.search(ConversationReportQuery(before="not-a-cursor"))
+
+        self.assertEqual(context.exception.code, "INVALID_CURSOR")
+
+    def test_non_object_extracted_data_is_hidden(self):
+        self.rows[0].extracted_data = '{"order_id": "123"}'
+
+        page = self.repository.search(ConversationReportQuery())
+
+        self.assertIsNone(page.conversations[0].extracted_data)
+
+class TestConversationDailyStats(unittest.TestCase):
+    def setUp(self):
+        self.connections = MagicMock()
+        self.cursor = self.connections.__getitem__.return_value.cursor.return_value.__enter__.return_value
+        patcher = patch(f"{REPOSITORY}.connections", self.connections)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.repository = ConversationReportDBRepository(using="analytics")
+
+    def test_missing_view_is_reported_as_not_ready(self):
+        self.cursor.fetchone.return_value = (None,)
+
+        with self.assertRaises(ServiceUnavailableError) as context:
+            self.repository.get_daily_stats(ConversationStatsQuery())
+
+        self.assertEqual(context.exception.code, "STATS_NOT_READY")
+        self.assertEqual(self.cursor.execute.call_count, 1)
+
+    def test_reads_the_view(self):
+        self.cursor.fetchone.return_value = ("conversation_daily_stats",)
+        self.cursor.fetchall.return_value = [(date(2024, 5, 1), "completed", "negative", "Spanish", 4, 3)]
+
+        stats = self.repository.get_daily_stats(ConversationStatsQuery(statuses=[ConversationStatus.COMPLETED]))
+
+        self.assertEqual(stats[0].status, ConversationStatus.COMPLETED)
+        self.assertEqual((stats[0].conversations, stats[0].summarized), (4, 3))
+        self.assertEqual(self.cursor.execute.call_args.args[1]["statuses"], ["completed"])
@@ -0,0 +1,102 @@
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import Mock
+from uuid import uuid4
+
+from chatapp.application.get_conversation_stats_use_case import GetConversationStatsUseCase
+from chatapp.application.search_conversation_reports_use_case import SearchConversationReportsUseCase
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.service_unavailable_error import ServiceUnavailableError
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.conversation_report import ConversationDailyStats, ConversationReportPage, ConversationReportRow
+from chatapp.domain.models.conversation_report_query import ConversationReportQuery, ConversationStatsQuery
+from chatapp.domain.repositories.conversation_report_repository import ConversationReportRepository
+
+class TestSearchConversationReportsUseCase(unittest.TestCase):
+    def setUp(self):
+        self.repository = Mock(spec=ConversationReportRepository)
+        self.use_case = SearchConversationReportsUseCase(conversation_report_repository=self.repository)
+
+    def test_execute_returns_repository_page(self):
+        now = datetime.now(timezone.utc)
+        page = ConversationReportPage(
+            conversations=[ConversationReportRow(
+                id=str(uuid4()),
+                status=ConversationStatus.COMPLETED,
+                summary="Order delayed",
+                extracted_data={"order_id": "123"},
+                created_at=now,
+                updated_at=now
+            )],
+            next_cursor="cursor"
+        )
+        self.repository.search.return_value = page
+        query = ConversationReportQuery(order_id="123", statuses=[ConversationStatus.COMPLETED], limit=10)
+
+        result = self.use_case.execute(query)
+
+        self.assertIs(result, page)
+        self.repository.search.assert_called_once_with(query)
+
+    def test_execute_rejects_inverted_date_range(self):
+        query = ConversationReportQuery(
+            updated_from=datetime(2024, 2, 1, tzinfo=timezone.utc),
+            updated_to=datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+
+        with self.assertRaises(ValidationError) as context:
+            self.use_case.execute(query)
+
+        self.assertEqual(context.exception.code, "INVALID_DATE_RANGE")
+        self.repository.search.assert_not_called()
+
+    def test_execute_propagates_invalid_cursor(self):
+        self.repository.search.side_effect = ValidationError(message="Invalid pagination cursor", code="INVALID_CURSOR")
+
+        with self.assertRaises(ValidationError):
+            self.use_case.execute(ConversationReportQuery(before="garbage"))
+
+    def test_execute_wraps_repository_errors(self):
+        self.repository.search.side_effect = Exception("canceling statement due to statement timeout")
+
+        with self.assertRaises(InternalError):
+            self.use_case.execute(ConversationReportQuery())
+
+class TestGetConversationStatsUseCase(unittest.TestCase):
+    def setUp(self):
+        self.repository = Mock(spec=ConversationReportRepository)
+        self.use_case = GetConversationStatsUseCase(conversation_report_repository=self.repository)
+
+    def test_execute_returns_daily_stats(self):
+        stats = [ConversationDailyStats(
+            day=date(2024, 1, 1),
+            status=ConversationStatus.COMPLETED,
+            sentiment="positive",
+            language_detected="Spanish",
+            conversations=4,
+            summarized=3
+        )]
+        self.repository.get_daily_stats.return_value = stats
+        query = ConversationStatsQuery(date_from=date(2024, 1, 1), date_to=date(2024, 1, 31))
+
+        self.assertEqual(self.use_case.execute(query), stats)
+        self.repository.get_daily_stats.assert_called_once_with(query)
+
+    def test_execute_rejects_inverted_date_range(self):
+        with self.assertRaises(ValidationError):
+            self.use_case.execute(ConversationStatsQuery(date_from=date(2024, 2, 1), date_to=date(2024, 1, 1)))
+
+        self.repository.get_daily_stats.assert_not_called()
+
+    def test_execute_propagates_stats_not_ready(self):
+        self.repository.get_daily_stats.side_effect = ServiceUnavailableError(code="STATS_NOT_READY")
+
+        with self.assertRaises(ServiceUnavailableError):
+            self.use_case.execute(ConversationStatsQuery())
+
+    def test_execute_wraps_repository_errors(self):
+        self.repository.get_daily_stats.side_effect = Exception("relation does not exist")
+
+        with self.assertRaises(InternalError):
+            self.use_case.execute(ConversationStatsQuery())
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from rest_framework.test import APIRequestFactory
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.infrastructure.api.response_mode import DELTA_MEDIA_TYPE
+from chatapp.infrastructure.controllers.conversation_view import ConversationView
+
+class TestConversationViewResponseMode(unittest.TestCase):
+    def setUp(self):
+        self.conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User"))
+        self.conversation.add_message(MessageEntity(role=MessageRole.SYSTEM, content="System prompt"))
+        self.conversation.add_message(MessageEntity(role=MessageRole.ASSISTANT, content="Hello!"))
+        self.conversation.mark_messages_as_saved()
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="Where is my order?"))
+        self.conversation.add_message(MessageEntity(role=MessageRole.ASSISTANT, content="On its way."))
+        self.conversation.mark_messages_as_saved()
+
+        use_case = Mock()
+        use_case.execute.return_value = self.conversation
+        patcher = patch("chatapp.infrastructure.controllers.conversation_view.container")
+        patcher.start().process_message_use_case.return_value = use_case
+        self.addCleanup(patcher.stop)
+
+        self.factory = APIRequestFactory()
+        self.view = ConversationView.as_view()
+        self.payload = {"content": "Where is my order?", "language": "en"}
+
+    def post(self, path="/message", **headers):
+        request = self.factory.post(path, self.payload, format="json", **headers)
+        response = self.view(request, conversation_id=self.conversation.id)
+        response.render()
+        return response
+
+    def test_full_conversation_by_default(self):
+        response = self.post()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["messages"]), 4)
+
+    def test_delta_by_query_param(self):
+        response = self.post("/message?view=delta")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([msg["content"] for msg in response.data["messages"]], ["Where is my order?", "On its way."])
+        self.assertEqual(response.data["status"], "active")
+
+    def test_delta_by_accept_header(self):
+        response = self.post(HTTP_ACCEPT=DELTA_MEDIA_TYPE)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], DELTA_MEDIA_TYPE)
+        self.assertEqual(len(response.data["messages"]), 2)
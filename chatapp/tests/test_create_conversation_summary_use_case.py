@@ -5,13 +5,22 @@ from uuid import uuid4
 from chatapp.application.create_conversation_summary_use_case import (
     CreateConversationSummaryUseCase,
     SYSTEM_PROMPT_SUMMARY,
-    SYSTEM_PROMPT_DATE_EXTRACTION
+    SYSTEM_PROMPT_DATE_EXTRACTION,
+    SYSTEM_PROMPT_EXTRACTION_REPAIR
 )
 from chatapp.domain.entities.conversation import ConversationEntity, ConversationStatus
 from chatapp.domain.entities.message import MessageEntity, MessageRole
 from chatapp.domain.entities.user import UserEntity
 from chatapp.domain.exceptions.internal_error import InternalError
 from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.models.conversation_extraction import CONVERSATION_EXTRACTION_SCHEMA, TEXT_FIELDS
+from chatapp.domain.services.model_router import LLMTask
+
+def extraction(**fields):
+    data = {field: None for field in TEXT_FIELDS}
+    data["agent_actions"] = []
+    data.update(fields)
+    return data
 
 class TestCreateConversationSummaryUseCase(unittest.TestCase):
     def setUp(self):
@@ -22,37 +31,52 @@ class TestCreateConversationSummaryUseCase(unittest.TestCase):
             llm_service=self.llm_service
         )
         
+        # Extraction goes through the structured call; routing it to generate_response lets one fake answer both.
+        self.llm_service.generate_structured_response.side_effect = (
+            lambda conversation, schema: self.llm_service.generate_response(conversation)
+        )
+
         self.user = UserEntity(_id=str(uuid4()), name="Test User")
         self.conversation_id = str(uuid4())
         self.conversation = ConversationEntity(user=self.user, _id=self.conversation_id)
 
+    @staticmethod
+    def respond_by_prompt(summary, extraction):
+        # The two completions run concurrently, so responses are keyed by system prompt, not call order.
+        def generate_response(conversation):
+            response = summary if conversation.system_prompt.content == SYSTEM_PROMPT_SUMMARY else extraction
+            if isinstance(response, Exception):
+                raise response
+            return MessageEntity(role=MessageRole.ASSISTANT, content=response)
+        return generate_response
+
     def test_create_summary_successfully(self):
         self.conversation_repository.get_by_id.return_value = self.conversation
         
         def update_and_return(conversation):
             return conversation
             
-        self.conversation_repository.update.side_effect = update_and_return
+        self.conversation_repository.update_summary.side_effect = update_and_return
 
         prompts_used = []
+        respond = self.respond_by_prompt("Test summary", '{"order_id": "123"}')
         def capture_prompt(conversation):
             prompts_used.append(conversation.system_prompt.content)
-            return MessageEntity(role=MessageRole.ASSISTANT, content="Test summary" if len(prompts_used) == 1 else "Test extraction")
-        
+            return respond(conversation)
+
         self.llm_service.generate_response.side_effect = capture_prompt
 
         result = self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
 
         self.assertEqual(result, self.conversation)
         self.assertEqual(result.summary, "Test summary")
-        self.assertEqual(result.extracted_data, "Test extraction")
+        self.assertEqual(result.extracted_data, extraction(order_id="123"))
         self.assertEqual(result.status, ConversationStatus.COMPLETED)
 
         self.assertEqual(len(prompts_used), 2)
-        self.assertEqual(prompts_used[0], SYSTEM_PROMPT_SUMMARY)
-        self.assertEqual(prompts_used[1], SYSTEM_PROMPT_DATE_EXTRACTION)
+        self.assertCountEqual(prompts_used, [SYSTEM_PROMPT_SUMMARY, SYSTEM_PROMPT_DATE_EXTRACTION])
 
-        self.conversation_repository.update.assert_called_once_with(self.conversation)
+        self.conversation_repository.update_summary.assert_called_once_with(self.conversation)
 
     def test_conversation_not_found(self):
         self.conversation_repository.get_by_id.return_value = None
@@ -63,7 +87,7 @@ class TestCreateConversationSummaryUseCase(unittest.TestCase):
         self.assertEqual(context.exception.code, "CONVERSATION_NOT_FOUND")
         self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
         self.llm_service.generate_response.assert_not_called()
-        self.conversation_repository.update.assert_not_called()
+        self.conversation_repository.update_summary.assert_not_called()
 
     def test_llm_service_error_during_summary(self):
         self.conversation_repository.get_by_id.return_value = self.conversation
@@ -74,31 +98,35 @@ class TestCreateConversationSummaryUseCase(unittest.TestCase):
         
         self.assertIn("Failed to end the conversation", str(context.exception))
         self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
-        self.llm_service.generate_response.assert_called_once()
-        self.conversation_repository.update.assert_not_called()
+        self.assertEqual(self.llm_service.generate_response.call_count, 2)
+        self.conversation_repository.update_summary.assert_not_called()
 
-    def test_llm_service_error_during_extraction(self):
+    def test_summary_error_with_successful_extraction(self):
         self.conversation_repository.get_by_id.return_value = self.conversation
-        summary_response = MessageEntity(role=MessageRole.ASSISTANT, content="Test summary")
-        self.llm_service.generate_response.side_effect = [
-            summary_response,
-            Exception("LLM Error")
-        ]
+        self.llm_service.generate_response.side_effect = self.respond_by_prompt(Exception("LLM Error"), '{"order_id": "123"}')
 
-        with self.assertRaises(InternalError) as context:
-            self.use_case.execute(self.conversation_id, ConversationStatus.FAILED)
-        
-        self.assertIn("Failed to end the conversation", str(context.exception))
-        self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
+        with self.assertRaises(InternalError):
+            self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.conversation_repository.update_summary.assert_not_called()
+
+    def test_llm_service_error_during_extraction_keeps_summary(self):
+        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.update_summary.side_effect = lambda conversation: conversation
+        self.llm_service.generate_response.side_effect = self.respond_by_prompt("Test summary", Exception("LLM Error"))
+
+        result = self.use_case.execute(self.conversation_id, ConversationStatus.FAILED)
+
+        self.assertEqual(result.summary, "Test summary")
+        self.assertIsNone(result.extracted_data)
+        self.assertEqual(result.status, ConversationStatus.FAILED)
         self.assertEqual(self.llm_service.generate_response.call_count, 2)
-        self.conversation_repository.update.assert_not_called()
+        self.conversation_repository.update_summary.assert_called_once_with(self.conversation)
 
     def test_repository_update_error(self):
         self.conversation_repository.get_by_id.return_value = self.conversation
-        summary_response = MessageEntity(role=MessageRole.ASSISTANT, content="Test summary")
-        extraction_response = MessageEntity(role=MessageRole.ASSISTANT, content="Test extraction")
-        self.llm_service.generate_response.side_effect = [summary_response, extraction_response]
-        self.conversation_repository.update.side_effect = Exception("DB Error")
+        self.llm_service.generate_response.side_effect = self.respond_by_prompt("Test summary", '{"order_id": "123"}')
+        self.conversation_repository.update_summary.side_effect = Exception("DB Error")
 
         with self.assertRaises(InternalError) as context:
             self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
@@ -106,25 +134,11 @@ class TestCreateConversationSummaryUseCase(unittest.TestCase):
         self.assertIn("Failed to end the conversation", str(context.exception))
         self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
         self.assertEqual(self.llm_service.generate_response.call_count, 2)
-        self.conversation_repository.update.assert_called_once()
+        self.conversation_repository.update_summary.assert_called_once()
 
     def test_status_update(self):
         self.conversation_repository.get_by_id.return_value = self.conversation
-        self.conversation_repository.update.return_value = self.conversation
-
-        status_responses = []
-        for status in [
-            ConversationStatus.COMPLETED,
-            ConversationStatus.FAILED,
-            ConversationStatus.PENDING_REVIEW,
-            ConversationStatus.ARCHIVED,
-            ConversationStatus.DELETED
-        ]:
-            status_responses.extend([
-                MessageEntity(role=MessageRole.ASSISTANT, content=f"Summary for {status.value}"),
-                MessageEntity(role=MessageRole.ASSISTANT, content=f"Extraction for {status.value}")
-            ])
-        self.llm_service.generate_response.side_effect = status_responses
+        self.conversation_repository.update_summary.return_value = self.conversation
 
         for status in [
             ConversationStatus.COMPLETED,
@@ -135,40 +149,110 @@ class TestCreateConversationSummaryUseCase(unittest.TestCase):
         ]:
             with self.subTest(status=status):
                 self.conversation_repository.get_by_id.reset_mock()
-                self.conversation_repository.update.reset_mock()
+                self.conversation_repository.update_summary.reset_mock()
                 self.conversation = ConversationEntity(user=self.user, _id=self.conversation_id)
                 self.conversation_repository.get_by_id.return_value = self.conversation
-                self.conversation_repository.update.return_value = self.conversation
+                self.conversation_repository.update_summary.return_value = self.conversation
+                self.llm_service.generate_response.side_effect = self.respond_by_prompt(
+                    f"Summary for {status.value}", f'{{"issue": "Issue for {status.value}"}}'
+                )
 
                 result = self.use_case.execute(self.conversation_id, status)
 
                 self.assertEqual(result.status, status)
                 self.assertEqual(result.summary, f"Summary for {status.value}")
-                self.assertEqual(result.extracted_data, f"Extraction for {status.value}")
+                self.assertEqual(result.extracted_data, extraction(issue=f"Issue for {status.value}"))
                 self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
-                self.conversation_repository.update.assert_called_once_with(self.conversation)
+                self.conversation_repository.update_summary.assert_called_once_with(self.conversation)
 
-    def test_only_one_system_prompt_in_memory(self):
+    def test_each_completion_gets_its_own_conversation_copy(self):
+        original_prompt = MessageEntity(role=MessageRole.SYSTEM, content="Support agent prompt")
+        self.conversation.update_system_prompt(original_prompt)
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="Where is my order?"))
         self.conversation_repository.get_by_id.return_value = self.conversation
-        self.conversation_repository.update.return_value = self.conversation
+        self.conversation_repository.update_summary.side_effect = lambda conversation: conversation
 
-        saved_conversations = []
-        def capture_conversation(conversation):
-            saved_conversations.append(conversation)
-            return conversation
-        self.conversation_repository.update.side_effect = capture_conversation
+        seen_conversations = []
+        respond = self.respond_by_prompt("Test summary", '{"key": "value"}')
+        def generate_response(conversation):
+            seen_conversations.append(conversation)
+            return respond(conversation)
+        self.llm_service.generate_response.side_effect = generate_response
+
+        result = self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.assertIs(result.system_prompt, original_prompt)
+        self.assertEqual(original_prompt.content, "Support agent prompt")
+        self.assertEqual(len(seen_conversations), 2)
+        self.assertIsNot(seen_conversations[0], seen_conversations[1])
+        for conversation in seen_conversations:
+            self.assertIsNot(conversation, self.conversation)
+            self.assertEqual(conversation.messages, self.conversation.messages)
 
+    def test_summary_and_extraction_are_routed_separately(self):
+        model_router = Mock()
+        models = {LLMTask.SUMMARY: "gpt-4o-mini", LLMTask.EXTRACTION: "gpt-4o"}
+        model_router.apply.side_effect = lambda conversation, task: conversation.with_model(models[task])
+        use_case = CreateConversationSummaryUseCase(
+            conversation_repository=self.conversation_repository,
+            llm_service=self.llm_service,
+            model_router=model_router
+        )
+        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.update_summary.side_effect = lambda conversation: conversation
+
+        seen_models = {}
+        respond = self.respond_by_prompt("Test summary", '{"key": "value"}')
         def generate_response(conversation):
-            if conversation.system_prompt.content == SYSTEM_PROMPT_SUMMARY:
-                return MessageEntity(role=MessageRole.ASSISTANT, content="Test summary")
-            else:
-                return MessageEntity(role=MessageRole.ASSISTANT, content='{"key": "value"}')
+            seen_models[conversation.system_prompt.content] = conversation.model
+            return respond(conversation)
         self.llm_service.generate_response.side_effect = generate_response
 
-        self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+        use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.assertEqual(seen_models, {SYSTEM_PROMPT_SUMMARY: "gpt-4o-mini", SYSTEM_PROMPT_DATE_EXTRACTION: "gpt-4o"})
+
+    def test_extraction_uses_the_json_schema(self):
+        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.update_summary.side_effect = lambda conversation: conversation
+        self.llm_service.generate_response.side_effect = self.respond_by_prompt("Test summary", '{"sentiment": "Happy"}')
 
-        final_conversation = saved_conversations[-1]
-        self.assertEqual(final_conversation.system_prompt.content, SYSTEM_PROMPT_DATE_EXTRACTION)
+        result = self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.assertEqual(result.extracted_data, extraction(sentiment="happy"))
+        self.llm_service.generate_structured_response.assert_called_once()
+        self.assertIs(self.llm_service.generate_structured_response.call_args.args[1], CONVERSATION_EXTRACTION_SCHEMA)
+
+    def test_invalid_extraction_is_repaired_once(self):
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="Order 123 never arrived"))
+        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.update_summary.side_effect = lambda conversation: conversation
+        self.llm_service.generate_response.side_effect = self.respond_by_prompt("Test summary", "unused")
+        replies = iter(['{"order_id": "123", ', '{"order_id": "123"}'])
+        repair_conversations = []
+        def generate_structured_response(conversation, schema):
+            repair_conversations.append(conversation)
+            return MessageEntity(role=MessageRole.ASSISTANT, content=next(replies))
+        self.llm_service.generate_structured_response.side_effect = generate_structured_response
+
+        result = self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.assertEqual(result.extracted_data, extraction(order_id="123"))
+        repair = repair_conversations[1]
+        self.assertEqual(repair.system_prompt.content, SYSTEM_PROMPT_EXTRACTION_REPAIR)
+        self.assertEqual(len(repair.messages), 1)
+        self.assertIn('{"order_id": "123", ', repair.messages[0].content)
+
+    def test_extraction_still_invalid_after_repair_keeps_summary(self):
+        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.update_summary.side_effect = lambda conversation: conversation
+        self.llm_service.generate_response.side_effect = self.respond_by_prompt("Test summary", "not json")
+
+        result = self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.assertEqual(result.summary, "Test summary")
+        self.assertIsNone(result.extracted_data)
+        self.assertEqual(self.llm_service.generate_structured_response.call_count, 2)
 
     def test_update_system_prompt_replaces_previous(self):
         first_prompt = MessageEntity(role=MessageRole.SYSTEM, content="First prompt")
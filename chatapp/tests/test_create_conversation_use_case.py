@@ -93,4 +93,45 @@ class TestCreateConversationUseCase(unittest.TestCase):
         
         self.assertIn("Error creating the conversation", str(context.exception))
         self.user_repository.create_anonymous.assert_called_once()
-        self.llm_service.generate_response.assert_called_once()
\ No newline at end of file
+        self.llm_service.generate_response.assert_called_once()
+    def test_create_conversation_uses_pooled_greeting(self):
+        # Arrange
+        greeting_service = Mock()
+        greeting_service.get_greeting.return_value = "¡Hola! ¿En qué puedo ayudarte?"
+        use_case = CreateConversationUseCase(
+            self.conversation_repository,
+            self.user_repository,
+            self.llm_service,
+            greeting_service
+        )
+        self.user_repository.create_anonymous.return_value = UserEntity(_id=str(uuid4()), name="Anonymous")
+        self.conversation_repository.create.side_effect = lambda conversation: conversation
+
+        # Act
+        result = use_case.execute(CreateConversationInput(user_id=None, language="es"))
+
+        # Assert
+        greeting_service.prefetch.assert_called_once()
+        self.assertEqual(greeting_service.get_greeting.call_args.args[1], "es")
+        self.assertEqual(result.messages[-1].content, "¡Hola! ¿En qué puedo ayudarte?")
+        self.assertEqual(result.messages[-1].role, MessageRole.ASSISTANT)
+        self.llm_service.generate_response.assert_not_called()
+
+    def test_create_conversation_falls_back_to_llm_until_pool_is_ready(self):
+        # Arrange
+        greeting_service = Mock()
+        greeting_service.get_greeting.return_value = None
+        use_case = CreateConversationUseCase(
+            self.conversation_repository,
+            self.user_repository,
+            self.llm_service,
+            greeting_service
+        )
+        self.user_repository.create_anonymous.return_value = UserEntity(_id=str(uuid4()), name="Anonymous")
+        self.llm_service.generate_response.return_value = MessageEntity(role=MessageRole.ASSISTANT, content="Hello!")
+
+        # Act
+        use_case.execute(CreateConversationInput(user_id=None, language="es"))
+
+        # Assert
+        self.llm_service.generate_response.assert_called_once()
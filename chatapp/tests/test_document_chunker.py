@@ -0,0 +1,76 @@
+import unittest
+from unittest.mock import patch
+
+from chatapp.infrastructure.services.document_chunker import chunk_text, hash_content
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+    def decode_with_offsets(self, tokens):
+        offsets, position = [], 0
+        for token in tokens:
+            offsets.append(position)
+            position += len(token) + 1
+        return self.decode(tokens), offsets
+
+class ByteEncoding:
+    """One token per UTF-8 byte, so windows regularly end inside accented characters."""
+
+    def encode(self, text):
+        return list(text.encode("utf-8"))
+
+    def decode_with_offsets(self, tokens):
+        # Same rule as tiktoken: a token starting with a continuation byte belongs to the character before it.
+        offsets, text_length = [], 0
+        for token in tokens:
+            offsets.append(max(0, text_length - (0x80 <= token < 0xC0)))
+            text_length += 0 if 0x80 <= token < 0xC0 else 1
+        return bytes(tokens).decode("utf-8"), offsets
+
+class TestDocumentChunker(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("chatapp.infrastructure.services.document_chunker.get_encoding", return_value=FakeEncoding())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_chunks_overlap_and_cover_the_whole_text(self):
+        chunks = chunk_text("a b c d e f g h i j", chunk_tokens=4, overlap_tokens=1)
+
+        self.assertEqual([chunk.content for chunk in chunks], ["a b c d", "d e f g", "g h i j"])
+        self.assertEqual([chunk.index for chunk in chunks], [0, 1, 2])
+        self.assertEqual([chunk.token_count for chunk in chunks], [4, 4, 4])
+
+    def test_short_text_is_a_single_chunk(self):
+        chunks = chunk_text("a b c", chunk_tokens=4, overlap_tokens=1)
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(chunks[0].content, "a b c")
+        self.assertEqual(chunks[0].token_count, 3)
+
+    def test_overlap_must_be_smaller_than_chunk(self):
+        with self.assertRaises(ValueError):
+            chunk_text("a b c", chunk_tokens=4, overlap_tokens=4)
+
+    def test_chunk_hash_only_depends_on_content(self):
+        first = chunk_text("a b c d e f", chunk_tokens=3, overlap_tokens=0)
+        second = chunk_text("x y z d e f", chunk_tokens=3, overlap_tokens=0)
+
+        self.assertNotEqual(first[0].content_hash, second[0].content_hash)
+        self.assertEqual(first[1].content_hash, second[1].content_hash)
+        self.assertEqual(first[1].content_hash, hash_content("d e f"))
+
+    def test_chunks_never_split_multibyte_characters(self):
+        text = "El niño pidió un reembolso: ¿cuándo llegará mi pedido? Añádelo a la dirección."
+        with patch("chatapp.infrastructure.services.document_chunker.get_encoding", return_value=ByteEncoding()):
+            for chunk_tokens, overlap_tokens in [(5, 0), (7, 2), (16, 3)]:
+                with self.subTest(chunk_tokens=chunk_tokens, overlap_tokens=overlap_tokens):
+                    chunks = chunk_text(text, chunk_tokens=chunk_tokens, overlap_tokens=overlap_tokens)
+
+                    self.assertTrue(all("\ufffd" not in chunk.content for chunk in chunks))
+                    self.assertTrue(all(chunk.content in text for chunk in chunks))
+                    for character in {character for character in text if not character.isascii()}:
+                        self.assertTrue(any(character in chunk.content for chunk in chunks))
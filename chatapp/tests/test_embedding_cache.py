@@ -0,0 +1,62 @@
+import unittest
+
+from django.core.cache.backends.locmem import LocMemCache
+
+from chatapp.infrastructure.services.embedding_cache import EmbeddingCache
+
+MODEL = "text-embedding-3-small"
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = EmbeddingCache(max_size=2, ttl=60, clock=self.clock)
+
+    def test_normalized_text_hits_the_same_entry(self):
+        self.cache.set("Where is my order?", MODEL, [0.1, 0.2])
+
+        self.assertEqual(self.cache.get("  where is   my ORDER?\n", MODEL), [0.1, 0.2])
+        self.assertIsNone(self.cache.get("Where is my order?", "another-model"))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.set("first", MODEL, [1.0])
+        self.cache.set("second", MODEL, [2.0])
+        self.cache.get("first", MODEL)
+        self.cache.set("third", MODEL, [3.0])
+
+        self.assertEqual(self.cache.get("first", MODEL), [1.0])
+        self.assertIsNone(self.cache.get("second", MODEL))
+        self.assertEqual(self.cache.get("third", MODEL), [3.0])
+
+    def test_entries_expire_after_ttl(self):
+        self.cache.set("hello", MODEL, [1.0])
+        self.clock.now = 61
+
+        self.assertIsNone(self.cache.get("hello", MODEL))
+
+    def test_shared_tier_fills_local_tier(self):
+        shared = LocMemCache("test-embeddings", {})
+        EmbeddingCache(max_size=2, ttl=60, shared_cache=shared).set("hello", MODEL, [1.0])
+        cache = EmbeddingCache(max_size=2, ttl=60, shared_cache=shared)
+
+        self.assertEqual(cache.get("hello", MODEL), [1.0])
+        self.assertEqual(cache.get("hello", MODEL), [1.0])
+        stats = cache.stats()
+        self.assertEqual(stats["shared_hits"], 1)
+        self.assertEqual(stats["local_hits"], 1)
+
+    def test_stats_count_hits_and_misses(self):
+        self.cache.get("hello", MODEL)
+        self.cache.set("hello", MODEL, [1.0])
+        self.cache.get("hello", MODEL)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["local_hits"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
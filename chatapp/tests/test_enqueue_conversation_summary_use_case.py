@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from chatapp.application.enqueue_conversation_summary_use_case import EnqueueConversationSummaryUseCase
+from chatapp.domain.entities.conversation import ConversationStatus
+from chatapp.domain.entities.job import JobKind, JobStatus
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.repositories.conversation_repository import ConversationRepository
+from chatapp.domain.repositories.job_repository import JobRepository
+
+class TestEnqueueConversationSummaryUseCase(unittest.TestCase):
+    def setUp(self):
+        self.conversation_repository = Mock(spec=ConversationRepository)
+        self.job_repository = Mock(spec=JobRepository)
+        self.job_repository.enqueue.side_effect = lambda job: job
+        self.use_case = EnqueueConversationSummaryUseCase(
+            conversation_repository=self.conversation_repository,
+            job_repository=self.job_repository,
+            max_attempts=5
+        )
+        self.conversation_id = str(uuid4())
+
+    def test_execute_queues_a_summary_job(self):
+        self.conversation_repository.exists.return_value = True
+
+        job = self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.assertEqual(job.kind, JobKind.CONVERSATION_SUMMARY)
+        self.assertEqual(job.status, JobStatus.QUEUED)
+        self.assertEqual(job.max_attempts, 5)
+        self.assertEqual(job.payload, {"conversation_id": self.conversation_id, "conversation_status": "completed"})
+        self.job_repository.enqueue.assert_called_once_with(job)
+
+    def test_execute_conversation_not_found(self):
+        self.conversation_repository.exists.return_value = False
+
+        with self.assertRaises(NotFoundError):
+            self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
+
+        self.job_repository.enqueue.assert_not_called()
+
+    def test_execute_repository_error(self):
+        self.conversation_repository.exists.return_value = True
+        self.job_repository.enqueue.side_effect = Exception("DB Error")
+
+        with self.assertRaises(InternalError):
+            self.use_case.execute(self.conversation_id, ConversationStatus.COMPLETED)
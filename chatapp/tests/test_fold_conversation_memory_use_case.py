@@ -0,0 +1,156 @@
+import unittest
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from chatapp.application.enqueue_conversation_memory_fold_use_case import EnqueueConversationMemoryFoldUseCase
+from chatapp.application.fold_conversation_memory_use_case import SYSTEM_PROMPT_MEMORY_FOLD, FoldConversationMemoryUseCase
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.job import JobKind
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.repositories.conversation_repository import ConversationRepository
+from chatapp.domain.repositories.job_repository import JobRepository
+from chatapp.domain.services.prompt_assembler import count_block_tokens
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+def make_conversation(*contents, memory_summary=None):
+    conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User"), memory_summary=memory_summary)
+    conversation.system_prompt = MessageEntity(role=MessageRole.SYSTEM, content="You are Orion")
+    conversation.messages.append(conversation.system_prompt)
+    for index, content in enumerate(contents):
+        role = MessageRole.USER if index % 2 == 0 else MessageRole.ASSISTANT
+        conversation.messages.append(MessageEntity(role=role, content=content))
+    return conversation
+
+class TestFoldConversationMemoryUseCase(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        count_block_tokens.cache_clear()
+        self.addCleanup(count_block_tokens.cache_clear)
+
+        self.conversation_repository = Mock(spec=ConversationRepository)
+        self.llm_service = Mock()
+        self.llm_service.generate_response.return_value = MessageEntity(role=MessageRole.ASSISTANT, content="Order 123 is late")
+        self.use_case = FoldConversationMemoryUseCase(
+            conversation_repository=self.conversation_repository,
+            llm_service=self.llm_service,
+            recent_tokens=4
+        )
+        self.conversation_id = str(uuid4())
+
+    def test_folds_the_unfolded_turns(self):
+        conversation = make_conversation("where is order 123", "let me check", memory_summary="Earlier: greeting")
+        self.conversation_repository.get_unfolded_by_id.side_effect = [conversation, make_conversation()]
+
+        folded = self.use_case.execute(self.conversation_id)
+
+        self.assertEqual(folded, 2)
+        self.conversation_repository.get_unfolded_by_id.assert_called_with(self.conversation_id, 4)
+        fold_conversation = self.llm_service.generate_response.call_args.args[0]
+        self.assertEqual([msg.content for msg in fold_conversation.messages], ["where is order 123", "let me check"])
+        self.assertEqual(fold_conversation.system_prompt.content, SYSTEM_PROMPT_MEMORY_FOLD)
+        self.assertIn("Earlier: greeting", fold_conversation.get_memory()[0]["content"])
+        self.conversation_repository.update_memory_summary.assert_called_once_with(
+            self.conversation_id, "Order 123 is late", conversation.messages[2]
+        )
+        self.assertEqual(len(conversation.messages), 3)
+
+    def test_backlog_larger_than_one_fold_is_folded_from_the_cursor(self):
+        backlog = make_conversation("a b c", "d e f", "g h i", "j k l", "m n o").messages[1:]
+        state = {"cursor": 0, "summary": "one two three four"}
+        # Room for the fold prompt and two turns of three tokens.
+        probe = make_conversation(memory_summary=state["summary"]).with_system_prompt(
+            MessageEntity(role=MessageRole.SYSTEM, content=SYSTEM_PROMPT_MEMORY_FOLD)
+        )
+        context_windows = probe.get_assembled_system_prompt().get_token_count(probe.get_model_spec().encoding) + 6
+
+        def get_unfolded_by_id(conversation_id, keep_tokens):
+            conversation = make_conversation(memory_summary=state["summary"])
+            conversation.context_windows, conversation.max_out_tokens = context_windows, 0
+            conversation.messages.extend(backlog[state["cursor"]:])
+            return conversation
+
+        def update_memory_summary(conversation_id, memory_summary, folded_until):
+            state["cursor"] = backlog.index(folded_until) + 1
+            state["summary"] = memory_summary
+
+        self.conversation_repository.get_unfolded_by_id.side_effect = get_unfolded_by_id
+        self.conversation_repository.update_memory_summary.side_effect = update_memory_summary
+        self.llm_service.generate_response.side_effect = [
+            MessageEntity(role=MessageRole.ASSISTANT, content=f"summary after fold {index}") for index in range(3)
+        ]
+
+        folded = self.use_case.execute(self.conversation_id)
+
+        self.assertEqual(folded, 5)
+        self.assertEqual(state["cursor"], len(backlog))
+        chunks = [call.args[0] for call in self.llm_service.generate_response.call_args_list]
+        self.assertEqual(
+            [[msg.content for msg in chunk.messages] for chunk in chunks],
+            [["a b c", "d e f"], ["g h i", "j k l"], ["m n o"]]
+        )
+        # Each chunk is folded into the summary the previous one produced.
+        self.assertIn("summary after fold 0", chunks[1].get_memory()[0]["content"])
+        self.assertIn("summary after fold 1", chunks[2].get_memory()[0]["content"])
+
+    def test_nothing_to_fold_skips_the_llm(self):
+        self.conversation_repository.get_unfolded_by_id.return_value = make_conversation()
+
+        self.assertEqual(self.use_case.execute(self.conversation_id), 0)
+        self.llm_service.generate_response.assert_not_called()
+        self.conversation_repository.update_memory_summary.assert_not_called()
+
+    def test_missing_conversation_raises_not_found(self):
+        self.conversation_repository.get_unfolded_by_id.return_value = None
+
+        with self.assertRaises(NotFoundError):
+            self.use_case.execute(self.conversation_id)
+
+    def test_llm_failure_raises_internal_error(self):
+        self.conversation_repository.get_unfolded_by_id.return_value = make_conversation("a b c", "d e f", "g h")
+        self.llm_service.generate_response.side_effect = RuntimeError("openai down")
+
+        with self.assertRaises(InternalError):
+            self.use_case.execute(self.conversation_id)
+        self.conversation_repository.update_memory_summary.assert_not_called()
+
+class TestEnqueueConversationMemoryFoldUseCase(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.job_repository = Mock(spec=JobRepository)
+        self.job_repository.has_pending.return_value = False
+        self.job_repository.enqueue.side_effect = lambda job: job
+        self.use_case = EnqueueConversationMemoryFoldUseCase(
+            job_repository=self.job_repository,
+            recent_tokens=4,
+            fold_tokens=2
+        )
+
+    def test_short_history_is_not_folded(self):
+        self.assertIsNone(self.use_case.execute(make_conversation("one two", "three four")))
+        self.job_repository.enqueue.assert_not_called()
+
+    def test_long_history_queues_one_fold(self):
+        conversation = make_conversation("one two three", "four five six", "seven")
+
+        job = self.use_case.execute(conversation)
+
+        self.assertEqual(job.kind, JobKind.CONVERSATION_MEMORY_FOLD)
+        self.assertEqual(job.payload, {"conversation_id": conversation.id})
+        self.job_repository.has_pending.assert_called_once_with(JobKind.CONVERSATION_MEMORY_FOLD, {"conversation_id": conversation.id})
+
+    def test_pending_fold_is_not_queued_twice(self):
+        self.job_repository.has_pending.return_value = True
+
+        self.assertIsNone(self.use_case.execute(make_conversation("one two three", "four five six", "seven")))
+        self.job_repository.enqueue.assert_not_called()
@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import Mock
+
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.services.model_router import LLMTask
+from chatapp.infrastructure.services.greeting_pool import GreetingPool
+
+class InlineExecutor:
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append(args)
+        fn(*args)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestGreetingPool(unittest.TestCase):
+    def setUp(self):
+        self.llm_service = Mock()
+        self.llm_service.generate_response.side_effect = lambda conversation: MessageEntity(
+            role=MessageRole.ASSISTANT,
+            content=f"Hello ({conversation.language})"
+        )
+        self.executor = InlineExecutor()
+        self.clock = FakeClock()
+        self.pool = GreetingPool(
+            llm_service=self.llm_service,
+            variants=2,
+            ttl=60,
+            languages=["es", "en"],
+            executor=self.executor,
+            clock=self.clock
+        )
+
+    def test_prefetch_fills_every_language(self):
+        self.pool.prefetch("You are Orion")
+
+        self.assertEqual(self.pool.get_greeting("You are Orion", "es"), "Hello (es)")
+        self.assertEqual(self.pool.get_greeting("You are Orion", "en"), "Hello (en)")
+        self.assertEqual(self.llm_service.generate_response.call_count, 4)
+
+    def test_miss_returns_none_and_fills_the_pool(self):
+        self.assertIsNone(self.pool.get_greeting("You are Orion", "fr"))
+
+        self.assertEqual(self.pool.get_greeting("You are Orion", "fr"), "Hello (fr)")
+
+    def test_changed_system_prompt_regenerates_the_pool(self):
+        self.pool.prefetch("You are Orion")
+        self.llm_service.generate_response.reset_mock()
+
+        self.assertIsNone(self.pool.get_greeting("You are Orion v2", "es"))
+
+        self.assertEqual(self.llm_service.generate_response.call_count, 2)
+        generated = self.llm_service.generate_response.call_args.args[0]
+        self.assertEqual(generated.get_system_prompt().content, "You are Orion v2")
+
+    def test_expired_pool_is_served_while_it_refreshes(self):
+        self.pool.prefetch("You are Orion")
+        self.llm_service.generate_response.reset_mock()
+        self.clock.now = 61
+
+        self.assertEqual(self.pool.get_greeting("You are Orion", "es"), "Hello (es)")
+        self.assertEqual(self.llm_service.generate_response.call_count, 2)
+
+    def test_generation_failure_keeps_the_fallback(self):
+        self.llm_service.generate_response.side_effect = RuntimeError("openai down")
+
+        self.pool.prefetch("You are Orion")
+
+        self.assertIsNone(self.pool.get_greeting("You are Orion", "es"))
+
+    def test_greetings_are_routed_before_generation(self):
+        model_router = Mock()
+        model_router.apply.side_effect = lambda conversation, task: conversation.with_model("gpt-4o-mini")
+        pool = GreetingPool(
+            llm_service=self.llm_service,
+            variants=2,
+            ttl=60,
+            languages=["es"],
+            executor=self.executor,
+            clock=self.clock,
+            model_router=model_router
+        )
+
+        pool.prefetch("You are Orion")
+
+        self.assertEqual(model_router.apply.call_count, 2)
+        self.assertTrue(all(call.args[1] is LLMTask.GREETING for call in model_router.apply.call_args_list))
+        self.assertEqual(
+            [call.args[0].model for call in self.llm_service.generate_response.call_args_list],
+            ["gpt-4o-mini", "gpt-4o-mini"]
+        )
@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import patch
+from uuid import uuid4
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.services.model_router import LLMTask
+from chatapp.domain.services.prompt_assembler import count_block_tokens
+from chatapp.infrastructure.services.heuristic_model_router import HeuristicModelRouter
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+class TestHeuristicModelRouter(unittest.TestCase):
+    def setUp(self):
+        patcher = patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        count_block_tokens.cache_clear()
+        self.addCleanup(count_block_tokens.cache_clear)
+
+        self.router = HeuristicModelRouter(
+            small_model="gpt-4o-mini",
+            large_model="gpt-4o",
+            max_prompt_tokens=50,
+            max_message_tokens=10
+        )
+
+    def conversation(self, *user_messages):
+        conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User"), language="")
+        conversation.update_system_prompt(MessageEntity(role=MessageRole.SYSTEM, content="You are Orion"))
+        for content in user_messages:
+            conversation.add_message(MessageEntity(role=MessageRole.USER, content=content))
+        return conversation
+
+    def test_simple_chat_turn_goes_to_the_small_model(self):
+        decision = self.router.route(self.conversation("where is my order?"), LLMTask.CHAT)
+
+        self.assertEqual(decision.model, "gpt-4o-mini")
+        self.assertEqual(decision.reason, "simple_message")
+        self.assertEqual(decision.prompt_tokens, 7)
+
+    def test_complex_or_long_turns_go_to_the_large_model(self):
+        cases = {
+            "quiero un reembolso ya": "complex_message",
+            "Why was I charged?": "complex_message",
+            "is it shipped? when does it arrive?": "complex_message",
+            "one two three four five six seven eight nine ten eleven": "long_message",
+        }
+        for message, reason in cases.items():
+            with self.subTest(message=message):
+                decision = self.router.route(self.conversation(message), LLMTask.CHAT)
+                self.assertEqual((decision.model, decision.reason), ("gpt-4o", reason))
+
+    def test_long_prompt_goes_to_the_large_model(self):
+        decision = self.router.route(self.conversation(*["hello there"] * 30), LLMTask.SUMMARY)
+
+        self.assertEqual((decision.model, decision.reason), ("gpt-4o", "long_prompt"))
+
+    def test_background_tasks_go_to_the_small_model_but_extraction_does_not(self):
+        conversation = self.conversation("hello")
+
+        self.assertEqual(self.router.route(conversation, LLMTask.GREETING).model, "gpt-4o-mini")
+        self.assertEqual(self.router.route(conversation, LLMTask.SUMMARY).model, "gpt-4o-mini")
+        self.assertEqual(self.router.route(conversation, LLMTask.MEMORY_FOLD).model, "gpt-4o-mini")
+        self.assertEqual(self.router.route(conversation, LLMTask.EXTRACTION).model, "gpt-4o")
+        self.assertEqual(self.router.stats()["summary:gpt-4o-mini"], 1)
+
+    def test_apply_returns_a_copy_only_when_the_model_changes(self):
+        conversation = self.conversation("hello")
+
+        routed = self.router.apply(conversation, LLMTask.CHAT)
+
+        self.assertIsNot(routed, conversation)
+        self.assertEqual(routed.model, "gpt-4o-mini")
+        self.assertEqual(conversation.model, "gpt-4o")
+        self.assertIs(self.router.apply(conversation, LLMTask.EXTRACTION), conversation)
+
+    def test_unknown_model_fails_at_construction(self):
+        with self.assertRaises(ValidationError):
+            HeuristicModelRouter(small_model="gpt-unknown", large_model="gpt-4o", max_prompt_tokens=50, max_message_tokens=10)
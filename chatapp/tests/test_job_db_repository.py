@@ -0,0 +1,88 @@
+import unittest
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from django.db.models import F, Q
+
+from chatapp.domain.entities.job import JobEntity, JobKind, JobStatus
+from chatapp.domain.exceptions.bad_request import BadRequestError
+from chatapp.infrastructure.models.job_db import JobDB
+from chatapp.infrastructure.repository.job_db_repository import LEASE_EXPIRED_ERROR, JobDBRepository
+
+REPOSITORY = "chatapp.infrastructure.repository.job_db_repository"
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+
+class TestJobDBRepository(unittest.TestCase):
+    def setUp(self):
+        self.objects = MagicMock()
+        patchers = [
+            patch.object(JobDB, "objects", self.objects),
+            patch(f"{REPOSITORY}.timezone.now", return_value=NOW),
+            patch(f"{REPOSITORY}.transaction.atomic", return_value=nullcontext()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.repository = JobDBRepository()
+        self.job = JobEntity(kind=JobKind.CONVERSATION_SUMMARY, status=JobStatus.RUNNING, attempts=2, max_attempts=3)
+
+    def test_claim_fails_expired_jobs_without_attempts_left(self):
+        self.repository.claim(limit=4, lease_seconds=60)
+
+        self.objects.filter.assert_any_call(
+            status=JobStatus.RUNNING.value,
+            locked_until__lt=NOW,
+            attempts__gte=F('max_attempts')
+        )
+        self.objects.filter.return_value.update.assert_any_call(
+            status=JobStatus.FAILED.value,
+            last_error=LEASE_EXPIRED_ERROR,
+            locked_until=None,
+            updated_at=NOW
+        )
+
+    def test_claim_only_reclaims_expired_jobs_with_attempts_left(self):
+        self.repository.claim(limit=4, lease_seconds=60)
+
+        self.objects.select_for_update.return_value.filter.assert_called_once_with(
+            Q(status=JobStatus.QUEUED.value, run_after__lte=NOW) |
+            Q(status=JobStatus.RUNNING.value, locked_until__lt=NOW, attempts__lt=F('max_attempts'))
+        )
+        self.objects.filter.return_value.update.assert_any_call(
+            status=JobStatus.RUNNING.value,
+            attempts=F('attempts') + 1,
+            locked_until=NOW + timedelta(seconds=60),
+            updated_at=NOW
+        )
+
+    def test_update_is_fenced_by_the_claim(self):
+        self.objects.filter.return_value.update.return_value = 1
+        self.job.mark_succeeded({"ok": True})
+
+        result = self.repository.update(self.job)
+
+        self.assertIs(result, self.job)
+        self.objects.filter.assert_called_once_with(id=self.job.id, status=JobStatus.RUNNING.value, attempts=2)
+
+    def test_update_after_losing_the_lease_returns_the_stored_job(self):
+        stored = JobDB(id=uuid4(), kind=JobKind.CONVERSATION_SUMMARY.value, status=JobStatus.RUNNING.value, attempts=3)
+        self.objects.filter.return_value.update.return_value = 0
+        self.objects.get.return_value = stored
+        self.job.mark_succeeded({"ok": True})
+
+        result = self.repository.update(self.job)
+
+        self.assertEqual(result.status, JobStatus.RUNNING)
+        self.assertEqual(result.attempts, 3)
+
+    def test_update_of_a_missing_job_raises(self):
+        self.objects.filter.return_value.update.return_value = 0
+        self.objects.get.side_effect = JobDB.DoesNotExist
+
+        with self.assertRaises(BadRequestError) as context:
+            self.repository.update(self.job)
+
+        self.assertEqual(context.exception.code, "JOB_NOT_FOUND")
@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from chatapp.application.list_conversation_messages_use_case import ListConversationMessagesUseCase
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.models.list_messages_input import ListMessagesInput
+from chatapp.domain.models.message_page import MessagePage
+from chatapp.domain.repositories.conversation_repository import ConversationRepository
+from chatapp.domain.repositories.message_repository import MessageRepository
+
+class TestListConversationMessagesUseCase(unittest.TestCase):
+    def setUp(self):
+        self.conversation_repository = Mock(spec=ConversationRepository)
+        self.message_repository = Mock(spec=MessageRepository)
+        self.use_case = ListConversationMessagesUseCase(
+            conversation_repository=self.conversation_repository,
+            message_repository=self.message_repository
+        )
+        self.conversation_id = str(uuid4())
+
+    def test_execute_returns_requested_page(self):
+        page = MessagePage(messages=[MessageEntity(role=MessageRole.USER, content="Hi")], next_cursor="cursor")
+        self.conversation_repository.exists.return_value = True
+        self.message_repository.get_page_by_conversation_id.return_value = page
+
+        result = self.use_case.execute(ListMessagesInput(self.conversation_id, before="older", limit=10))
+
+        self.assertIs(result, page)
+        self.message_repository.get_page_by_conversation_id.assert_called_once_with(
+            self.conversation_id, before="older", limit=10
+        )
+
+    def test_execute_conversation_not_found(self):
+        self.conversation_repository.exists.return_value = False
+
+        with self.assertRaises(NotFoundError):
+            self.use_case.execute(ListMessagesInput(self.conversation_id))
+
+        self.message_repository.get_page_by_conversation_id.assert_not_called()
+
+    def test_execute_invalid_cursor_is_a_validation_error(self):
+        self.conversation_repository.exists.return_value = True
+        self.message_repository.get_page_by_conversation_id.side_effect = ValidationError(code="INVALID_CURSOR")
+
+        with self.assertRaises(ValidationError):
+            self.use_case.execute(ListMessagesInput(self.conversation_id, before="garbage"))
+
+    def test_execute_unexpected_error(self):
+        self.conversation_repository.exists.side_effect = Exception("Database error")
+
+        with self.assertRaises(InternalError):
+            self.use_case.execute(ListMessagesInput(self.conversation_id))
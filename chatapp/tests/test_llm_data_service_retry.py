@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+from openai import AuthenticationError, RateLimitError
+from openai.types.chat import ChatCompletion
+from tenacity import wait_none
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.domain.exceptions.llm.authentication_error import LLMAuthenticationError
+from chatapp.domain.exceptions.llm.rate_limit_error import LLMRateLimitError
+from chatapp.infrastructure.services.llm_data_service import LLMDataService
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+def make_error(error_class):
+    # Built without an HTTP response, which the service never reads.
+    error = error_class.__new__(error_class)
+    Exception.__init__(error, f"{error_class.__name__} from OpenAI")
+    return error
+
+def make_completion(content: str) -> ChatCompletion:
+    return ChatCompletion.model_validate({
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 5, "completion_tokens": 2, "total_tokens": 7}
+    })
+
+class TestLLMDataServiceRetry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patchers = [
+            patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding()),
+            patch.object(LLMDataService._create_completion.retry, "wait", wait_none()),
+            patch.object(LLMDataService._acreate_completion.retry, "wait", wait_none()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            self.service = LLMDataService(scheduler=Mock())
+        self.service.client = Mock()
+        self.service.async_client = Mock()
+
+        self.conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User"))
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="Hola"))
+
+    def test_rate_limited_call_is_retried(self):
+        self.service.client.chat.completions.create.side_effect = [make_error(RateLimitError), make_completion("Hola!")]
+
+        response = self.service.generate_response(self.conversation)
+
+        self.assertEqual(response.content, "Hola!")
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 2)
+        # Each attempt waits for its own rate-limit budget.
+        self.assertEqual(self.service.scheduler.acquire.call_count, 2)
+
+    def test_rate_limit_becomes_a_domain_error_once_retries_run_out(self):
+        self.service.client.chat.completions.create.side_effect = make_error(RateLimitError)
+
+        with self.assertRaises(LLMRateLimitError):
+            self.service.generate_response(self.conversation)
+
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 3)
+
+    def test_authentication_errors_are_not_retried(self):
+        self.service.client.chat.completions.create.side_effect = make_error(AuthenticationError)
+
+        with self.assertRaises(LLMAuthenticationError):
+            self.service.generate_response(self.conversation)
+
+        self.assertEqual(self.service.client.chat.completions.create.call_count, 1)
+
+    async def test_async_rate_limited_call_is_retried(self):
+        self.service.scheduler.aacquire = AsyncMock()
+        self.service.async_client.chat.completions.create = AsyncMock(
+            side_effect=[make_error(RateLimitError), make_completion("Hola!")]
+        )
+
+        response = await self.service.agenerate_response(self.conversation)
+
+        self.assertEqual(response.content, "Hola!")
+        self.assertEqual(self.service.async_client.chat.completions.create.await_count, 2)
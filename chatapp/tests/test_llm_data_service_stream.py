@@ -0,0 +1,78 @@
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from uuid import uuid4
+
+from openai import AsyncOpenAI, OpenAI
+
+from chatapp.domain.entities.conversation import ConversationEntity
+from chatapp.domain.entities.message import MessageEntity, MessageRole
+from chatapp.domain.entities.user import UserEntity
+from chatapp.infrastructure.services.llm_data_service import LLMDataService
+
+STREAMED_TOKENS = ["Hola", ", ", "¿en qué", " puedo ayudarte?"]
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+class FakeOpenAIStreamHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.requests.append(json.loads(self.rfile.read(length)))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        for token in STREAMED_TOKENS:
+            chunk = {
+                "id": "chatcmpl-test",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, format, *args):
+        pass
+
+class TestLLMDataServiceStream(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIStreamHandler)
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        patcher = patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            self.service = LLMDataService()
+        base_url = f"http://127.0.0.1:{self.server.server_port}/v1"
+        self.service.client = OpenAI(api_key="test-key", base_url=base_url)
+        self.service.async_client = AsyncOpenAI(api_key="test-key", base_url=base_url)
+
+        user = UserEntity(_id=str(uuid4()), name="Test User")
+        self.conversation = ConversationEntity(user=user)
+        self.conversation.add_message(MessageEntity(role=MessageRole.USER, content="Hola"))
+
+    def test_stream_yields_tokens_as_they_arrive(self):
+        deltas = list(self.service.generate_response_stream(self.conversation))
+
+        self.assertEqual(deltas, STREAMED_TOKENS)
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertTrue(self.server.requests[0]["stream"])
+        self.assertEqual(self.server.requests[0]["messages"][-1], {"role": "user", "content": "Hola"})
+
+    async def test_async_stream_yields_tokens_as_they_arrive(self):
+        deltas = [delta async for delta in self.service.agenerate_response_stream(self.conversation)]
+
+        self.assertEqual(deltas, STREAMED_TOKENS)
+        self.assertTrue(self.server.requests[0]["stream"])
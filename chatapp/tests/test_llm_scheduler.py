@@ -0,0 +1,97 @@
+import asyncio
+import unittest
+
+from chatapp.domain.exceptions.llm.rate_limit_error import LLMRateLimitError
+from chatapp.infrastructure.services.llm_scheduler import LLMEndpoint, LLMPriority, LLMScheduler, llm_priority
+
+DEADLINES = {LLMPriority.INTERACTIVE: 5, LLMPriority.BATCH: 300}
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestLLMScheduler(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.sleeps = []
+
+    def make_scheduler(self, rpm=None, tpm=None, sleep=None):
+        return LLMScheduler(
+            limits={LLMEndpoint.CHAT: (rpm, tpm)},
+            deadlines=DEADLINES,
+            clock=self.clock,
+            sleep=sleep or self.sleep
+        )
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.clock.now += seconds
+
+    def test_calls_within_budget_are_not_delayed(self):
+        scheduler = self.make_scheduler(rpm=60, tpm=6000)
+
+        for _ in range(10):
+            self.assertEqual(scheduler.acquire(LLMEndpoint.CHAT, tokens=100), 0.0)
+
+        self.assertEqual(self.sleeps, [])
+        self.assertEqual(scheduler.stats()["granted"], 10)
+
+    def test_interactive_calls_overtake_queued_batch_calls(self):
+        order = []
+
+        def sleep(seconds):
+            self.clock.now += seconds
+            if not order:
+                order.append("interactive arrives")
+                with llm_priority(LLMPriority.INTERACTIVE):
+                    scheduler.acquire(LLMEndpoint.CHAT)
+                order.append("interactive")
+
+        scheduler = self.make_scheduler(rpm=60, sleep=sleep)
+        for _ in range(60):
+            scheduler.acquire(LLMEndpoint.CHAT)
+
+        with llm_priority(LLMPriority.BATCH):
+            scheduler.acquire(LLMEndpoint.CHAT)
+            order.append("batch")
+
+        self.assertEqual(order, ["interactive arrives", "interactive", "batch"])
+
+    def test_fails_fast_when_the_wait_would_exceed_the_deadline(self):
+        scheduler = self.make_scheduler(tpm=600)
+        scheduler.acquire(LLMEndpoint.CHAT, tokens=600)
+
+        with self.assertRaises(LLMRateLimitError) as context:
+            scheduler.acquire(LLMEndpoint.CHAT, tokens=600)
+
+        self.assertEqual(self.sleeps, [])
+        self.assertEqual(context.exception.details["endpoint"], "chat")
+        self.assertEqual(scheduler.stats()["rejected"], 1)
+
+    def test_batch_calls_get_a_longer_deadline(self):
+        scheduler = self.make_scheduler(tpm=600)
+        scheduler.acquire(LLMEndpoint.CHAT, tokens=600)
+
+        with llm_priority(LLMPriority.BATCH):
+            waited = scheduler.acquire(LLMEndpoint.CHAT, tokens=600)
+
+        self.assertAlmostEqual(waited, 60.0)
+
+    def test_rejected_calls_do_not_block_the_queue(self):
+        scheduler = self.make_scheduler(tpm=600)
+        scheduler.acquire(LLMEndpoint.CHAT, tokens=590)
+        with self.assertRaises(LLMRateLimitError):
+            scheduler.acquire(LLMEndpoint.CHAT, tokens=600)
+
+        self.assertEqual(scheduler.acquire(LLMEndpoint.CHAT, tokens=10), 0.0)
+
+    def test_async_callers_share_the_budget(self):
+        scheduler = self.make_scheduler(rpm=60)
+        for _ in range(60):
+            scheduler.acquire(LLMEndpoint.CHAT)
+
+        with self.assertRaises(LLMRateLimitError):
+            asyncio.run(scheduler.aacquire(LLMEndpoint.CHAT, requests=10))
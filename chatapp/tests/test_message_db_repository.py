@@ -0,0 +1,22 @@
+import unittest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.infrastructure.repository.message_db_repository import MessageDBRepository
+
+class TestMessageCursor(unittest.TestCase):
+    def test_cursor_round_trip(self):
+        created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        message_id = str(uuid4())
+
+        cursor = MessageDBRepository.encode_cursor(created_at, message_id)
+
+        self.assertNotIn("=", cursor)
+        self.assertEqual(MessageDBRepository.decode_cursor(cursor), (created_at, message_id))
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in ["not-a-cursor", MessageDBRepository.encode_cursor(datetime.now(), "not-a-uuid")]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValidationError):
+                    MessageDBRepository.decode_cursor(cursor)
@@ -0,0 +1,25 @@
+import unittest
+
+from chatapp.domain.exceptions.validation_error import ValidationError
+from chatapp.domain.services.model_registry import DEFAULT_MODEL, get_model_spec
+
+class TestModelRegistry(unittest.TestCase):
+    def test_gpt_4o_uses_the_o200k_tokenizer(self):
+        spec = get_model_spec("gpt-4o")
+
+        self.assertEqual(spec.encoding, "o200k_base")
+        self.assertEqual(spec.get_prompt_budget(), 128_000 - 16_384)
+
+    def test_empty_model_is_the_default_model(self):
+        self.assertEqual(get_model_spec(None).name, DEFAULT_MODEL)
+
+    def test_dated_snapshot_resolves_to_its_alias(self):
+        self.assertEqual(get_model_spec("gpt-4o-mini-2024-07-18").name, "gpt-4o-mini")
+
+    def test_unknown_model_is_rejected(self):
+        with self.assertRaises(ValidationError) as ctx:
+            get_model_spec("gpt-unknown")
+        self.assertEqual(ctx.exception.code, "UNKNOWN_MODEL")
+
+    def test_cost_is_priced_per_million_tokens(self):
+        self.assertAlmostEqual(get_model_spec("gpt-4o").estimate_cost(1_000_000, 100_000), 2.50 + 1.00)
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import Mock
+from uuid import uuid4
+
+from chatapp.application.create_conversation_summary_use_case import CreateConversationSummaryUseCase
+from chatapp.application.process_job_use_case import ProcessJobUseCase
+from chatapp.domain.entities.conversation import ConversationEntity, ConversationStatus
+from chatapp.domain.entities.job import JobEntity, JobKind, JobStatus
+from chatapp.domain.entities.user import UserEntity
+from chatapp.domain.exceptions.internal_error import InternalError
+from chatapp.domain.exceptions.not_found_error import NotFoundError
+from chatapp.domain.repositories.job_repository import JobRepository
+
+class TestProcessJobUseCase(unittest.TestCase):
+    def setUp(self):
+        self.job_repository = Mock(spec=JobRepository)
+        self.job_repository.update.side_effect = lambda job: job
+        self.summary_use_case = Mock(spec=CreateConversationSummaryUseCase)
+        self.use_case = ProcessJobUseCase(
+            job_repository=self.job_repository,
+            create_conversation_summary_use_case=self.summary_use_case,
+            retry_backoff=10
+        )
+
+        self.conversation_id = str(uuid4())
+        self.job = JobEntity(
+            kind=JobKind.CONVERSATION_SUMMARY,
+            payload={"conversation_id": self.conversation_id, "conversation_status": "completed"},
+            attempts=1,
+            max_attempts=3
+        )
+
+    def test_summary_job_succeeds(self):
+        conversation = ConversationEntity(user=UserEntity(_id=str(uuid4()), name="Test User"), _id=self.conversation_id)
+        conversation.update_summary("Customer asked about an order")
+        conversation.update_status(ConversationStatus.COMPLETED)
+        self.summary_use_case.execute.return_value = conversation
+
+        job = self.use_case.execute(self.job)
+
+        self.summary_use_case.execute.assert_called_once_with(self.conversation_id, ConversationStatus.COMPLETED)
+        self.assertEqual(job.status, JobStatus.SUCCEEDED)
+        self.assertEqual(job.result["summary"], "Customer asked about an order")
+        self.assertEqual(job.result["status"], "completed")
+        self.job_repository.update.assert_called_once_with(self.job)
+
+    def test_transient_failure_is_requeued_with_backoff(self):
+        self.summary_use_case.execute.side_effect = InternalError(message="LLM timeout")
+        self.job.attempts = 2
+
+        job = self.use_case.execute(self.job)
+
+        self.assertEqual(job.status, JobStatus.QUEUED)
+        self.assertEqual(job.last_error, "LLM timeout")
+        self.assertEqual((job.run_after - job.updated_at).total_seconds(), 20)
+
+    def test_last_attempt_fails_the_job(self):
+        self.summary_use_case.execute.side_effect = InternalError(message="LLM timeout")
+        self.job.attempts = 3
+
+        job = self.use_case.execute(self.job)
+
+        self.assertEqual(job.status, JobStatus.FAILED)
+
+    def test_client_error_is_not_retried(self):
+        self.summary_use_case.execute.side_effect = NotFoundError(message="Conversation not found")
+
+        job = self.use_case.execute(self.job)
+
+        self.assertEqual(job.status, JobStatus.FAILED)
+        self.assertEqual(job.attempts, 1)
+
+    def test_memory_fold_job_succeeds(self):
+        fold_use_case = Mock()
+        fold_use_case.execute.return_value = 6
+        use_case = ProcessJobUseCase(
+            job_repository=self.job_repository,
+            create_conversation_summary_use_case=self.summary_use_case,
+            fold_conversation_memory_use_case=fold_use_case,
+            retry_backoff=10
+        )
+        job = JobEntity(kind=JobKind.CONVERSATION_MEMORY_FOLD, payload={"conversation_id": self.conversation_id}, attempts=1)
+
+        job = use_case.execute(job)
+
+        self.assertEqual(job.status, JobStatus.SUCCEEDED)
+        self.assertEqual(job.result, {"conversation_id": self.conversation_id, "folded_messages": 6})
+        fold_use_case.execute.assert_called_once_with(self.conversation_id)
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 from chatapp.application.process_message_use_case import ProcessMessageUseCase
@@ -9,6 +9,7 @@ from chatapp.domain.entities.user import UserEntity
 from chatapp.domain.exceptions.internal_error import InternalError
 from chatapp.domain.exceptions.not_found_error import NotFoundError
 from chatapp.domain.models.create_message_input import CreateMessageInput
+from chatapp.domain.services.model_router import LLMTask
 
 class TestProcessMessageUseCase(unittest.TestCase):
     def setUp(self):
@@ -35,21 +36,21 @@ class TestProcessMessageUseCase(unittest.TestCase):
         
         llm_response = MessageEntity(role=MessageRole.ASSISTANT, content="Hi there!")
         self.llm_service.generate_response.return_value = llm_response
-        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.get_window_by_id.return_value = self.conversation
         self.conversation_repository.update.return_value = self.conversation
 
-        result = self.use_case.execute(message_input)
+        result = self.use_case.execute(message_input, full_history=False)
 
         self.assertEqual(result, self.conversation)
         self.assertEqual(len(result.messages), 2)
         self.assertEqual(result.messages[-2], user_message)
         self.assertEqual(result.messages[-1], llm_response)
-        self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
+        self.conversation_repository.get_window_by_id.assert_called_once_with(self.conversation_id)
         self.llm_service.generate_response.assert_called_once_with(self.conversation)
         self.conversation_repository.update.assert_called_once_with(self.conversation)
 
     def test_conversation_not_found(self):
-        self.conversation_repository.get_by_id.return_value = None
+        self.conversation_repository.get_window_by_id.return_value = None
         message_input = CreateMessageInput(
             conversation_id=self.conversation_id,
             new_message=MessageEntity(role=MessageRole.USER, content="Hello"),
@@ -60,12 +61,12 @@ class TestProcessMessageUseCase(unittest.TestCase):
             self.use_case.execute(message_input)
         
         self.assertEqual(context.exception.code, "CONVERSATION_NOT_FOUND")
-        self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
+        self.conversation_repository.get_window_by_id.assert_called_once_with(self.conversation_id)
         self.llm_service.generate_response.assert_not_called()
         self.conversation_repository.update.assert_not_called()
 
     def test_llm_service_error(self):
-        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.get_window_by_id.return_value = self.conversation
         self.llm_service.generate_response.side_effect = Exception("LLM Error")
         message_input = CreateMessageInput(
             conversation_id=self.conversation_id,
@@ -77,7 +78,7 @@ class TestProcessMessageUseCase(unittest.TestCase):
             self.use_case.execute(message_input)
         
         self.assertIn("Error processing the prompt", str(context.exception))
-        self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
+        self.conversation_repository.get_window_by_id.assert_called_once_with(self.conversation_id)
         self.llm_service.generate_response.assert_called_once_with(self.conversation)
         self.conversation_repository.update.assert_not_called()
 
@@ -94,10 +95,10 @@ class TestProcessMessageUseCase(unittest.TestCase):
         
         llm_response = MessageEntity(role=MessageRole.ASSISTANT, content="Response")
         self.llm_service.generate_response.return_value = llm_response
-        self.conversation_repository.get_by_id.return_value = self.conversation
+        self.conversation_repository.get_window_by_id.return_value = self.conversation
         self.conversation_repository.update.return_value = self.conversation
 
-        result = self.use_case.execute(message_input)
+        result = self.use_case.execute(message_input, full_history=False)
 
         self.assertEqual(len(result.messages), 3)
         self.assertEqual(result.messages[0], existing_message)
@@ -117,11 +118,11 @@ class TestProcessMessageUseCase(unittest.TestCase):
         
         llm_response = MessageEntity(role=MessageRole.ASSISTANT, content="Hi!")
         
-        self.conversation_repository.get_by_id.return_value = original_conversation
+        self.conversation_repository.get_window_by_id.return_value = original_conversation
         self.llm_service.generate_response.return_value = llm_response
         self.conversation_repository.update.return_value = updated_conversation
 
-        result = self.use_case.execute(message_input)
+        result = self.use_case.execute(message_input, full_history=False)
 
         self.assertEqual(result, updated_conversation)
         self.conversation_repository.update.assert_called_once()
@@ -129,4 +130,166 @@ class TestProcessMessageUseCase(unittest.TestCase):
         self.assertEqual(len(conversation_to_update.messages), 2)
         self.assertEqual(conversation_to_update.messages[0], message)
         self.assertEqual(conversation_to_update.messages[1], llm_response)
-        
\ No newline at end of file
+        
+    def test_execute_returns_the_full_history_by_default(self):
+        folded_message = MessageEntity(role=MessageRole.USER, content="Folded into the memory summary")
+        full_conversation = ConversationEntity(user=self.user, _id=self.conversation_id, messages=[folded_message])
+        self.llm_service.generate_response.return_value = MessageEntity(role=MessageRole.ASSISTANT, content="Hi there!")
+        self.conversation_repository.get_window_by_id.return_value = self.conversation
+        self.conversation_repository.update.side_effect = lambda conversation: conversation
+        self.conversation_repository.get_by_id.return_value = full_conversation
+        self.rag_service.retrieve_context.return_value = ""
+
+        result = self.use_case.execute(CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=MessageEntity(role=MessageRole.USER, content="Hello"),
+            language="es"
+        ))
+
+        self.assertIs(result, full_conversation)
+        self.conversation_repository.get_by_id.assert_called_once_with(self.conversation_id)
+        # Only the window is sent to the LLM.
+        self.assertNotIn(folded_message, self.llm_service.generate_response.call_args.args[0].messages)
+
+    def test_execute_without_full_history_skips_the_reload(self):
+        self.llm_service.generate_response.return_value = MessageEntity(role=MessageRole.ASSISTANT, content="Hi there!")
+        self.conversation_repository.get_window_by_id.return_value = self.conversation
+        self.conversation_repository.update.side_effect = lambda conversation: conversation
+        self.rag_service.retrieve_context.return_value = ""
+
+        result = self.use_case.execute(CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=MessageEntity(role=MessageRole.USER, content="Hello"),
+            language="es"
+        ), full_history=False)
+
+        self.assertIs(result, self.conversation)
+        self.conversation_repository.get_by_id.assert_not_called()
+
+    def test_execute_stream_yields_deltas_and_persists_reply(self):
+        user_message = MessageEntity(role=MessageRole.USER, content="Hello")
+        message_input = CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=user_message,
+            language="es"
+        )
+        self.conversation_repository.get_window_by_id.return_value = self.conversation
+        self.conversation_repository.update.side_effect = lambda conversation: conversation
+        self.rag_service.retrieve_context.return_value = ""
+        self.llm_service.generate_response_stream.return_value = iter(["Hi", " there", "!"])
+
+        *deltas, result = list(self.use_case.execute_stream(message_input))
+
+        self.assertEqual(deltas, ["Hi", " there", "!"])
+        self.assertEqual(result.messages[-2], user_message)
+        self.assertEqual(result.messages[-1].role, MessageRole.ASSISTANT)
+        self.assertEqual(result.messages[-1].content, "Hi there!")
+        self.conversation_repository.update.assert_called_once_with(self.conversation)
+
+    def test_execute_stream_conversation_not_found(self):
+        self.conversation_repository.get_window_by_id.return_value = None
+        message_input = CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=MessageEntity(role=MessageRole.USER, content="Hello"),
+            language="es"
+        )
+
+        with self.assertRaises(NotFoundError):
+            self.use_case.execute_stream(message_input)
+
+        self.llm_service.generate_response_stream.assert_not_called()
+
+    def test_routed_model_answers_without_changing_the_saved_conversation(self):
+        model_router = Mock()
+        model_router.apply.side_effect = lambda conversation, task: conversation.with_model("gpt-4o-mini")
+        use_case = ProcessMessageUseCase(
+            llm_service=self.llm_service,
+            conversation_repository=self.conversation_repository,
+            rag_service=self.rag_service,
+            model_router=model_router
+        )
+        self.llm_service.generate_response.return_value = MessageEntity(role=MessageRole.ASSISTANT, content="Hi there!")
+        self.conversation_repository.get_window_by_id.return_value = self.conversation
+        self.conversation_repository.update.side_effect = lambda conversation: conversation
+        self.rag_service.retrieve_context.return_value = ""
+
+        result = use_case.execute(CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=MessageEntity(role=MessageRole.USER, content="Hello"),
+            language="es"
+        ), full_history=False)
+
+        routed = self.llm_service.generate_response.call_args.args[0]
+        self.assertEqual(routed.model, "gpt-4o-mini")
+        self.assertEqual(routed.messages[-1].content, "Hello")
+        self.assertEqual(model_router.apply.call_args.args[1], LLMTask.CHAT)
+        self.assertIs(result, self.conversation)
+        self.assertEqual(result.model, "gpt-4o")
+        self.assertEqual(len(result.messages), 2)
+
+class TestProcessMessageUseCaseAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.llm_service = Mock()
+        self.conversation_repository = Mock()
+        self.rag_service = Mock()
+        self.use_case = ProcessMessageUseCase(
+            llm_service=self.llm_service,
+            conversation_repository=self.conversation_repository,
+            rag_service=self.rag_service
+        )
+
+        self.user = UserEntity(_id=str(uuid4()), name="Test User")
+        self.conversation_id = str(uuid4())
+        self.conversation = ConversationEntity(user=self.user, _id=self.conversation_id)
+
+    async def test_aexecute_successfully(self):
+        user_message = MessageEntity(role=MessageRole.USER, content="Hello")
+        message_input = CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=user_message,
+            language="es"
+        )
+        llm_response = MessageEntity(role=MessageRole.ASSISTANT, content="Hi there!")
+        self.conversation_repository.aget_window_by_id = AsyncMock(return_value=self.conversation)
+        self.conversation_repository.aupdate = AsyncMock(return_value=self.conversation)
+        self.rag_service.aretrieve_context = AsyncMock(return_value="")
+        self.llm_service.agenerate_response = AsyncMock(return_value=llm_response)
+
+        result = await self.use_case.aexecute(message_input, full_history=False)
+
+        self.assertEqual(result.messages, [user_message, llm_response])
+        self.llm_service.agenerate_response.assert_awaited_once_with(self.conversation)
+        self.conversation_repository.aupdate.assert_awaited_once_with(self.conversation)
+        self.conversation_repository.get_window_by_id.assert_not_called()
+
+    async def test_aexecute_returns_the_full_history_by_default(self):
+        full_conversation = ConversationEntity(user=self.user, _id=self.conversation_id)
+        self.conversation_repository.aget_window_by_id = AsyncMock(return_value=self.conversation)
+        self.conversation_repository.aupdate = AsyncMock(return_value=self.conversation)
+        self.conversation_repository.aget_by_id = AsyncMock(return_value=full_conversation)
+        self.rag_service.aretrieve_context = AsyncMock(return_value="")
+        self.llm_service.agenerate_response = AsyncMock(return_value=MessageEntity(role=MessageRole.ASSISTANT, content="Hi"))
+
+        result = await self.use_case.aexecute(CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=MessageEntity(role=MessageRole.USER, content="Hello"),
+            language="es"
+        ))
+
+        self.assertIs(result, full_conversation)
+        self.conversation_repository.aget_by_id.assert_awaited_once_with(self.conversation_id)
+
+    async def test_aexecute_conversation_not_found(self):
+        self.conversation_repository.aget_window_by_id = AsyncMock(return_value=None)
+        self.llm_service.agenerate_response = AsyncMock()
+        message_input = CreateMessageInput(
+            conversation_id=self.conversation_id,
+            new_message=MessageEntity(role=MessageRole.USER, content="Hello"),
+            language="es"
+        )
+
+        with self.assertRaises(NotFoundError) as context:
+            await self.use_case.aexecute(message_input)
+
+        self.assertEqual(context.exception.code, "CONVERSATION_NOT_FOUND")
+        self.llm_service.agenerate_response.assert_not_awaited()
@@ -0,0 +1,120 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+from django.test import override_settings
+from openai import RateLimitError
+from tenacity import wait_none
+
+from chatapp.domain.exceptions.llm.rate_limit_error import LLMRateLimitError
+from chatapp.infrastructure.services.rag_retrieve_data_service import RAGRetrieverService
+
+class FakeEncoding:
+    def encode(self, text):
+        return text.split()
+
+def make_error(error_class):
+    # Built without an HTTP response, which the service never reads.
+    error = error_class.__new__(error_class)
+    Exception.__init__(error, f"{error_class.__name__} from OpenAI")
+    return error
+
+def make_embedding_response(embedding):
+    response = Mock()
+    response.data = [Mock(embedding=embedding)]
+    return response
+
+class TestRAGRetrieverService(unittest.TestCase):
+    def setUp(self):
+        overrides = override_settings(RAG_TOP_K=2, RAG_CANDIDATES=20, RAG_MAX_DISTANCE=0.5, RAG_DISTANCE_METRIC='cosine')
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            self.service = RAGRetrieverService()
+        self.service._create_embedding = MagicMock(return_value=[0.1, 0.2])
+
+        atomic = patch("chatapp.infrastructure.services.rag_retrieve_data_service.transaction.atomic")
+        atomic.start()
+        self.addCleanup(atomic.stop)
+        set_parameters = patch.object(RAGRetrieverService, "_set_search_parameters")
+        set_parameters.start()
+        self.addCleanup(set_parameters.stop)
+
+        raw = patch("chatapp.infrastructure.services.rag_retrieve_data_service.DocumentDB.objects.raw")
+        self.raw = raw.start()
+        self.addCleanup(raw.stop)
+
+    def test_hybrid_query_runs_in_one_round_trip(self):
+        self.raw.return_value = [MagicMock(content="Order 123 ships today"), MagicMock(content="Returns policy")]
+
+        context = self.service.retrieve_context("where is order 123")
+
+        self.assertEqual(context, "Order 123 ships today\n\nReturns policy")
+        self.raw.assert_called_once()
+        sql, params = self.raw.call_args.args
+        self.assertIn("embedding <=> %(embedding)s::vector", sql)
+        self.assertIn("FULL OUTER JOIN text_hits", sql)
+        self.assertEqual(params["query"], "where is order 123")
+        self.assertEqual(params["embedding"], "[0.1,0.2]")
+        self.assertEqual(params["k"], 2)
+        self.assertEqual(params["max_distance"], 0.5)
+
+    def test_explicit_k_overrides_setting(self):
+        self.raw.return_value = []
+
+        self.service.retrieve_context("refund", k=5)
+
+        self.assertEqual(self.raw.call_args.args[1]["k"], 5)
+
+    def test_search_failure_returns_empty_context(self):
+        self.raw.side_effect = RuntimeError("database unavailable")
+
+        self.assertEqual(self.service.retrieve_context("refund"), "")
+
+class TestEmbeddingRetry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patchers = [
+            patch("chatapp.domain.services.token_counter.get_encoding", return_value=FakeEncoding()),
+            patch.object(RAGRetrieverService._request_embedding.retry, "wait", wait_none()),
+            patch.object(RAGRetrieverService._arequest_embedding.retry, "wait", wait_none()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        with patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}):
+            self.service = RAGRetrieverService(scheduler=Mock())
+        self.service.client = Mock()
+        self.service.async_client = Mock()
+
+    def test_rate_limited_embedding_is_retried(self):
+        self.service.client.embeddings.create.side_effect = [
+            make_error(RateLimitError), make_embedding_response([0.1, 0.2])
+        ]
+
+        embedding = self.service.get_embedding("where is\norder 123")
+
+        self.assertEqual(embedding, [0.1, 0.2])
+        self.assertEqual(self.service.client.embeddings.create.call_count, 2)
+        self.assertEqual(self.service.client.embeddings.create.call_args.kwargs["input"], ["where is order 123"])
+        # Each attempt waits for its own rate-limit budget.
+        self.assertEqual(self.service.scheduler.acquire.call_count, 2)
+
+    def test_rate_limit_becomes_a_domain_error_once_retries_run_out(self):
+        self.service.client.embeddings.create.side_effect = make_error(RateLimitError)
+
+        with self.assertRaises(LLMRateLimitError):
+            self.service.get_embedding("where is order 123")
+
+        self.assertEqual(self.service.client.embeddings.create.call_count, 3)
+
+    async def test_async_rate_limited_embedding_is_retried(self):
+        self.service.scheduler.aacquire = AsyncMock()
+        self.service.async_client.embeddings.create = AsyncMock(
+            side_effect=[make_error(RateLimitError), make_embedding_response([0.1, 0.2])]
+        )
+
+        embedding = await self.service.aget_embedding("where is order 123")
+
+        self.assertEqual(embedding, [0.1, 0.2])
+        self.assertEqual(self.service.async_client.embeddings.create.await_count, 2)
@@ -0,0 +1,49 @@
+import unittest
+
+from chatapp.infrastructure.services.rate_limiter import RateLimiter
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_requests_within_budget_do_not_wait(self):
+        limiter = RateLimiter(requests_per_minute=60, clock=self.clock, sleep=self.clock.sleep)
+
+        waits = [limiter.acquire() for _ in range(60)]
+
+        self.assertEqual(sum(waits), 0.0)
+
+    def test_request_budget_refills_over_time(self):
+        limiter = RateLimiter(requests_per_minute=60, clock=self.clock, sleep=self.clock.sleep)
+        for _ in range(60):
+            limiter.acquire()
+
+        self.assertAlmostEqual(limiter.acquire(), 1.0)
+        self.assertAlmostEqual(self.clock.now, 1.0)
+
+    def test_token_budget_limits_large_requests(self):
+        limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=6000, clock=self.clock, sleep=self.clock.sleep)
+        limiter.acquire(tokens=6000)
+
+        self.assertGreater(limiter.try_acquire(tokens=3000), 0.0)
+        self.assertAlmostEqual(limiter.acquire(tokens=3000), 30.0)
+
+    def test_request_larger_than_budget_is_capped(self):
+        limiter = RateLimiter(tokens_per_minute=100, clock=self.clock, sleep=self.clock.sleep)
+
+        self.assertEqual(limiter.acquire(tokens=500), 0.0)
+
+    def test_disabled_budgets_never_wait(self):
+        limiter = RateLimiter(clock=self.clock, sleep=self.clock.sleep)
+
+        self.assertEqual(limiter.acquire(requests=10_000, tokens=10_000_000), 0.0)
@@ -1,14 +1,35 @@
+from django.conf import settings
 from django.urls import path
 
 from chatapp.infrastructure.controllers.conversation_view import ConversationView
 from chatapp.infrastructure.controllers.create_conversation_view import CreateConversationView
 from chatapp.infrastructure.controllers.create_conversation_summary_view import CreateConversationSummaryView
 from chatapp.infrastructure.controllers.conversation_audio_view import ConversationAudioView
+from chatapp.infrastructure.controllers.conversation_messages_view import ConversationMessagesView
+from chatapp.infrastructure.controllers.job_view import JobView
+from chatapp.infrastructure.controllers.conversation_report_view import ConversationReportView, ConversationStatsView
+from chatapp.infrastructure.controllers.async_conversation_view import AsyncConversationView
+from chatapp.infrastructure.controllers.async_create_conversation_view import AsyncCreateConversationView
+from chatapp.infrastructure.controllers.async_conversation_audio_view import AsyncConversationAudioView
 
+# Under ASGI the LLM-bound endpoints are served by native async views, so a
+# single worker can hold many conversations that are waiting on the LLM.
+if settings.ASYNC_VIEWS:
+    message_view = AsyncConversationView
+    message_audio_view = AsyncConversationAudioView
+    create_conversation_view = AsyncCreateConversationView
+else:
+    message_view = ConversationView
+    message_audio_view = ConversationAudioView
+    create_conversation_view = CreateConversationView
 
 urlpatterns = [
     path("v1/conversations/<str:conversation_id>/summary", CreateConversationSummaryView.as_view(), name="create_conversation_summary"),
-    path("v1/conversations/<str:conversation_id>/message", ConversationView.as_view(), name="conversation"),
-    path("v1/conversations/<str:conversation_id>/message_audio", ConversationAudioView.as_view(), name="conversation_audio"),
-    path("v1/conversations/start", CreateConversationView.as_view(), name="create_conversation"),
+    path("v1/conversations/<str:conversation_id>/messages", ConversationMessagesView.as_view(), name="conversation_messages"),
+    path("v1/conversations/<str:conversation_id>/message", message_view.as_view(), name="conversation"),
+    path("v1/conversations/<str:conversation_id>/message_audio", message_audio_view.as_view(), name="conversation_audio"),
+    path("v1/conversations/start", create_conversation_view.as_view(), name="create_conversation"),
+    path("v1/jobs/<str:job_id>", JobView.as_view(), name="job"),
+    path("v1/reports/conversations/stats", ConversationStatsView.as_view(), name="conversation_stats"),
+    path("v1/reports/conversations", ConversationReportView.as_view(), name="conversation_reports"),
 ]
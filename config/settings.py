@@ -76,6 +76,16 @@ DATABASES = {
     }
 }
 
+# Reporting database: point ANALYTICS_DB_HOST at a read replica to keep dashboards
+# off the primary. Its queries are cut off after ANALYTICS_STATEMENT_TIMEOUT_MS.
+ANALYTICS_DB_ALIAS = 'analytics'
+DATABASES[ANALYTICS_DB_ALIAS] = {
+    **DATABASES['default'],
+    'HOST': os.getenv('ANALYTICS_DB_HOST', DATABASES['default']['HOST']),
+    'OPTIONS': {'options': f"-c statement_timeout={int(os.getenv('ANALYTICS_STATEMENT_TIMEOUT_MS', '5000'))}"},
+    'TEST': {'MIRROR': 'default'},
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -101,6 +111,90 @@ REST_FRAMEWORK = {
     ]
 }
 
+# Serve the LLM-bound endpoints with native async views (run under ASGI, e.g. uvicorn config.asgi:application)
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', 'False').lower() == 'true'
+
+# Background jobs (DB-backed queue drained by `python manage.py run_jobs`)
+JOB_MAX_ATTEMPTS = int(os.getenv('JOB_MAX_ATTEMPTS', '3'))
+JOB_RETRY_BACKOFF = int(os.getenv('JOB_RETRY_BACKOFF', '30'))
+JOB_LEASE_SECONDS = int(os.getenv('JOB_LEASE_SECONDS', '600'))
+
+# Conversation memory: 'window' sends as much history as fits in the context window; 'summary' folds turns
+# beyond MEMORY_RECENT_TOKENS into a running summary (in the job worker) once they exceed it by MEMORY_FOLD_TOKENS.
+MEMORY_MODE = os.getenv('MEMORY_MODE', 'window')
+MEMORY_RECENT_TOKENS = int(os.getenv('MEMORY_RECENT_TOKENS', '3000'))
+MEMORY_FOLD_TOKENS = int(os.getenv('MEMORY_FOLD_TOKENS', '2000'))
+
+# Model routing: 'none' answers every call with the conversation's model; 'heuristic' sends greetings, summaries,
+# memory folds and short, simple chat turns to MODEL_ROUTER_SMALL_MODEL and the rest to MODEL_ROUTER_LARGE_MODEL.
+MODEL_ROUTER = os.getenv('MODEL_ROUTER', 'none')
+MODEL_ROUTER_SMALL_MODEL = os.getenv('MODEL_ROUTER_SMALL_MODEL', 'gpt-4o-mini')
+MODEL_ROUTER_LARGE_MODEL = os.getenv('MODEL_ROUTER_LARGE_MODEL', 'gpt-4o')
+MODEL_ROUTER_MAX_PROMPT_TOKENS = int(os.getenv('MODEL_ROUTER_MAX_PROMPT_TOKENS', '8000'))
+MODEL_ROUTER_MAX_MESSAGE_TOKENS = int(os.getenv('MODEL_ROUTER_MAX_MESSAGE_TOKENS', '60'))
+
+# Client-side OpenAI rate limits (per process), one requests/tokens-per-minute budget per endpoint.
+# 0 disables a budget. Callers expected to wait longer than their priority's deadline (seconds) are rejected.
+LLM_CHAT_RPM = int(os.getenv('LLM_CHAT_RPM', '500'))
+LLM_CHAT_TPM = int(os.getenv('LLM_CHAT_TPM', '300000'))
+LLM_EMBEDDINGS_RPM = int(os.getenv('LLM_EMBEDDINGS_RPM', '3000'))
+LLM_EMBEDDINGS_TPM = int(os.getenv('LLM_EMBEDDINGS_TPM', '1000000'))
+LLM_TRANSCRIPTION_RPM = int(os.getenv('LLM_TRANSCRIPTION_RPM', '50'))
+LLM_INTERACTIVE_DEADLINE = float(os.getenv('LLM_INTERACTIVE_DEADLINE', '10'))
+LLM_BATCH_DEADLINE = float(os.getenv('LLM_BATCH_DEADLINE', '300'))
+
+# RAG vector search
+# Index type ('hnsw' or 'ivfflat') and distance metric ('cosine' or 'l2') of the document embeddings.
+# Both are baked into the index operator class, so run makemigrations/migrate after changing them.
+RAG_VECTOR_INDEX = os.getenv('RAG_VECTOR_INDEX', 'hnsw')
+RAG_DISTANCE_METRIC = os.getenv('RAG_DISTANCE_METRIC', 'cosine')
+RAG_HNSW_M = int(os.getenv('RAG_HNSW_M', '16'))
+RAG_HNSW_EF_CONSTRUCTION = int(os.getenv('RAG_HNSW_EF_CONSTRUCTION', '64'))
+RAG_IVFFLAT_LISTS = int(os.getenv('RAG_IVFFLAT_LISTS', '100'))
+# Query-time recall/latency knobs, applied per query by the retriever
+RAG_HNSW_EF_SEARCH = int(os.getenv('RAG_HNSW_EF_SEARCH', '40'))
+RAG_IVFFLAT_PROBES = int(os.getenv('RAG_IVFFLAT_PROBES', '10'))
+
+# Hybrid retrieval: full-text and vector candidates fused with reciprocal rank.
+# RAG_MAX_DISTANCE is in the units of RAG_DISTANCE_METRIC; empty disables the cut-off.
+RAG_TOP_K = int(os.getenv('RAG_TOP_K', '3'))
+RAG_CANDIDATES = int(os.getenv('RAG_CANDIDATES', '20'))
+RAG_RRF_K = int(os.getenv('RAG_RRF_K', '60'))
+RAG_MAX_DISTANCE = float(os.getenv('RAG_MAX_DISTANCE', '0.6') or 'inf')
+RAG_TEXT_SEARCH_CONFIG = os.getenv('RAG_TEXT_SEARCH_CONFIG', 'english')
+
+# Pre-generated opening messages per language (no LLM call when a conversation starts)
+GREETING_POOL_ENABLED = os.getenv('GREETING_POOL_ENABLED', 'True').lower() == 'true'
+GREETING_POOL_VARIANTS = int(os.getenv('GREETING_POOL_VARIANTS', '3'))
+GREETING_POOL_TTL = int(os.getenv('GREETING_POOL_TTL', '86400'))
+GREETING_POOL_LANGUAGES = [language.strip() for language in os.getenv('GREETING_POOL_LANGUAGES', 'es,en').split(',') if language.strip()]
+
+# Semantic response cache for shallow conversations (opt-in). Answers are reused when prompt, language,
+# RAG context and model match and the user message is at least RESPONSE_CACHE_SIMILARITY cosine-similar.
+RESPONSE_CACHE_ENABLED = os.getenv('RESPONSE_CACHE_ENABLED', 'False').lower() == 'true'
+RESPONSE_CACHE_SIMILARITY = float(os.getenv('RESPONSE_CACHE_SIMILARITY', '0.95'))
+RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', '86400'))
+RESPONSE_CACHE_MAX_USER_TURNS = int(os.getenv('RESPONSE_CACHE_MAX_USER_TURNS', '1'))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '10000'))
+
+# Query embedding cache: in-process LRU plus an optional shared tier stored in Postgres
+# (run `python manage.py createcachetable` once when enabling EMBEDDING_CACHE_SHARED)
+EMBEDDING_CACHE_MAX_SIZE = int(os.getenv('EMBEDDING_CACHE_MAX_SIZE', '2048'))
+EMBEDDING_CACHE_TTL = int(os.getenv('EMBEDDING_CACHE_TTL', '86400'))
+EMBEDDING_CACHE_SHARED = os.getenv('EMBEDDING_CACHE_SHARED', 'False').lower() == 'true'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'embeddings': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'embedding_cache',
+        'TIMEOUT': EMBEDDING_CACHE_TTL,
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('EMBEDDING_CACHE_SHARED_MAX_ENTRIES', '100000'))},
+    },
+}
+
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # Asegurate que esta línea exista
 
 # Archivos estáticos (CSS, JS, imágenes)
@@ -11,6 +11,10 @@ echo "Base de datos lista!"
 # Aplicar migraciones
 echo "Aplicando migraciones..."
 poetry run python manage.py migrate
+poetry run python manage.py createcachetable
+
+# Crear la vista de estadísticas si todavía no existe (el servicio stats la refresca)
+poetry run python manage.py refresh_conversation_stats --if-missing || echo "No se pudo crear la vista de estadísticas"
 
 # Recolectar archivos estáticos
 echo "Recolectando archivos estáticos..."
@@ -31,6 +31,7 @@ class APIClient:
         try:
             response = requests.post(
                 f"{self.base_url}/conversations/{conversation_id}/message",
+                params={"view": "delta"},
                 json={
                     "content": message,
                     "language": self.config.LANGUAGE
@@ -63,6 +64,7 @@ class APIClient:
             
             response = requests.post(
                 f"{self.base_url}/conversations/{conversation_id}/message_audio",
+                params={"view": "delta"},
                 files=files,
                 data=data
             )